@@ -6,12 +6,15 @@ import random
 
 import streamlit as st
 
-from quanthub.analytics import flow_by_minute, kpi_summary, narrative_summary, unusual_scores
-from quanthub.data_access import load_data
+from quanthub.analytics import narrative_summary
+from quanthub.data_access import load_data, ticker_flow
+from quanthub.memo import unusual_scores
 from quanthub.ui import demo_banner, render_kpi_cards, sidebar_controls
 from quanthub.viz_engine import price_flow_overlay
 
 
+MOVER_WINDOWS = {"Session": None, "Last 15m": 15, "Last 60m": 60}
+
 st.set_page_config(page_title="QuantHub · Executive Demo", page_icon="🧠", layout="wide")
 
 controls = sidebar_controls()
@@ -22,6 +25,7 @@ bundle = load_data(
     seed=int(controls["seed"]),
     live_mode=bool(controls["live_mode"]),
     refresh_tick=0,
+    replay=controls["replay"],
 )
 
 trades_df = bundle["trades_df"]
@@ -29,8 +33,14 @@ price_df = bundle["price_df"]
 
 st.title("QuantHub — Options Intelligence Platform")
 st.caption("Executive demo · Real-time feeling with mock data")
-
-kpis = kpi_summary(trades_df)
+feed = bundle.get("feed_stats") or {}
+if "sim_time" in feed:
+    st.caption(
+        f"Replay · tape time {feed['sim_time']:%a %H:%M:%S} · {feed['emitted']} batches · "
+        f"lag {feed['lag_s']:.2f}s · stalled {feed['stalled_s']:.1f}s" + (" · finished" if feed["done"] else "")
+    )
+
+kpis = bundle["kpis"]
 render_kpi_cards(kpis)
 
 st.markdown("---")
@@ -39,23 +49,24 @@ col_left, col_right = st.columns([1.2, 1])
 
 with col_left:
     st.subheader("Intraday Flow vs SPY")
-    flow_df = flow_by_minute(trades_df[trades_df["ticker"] == "SPY"])
+    flow_df = ticker_flow(bundle, "SPY")
     fig = price_flow_overlay(flow_df, price_df, "SPY")
     st.plotly_chart(fig, use_container_width=True)
 
 with col_right:
     st.subheader("What's Moving the Tape")
-    movers = trades_df.sort_values("premium", ascending=False).head(8)
-    for _, row in movers.iterrows():
+    window = st.radio("Window", list(MOVER_WINDOWS), horizontal=True, label_visibility="collapsed")
+    movers = bundle["movers"].top(minutes=MOVER_WINDOWS[window])
+    for row in movers.itertuples(index=False):
         st.markdown(
-            f"**{row['ticker']}** {row['type']} {row['strike']} · "
-            f"${row['premium']/1e6:.2f}M premium · {row['tags'].title()}"
+            f"**{row.ticker}** {row.type} {row.strike} · "
+            f"${row.premium/1e6:.2f}M premium · {row.tags.title()}"
         )
     st.caption("Auto-generated events based on top premium orders.")
 
 st.markdown("---")
 
-scores = unusual_scores(trades_df)
+scores = unusual_scores(trades_df, bundle["baseline_df"])
 top_ticker = scores.iloc[0]["ticker"] if not scores.empty else "SPY"
 flow_trend = flow_df["net_flow"].sum()
 summary = narrative_summary(kpis, top_ticker, flow_trend)
@@ -0,0 +1,182 @@
+"""Scaling benchmarks for QuantHub analytics and mock data generation.
+
+Run from the repo root::
+
+    python benchmarks/bench_analytics.py                      # default sizes
+    python benchmarks/bench_analytics.py --sizes 1400,10000000 --chains small,production
+    python benchmarks/bench_analytics.py --save-baseline      # record benchmarks/baseline.json
+    python benchmarks/bench_analytics.py --compare            # exit 1 on regressions
+    python benchmarks/bench_analytics.py --workers 1,2,4      # sharded per-ticker scaling
+
+Wall time is the best of ``--repeat`` runs; peak memory comes from one extra
+run under ``tracemalloc`` (numpy reports its buffers there) so tracing does
+not distort the timings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quanthub import analytics, sharding  # noqa: E402
+from quanthub.data_mock import (  # noqa: E402
+    TICKERS,
+    generate_chain_df,
+    generate_mock_bundle,
+    generate_trades_df,
+    ticker_universe,
+)
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SIZES = [1_400, 100_000, 1_000_000]
+
+# name -> (tickers, strikes per expiry, expiry ladder in days)
+CHAIN_PRESETS: Dict[str, Tuple[int, int, Tuple[int, ...]]] = {
+    "small": (8, 25, (7, 14, 30, 60)),
+    "medium": (500, 50, (7, 14, 30, 45, 60, 90)),
+    "production": (5_000, 100, (1, 2, 7, 14, 21, 30, 45, 60, 90, 120, 180, 365)),
+}
+
+TAPE_FUNCTIONS: Dict[str, Callable] = {
+    "flow_by_minute": analytics.flow_by_minute,
+    "kpi_summary": analytics.kpi_summary,
+    "top_strikes": analytics.top_strikes,
+    "sweep_heatmap": analytics.sweep_heatmap,
+    "unusual_scores": analytics.unusual_scores,
+}
+
+
+def measure(fn: Callable[[], object], repeat: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(timings), "peak_mb": peak / 1e6}
+
+
+def run(
+    sizes: List[int], chains: List[str], repeat: int, seed: int, workers: List[int] = ()
+) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+
+    def record(name: str, fn: Callable[[], object]) -> None:
+        results[name] = measure(fn, repeat)
+        row = results[name]
+        print(f"{name:<44} {row['seconds'] * 1e3:>11.2f} ms {row['peak_mb']:>10.1f} MB", flush=True)
+
+    record("generate_mock_bundle", lambda: generate_mock_bundle(seed=seed, tickers=TICKERS))
+    for n in sizes:
+        record(f"generate_trades_df[n={n}]", lambda n=n: generate_trades_df(seed, TICKERS, n))
+        trades_df = generate_trades_df(seed, TICKERS, n)
+        for name, fn in TAPE_FUNCTIONS.items():
+            record(f"{name}[n={n}]", lambda fn=fn: fn(trades_df))
+        for count in workers:
+            executor = sharding.ShardedExecutor(workers=count, min_rows=0)
+            executor.map(analytics.flow_by_minute, trades_df.head(1000))  # start the pool outside the timing
+            record(f"flow_by_ticker[n={n},workers={count}]", lambda: sharding.flow_by_ticker(trades_df, executor))
+            executor.shutdown()
+        del trades_df
+
+    for preset in chains:
+        n_tickers, strikes, expiries = CHAIN_PRESETS[preset]
+        tickers = ticker_universe(n_tickers)
+        record(
+            f"generate_chain_df[{preset}]",
+            lambda: generate_chain_df(seed, tickers, strikes_per_expiry=strikes, expiry_days=expiries),
+        )
+        chain_df = generate_chain_df(seed, tickers, strikes_per_expiry=strikes, expiry_days=expiries)
+        first = chain_df[chain_df["ticker"] == tickers[0]]
+        record(f"compute_gex[{preset},one ticker]", lambda: analytics.compute_gex(first))
+        record(f"build_gex_book[{preset}]", lambda: analytics.build_gex_book(chain_df))
+        for count in workers:
+            executor = sharding.ShardedExecutor(workers=count, min_rows=0)
+            executor.map(analytics.compute_gex, first)
+            record(f"gex_by_ticker[{preset},workers={count}]", lambda: sharding.gex_by_ticker(chain_df, executor))
+            executor.shutdown()
+        del chain_df, first
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    regressions = []
+    for name, row in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric in ("seconds", "peak_mb"):
+            limit = reference[metric] * (1 + tolerance)
+            # Ignore noise on sub-millisecond / sub-megabyte measurements.
+            floor = 1e-3 if metric == "seconds" else 1.0
+            if row[metric] > max(limit, reference[metric] + floor):
+                regressions.append(f"{name}: {metric} {row[metric]:.4g} vs baseline {reference[metric]:.4g}")
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(str(n) for n in DEFAULT_SIZES), help="comma-separated tape sizes")
+    parser.add_argument("--chains", default="small,medium", help=f"chain presets: {', '.join(CHAIN_PRESETS)}")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed fractional slowdown / growth")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--json", help="also write results to this path")
+    parser.add_argument("--workers", default="", help="comma-separated worker counts for sharded per-ticker runs")
+    args = parser.parse_args(argv)
+
+    sizes = [int(n) for n in args.sizes.split(",") if n]
+    chains = [c for c in args.chains.split(",") if c]
+    workers = [int(n) for n in args.workers.split(",") if n]
+    results = run(sizes, chains, args.repeat, args.seed, workers)
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as fh:
+                baseline = json.load(fh)
+        baseline.update(results)
+        with open(args.baseline, "w") as fh:
+            json.dump(baseline, fh, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; run with --save-baseline first.")
+            return 2
+        with open(args.baseline) as fh:
+            regressions = compare(results, json.load(fh), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Replay a multi-day tape through the live pipeline and time each refresh.
+
+Run from the repo root::
+
+    python benchmarks/bench_replay.py                                  # Multi-day at max speed
+    python benchmarks/bench_replay.py --scenario "Heavy open" --speed 60x --interval 1
+    python benchmarks/bench_replay.py --scenario "Expiry day" --seconds 30
+
+Each refresh polls the replay into a ``LiveStore`` and runs the work
+``data_access`` does per published snapshot (baselines, movers, KPIs), then
+the per-minute flow the dashboards draw. Per-stage p50/p95 are reported with
+the replay's lag and backpressure stall, so a slow stage shows up as lag.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quanthub import analytics  # noqa: E402
+from quanthub.baselines import PremiumBaselines  # noqa: E402
+from quanthub.live_store import LiveStore  # noqa: E402
+from quanthub.movers import MoversTracker  # noqa: E402
+from quanthub.replay import SCENARIOS, SPEEDS, ReplayConfig, replay_source  # noqa: E402
+
+
+def run(config: ReplayConfig, seed: int, interval: float, seconds: float) -> Dict[str, List[float]]:
+    replay = replay_source(config, seed)
+    store = LiveStore(replay)
+    baselines, movers, kpis = PremiumBaselines(), MoversTracker(), analytics.KpiAccumulator()
+    timings: Dict[str, List[float]] = defaultdict(list)
+
+    def timed(name: str, fn):
+        started = time.perf_counter()
+        result = fn()
+        timings[name].append(time.perf_counter() - started)
+        return result
+
+    deadline = time.monotonic() + seconds if seconds else None
+    while not (replay.done and replay.stats()["pending"] == 0):
+        if deadline is not None and time.monotonic() > deadline:
+            break
+        snapshot = timed("store.refresh", store.refresh)
+        trades_df = snapshot.trades_df
+        timed("baselines.update", lambda: baselines.update(trades_df))
+        timed("movers.update", lambda: movers.update(trades_df, version=snapshot.version))
+        timed("kpis.take", lambda: kpis.take(trades_df, version=snapshot.version))
+        timed("flow_by_minute", lambda: analytics.flow_by_minute(trades_df))
+        timings["rows"].append(len(trades_df))
+        timings["lag_s"].append(replay.lag)
+        if interval:
+            time.sleep(interval)
+    replay.stop()
+    timings["stalled_s"].append(replay.stalled_seconds)
+    return timings
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", default="Multi-day", choices=list(SCENARIOS))
+    parser.add_argument("--speed", default="Max", choices=list(SPEEDS))
+    parser.add_argument("--interval", type=float, default=0.0, help="seconds between refreshes (the consumer's pace)")
+    parser.add_argument("--seconds", type=float, default=0.0, help="stop after this long; 0 replays the whole tape")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    timings = run(ReplayConfig(args.scenario, args.speed), args.seed, args.interval, args.seconds)
+    print(f"{'stage':<20} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}")
+    for name, values in timings.items():
+        if name in ("rows", "lag_s", "stalled_s"):
+            continue
+        ms = np.array(values) * 1e3
+        print(f"{name:<20} {np.percentile(ms, 50):>10.2f} {np.percentile(ms, 95):>10.2f} {ms.max():>10.2f}")
+    print(
+        f"refreshes {len(timings['rows'])} · final rows {timings['rows'][-1] if timings['rows'] else 0} · "
+        f"max lag {max(timings['lag_s'], default=0.0):.2f}s · stalled {timings['stalled_s'][0]:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
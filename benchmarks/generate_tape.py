@@ -0,0 +1,67 @@
+"""Generate a large partitioned mock tape for sizing hardware and load tests.
+
+Run from the repo root::
+
+    python benchmarks/generate_tape.py /data/tape-100m --rows 100000000
+    python benchmarks/generate_tape.py /tmp/tape --rows 5000000 --sessions 3 --format arrow --workers 4
+
+The same ``--seed``, ``--rows``, ``--chunk-rows``, ``--sessions``, ``--end``
+and tickers always produce identical files, whatever ``--workers`` is. The
+output can be replayed with ``QUANTHUB_REPLAY_TAPE=<dir>``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quanthub.data_mock import BASE_PRICE, TICKERS  # noqa: E402
+from quanthub.tape_dataset import CHUNK_ROWS, FORMATS, generate_dataset, read_manifest  # noqa: E402
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out", help="output directory (must not exist or be empty)")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--sessions", type=int, default=1)
+    parser.add_argument("--end", help="last session date, YYYY-MM-DD (default: today)")
+    parser.add_argument("--tickers", default=",".join(TICKERS))
+    parser.add_argument("--format", default="parquet", choices=list(FORMATS))
+    parser.add_argument("--workers", type=int, help="processes (default: QUANTHUB_WORKERS or all cores)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    tickers = [t for t in args.tickers.split(",") if t]
+    unknown = sorted(set(tickers) - set(BASE_PRICE))
+    if unknown:
+        parser.error(f"unknown tickers: {', '.join(unknown)} (choose from {', '.join(BASE_PRICE)})")
+
+    started = time.perf_counter()
+    out = generate_dataset(
+        args.out,
+        args.rows,
+        seed=args.seed,
+        chunk_rows=args.chunk_rows,
+        sessions=args.sessions,
+        end=args.end,
+        tickers=tickers,
+        fmt=args.format,
+        workers=args.workers,
+    )
+    elapsed = time.perf_counter() - started
+    manifest = read_manifest(out)
+    size = sum(os.path.getsize(os.path.join(out, entry["path"])) for entry in manifest["files"])
+    print(
+        f"{args.rows:,} trades in {len(manifest['files'])} files, {size / 1e9:.2f} GB, "
+        f"{elapsed:.1f}s ({args.rows / elapsed / 1e6:.2f}M rows/s) -> {out}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
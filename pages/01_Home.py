@@ -2,8 +2,9 @@
 
 import streamlit as st
 
-from quanthub.analytics import flow_by_minute, kpi_summary, narrative_summary, unusual_scores
-from quanthub.data_access import load_data
+from quanthub.analytics import narrative_summary
+from quanthub.data_access import load_data, ticker_flow
+from quanthub.memo import unusual_scores
 from quanthub.ui import demo_banner, render_kpi_cards, sidebar_controls
 from quanthub.viz_engine import price_flow_overlay
 
@@ -18,6 +19,7 @@ bundle = load_data(
     seed=int(controls["seed"]),
     live_mode=bool(controls["live_mode"]),
     refresh_tick=0,
+    replay=controls["replay"],
 )
 
 trades_df = bundle["trades_df"]
@@ -26,16 +28,16 @@ price_df = bundle["price_df"]
 st.title("QuantHub — Executive Demo")
 st.caption("Investor-ready demo with mock real-time data")
 
-kpis = kpi_summary(trades_df)
+kpis = bundle["kpis"]
 render_kpi_cards(kpis)
 
 st.markdown("---")
 
-flow_df = flow_by_minute(trades_df[trades_df["ticker"] == "SPY"])
+flow_df = ticker_flow(bundle, "SPY")
 fig = price_flow_overlay(flow_df, price_df, "SPY")
 st.plotly_chart(fig, use_container_width=True)
 
-scores = unusual_scores(trades_df)
+scores = unusual_scores(trades_df, bundle["baseline_df"])
 top_ticker = scores.iloc[0]["ticker"] if not scores.empty else "SPY"
 summary = narrative_summary(kpis, top_ticker, flow_df["net_flow"].sum())
 st.info(summary)
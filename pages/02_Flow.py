@@ -1,12 +1,11 @@
 """Options Flow Dashboard."""
 
-from datetime import timedelta
-
 import streamlit as st
 
-from quanthub.analytics import flow_by_minute, sweep_heatmap, top_strikes
 from quanthub.data_access import load_data
-from quanthub.ui import demo_banner, render_table, sidebar_controls
+from quanthub.flow_index import FlowQuery
+from quanthub.memo import flow_by_minute, flow_index, sweep_heatmap, top_strikes
+from quanthub.ui import demo_banner, render_export, render_table, sidebar_controls
 from quanthub.viz_engine import flow_timeseries, sweep_intensity_heatmap, top_strikes_bar
 
 
@@ -20,9 +19,11 @@ bundle = load_data(
     seed=int(controls["seed"]),
     live_mode=bool(controls["live_mode"]),
     refresh_tick=0,
+    replay=controls["replay"],
 )
 
 trades_df = bundle["trades_df"]
+index = flow_index(trades_df)
 
 st.title("Options Flow Dashboard")
 st.caption("Filters + flow analytics · mock real-time feed")
@@ -30,7 +31,7 @@ st.caption("Tip: Sweeps are rapid multi-venue orders; blocks are large single pr
 
 with st.expander("Filters", expanded=True):
     col1, col2, col3, col4, col5, col6 = st.columns(6)
-    tickers = sorted(trades_df["ticker"].unique())
+    tickers = index.tickers
     ticker = col1.selectbox("Ticker", tickers, index=0)
     expiry_range = col2.slider("Expiry range (days)", 1, 90, (7, 45))
     min_premium = col3.number_input("Min premium ($)", value=100000, step=25000)
@@ -38,21 +39,16 @@ with st.expander("Filters", expanded=True):
     option_type = col5.selectbox("Call/Put", ["All", "CALL", "PUT"])
     sentiment = col6.selectbox("Sentiment", ["All", "bullish", "bearish"])
 
-filtered = trades_df[trades_df["ticker"] == ticker]
-filtered = filtered[
-    (filtered["premium"] >= min_premium)
-]
-min_exp = filtered["expiry"].min()
-filtered = filtered[
-    (filtered["expiry"] >= min_exp + timedelta(days=expiry_range[0]))
-    & (filtered["expiry"] <= min_exp + timedelta(days=expiry_range[1]))
-]
-if tag_filter != "All":
-    filtered = filtered[filtered["tags"] == tag_filter]
-if option_type != "All":
-    filtered = filtered[filtered["type"] == option_type]
-if sentiment != "All":
-    filtered = filtered[filtered["sentiment"] == sentiment]
+filtered = index.take(
+    FlowQuery(
+        ticker=ticker,
+        min_premium=min_premium,
+        expiry_days=expiry_range,
+        tag=None if tag_filter == "All" else tag_filter,
+        option_type=None if option_type == "All" else option_type,
+        sentiment=None if sentiment == "All" else sentiment,
+    )
+)
 
 if filtered.empty:
     st.warning("No trades match the current filters. Try loosening thresholds.")
@@ -60,12 +56,7 @@ if filtered.empty:
 
 st.markdown("### Flow Blotter")
 render_table(filtered.head(500))
-st.download_button(
-    "Download CSV",
-    data=filtered.to_csv(index=False),
-    file_name=f"{ticker}_flow.csv",
-    mime="text/csv",
-)
+render_export(filtered, f"{ticker}_flow", key="flow_export")
 
 st.markdown("---")
 
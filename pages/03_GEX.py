@@ -1,11 +1,14 @@
 """Gamma Exposure (GEX) page."""
 
+import math
+
 import streamlit as st
 
-from quanthub.analytics import compute_gex
 from quanthub.data_access import load_data
-from quanthub.ui import demo_banner, sidebar_controls
-from quanthub.viz_engine import gex_by_strike
+from quanthub.greeks import gamma_profile
+from quanthub.memo import gex_book
+from quanthub.ui import demo_banner, render_table, sidebar_controls
+from quanthub.viz_engine import gamma_profile_curve, gex_by_expiry, gex_by_strike
 
 
 st.set_page_config(page_title="QuantHub · GEX", page_icon="🧲", layout="wide")
@@ -18,6 +21,7 @@ bundle = load_data(
     seed=int(controls["seed"]),
     live_mode=bool(controls["live_mode"]),
     refresh_tick=0,
+    replay=controls["replay"],
 )
 
 chain_df = bundle["chain_df"]
@@ -26,11 +30,13 @@ st.title("Gamma Exposure (GEX)")
 st.caption("Dealer positioning, gamma wall, and flip zone")
 st.caption("Gamma wall: strike with max exposure. Flip: where net gamma changes sign.")
 
-tickers = sorted(chain_df["ticker"].unique())
+book = gex_book(chain_df)
+tickers = sorted(book.tickers())
 ticker = st.selectbox("Ticker", tickers, index=0)
 
-gex = compute_gex(chain_df[chain_df["ticker"] == ticker])
-fig = gex_by_strike(gex.gex_by_strike)
+gex = book.for_ticker(ticker)
+by_expiry = st.toggle("Break down by expiry", value=False)
+fig = gex_by_expiry(book.expiry_breakdown(ticker)) if by_expiry else gex_by_strike(gex.gex_by_strike)
 st.plotly_chart(fig, use_container_width=True)
 
 col1, col2, col3 = st.columns(3)
@@ -42,3 +48,19 @@ st.info(
     f"Dealer gamma is concentrated near {gex.gamma_wall:.1f}. "
     f"Flip zone appears around {gex.gamma_flip:.1f}, suggesting directional sensitivity."
 )
+
+st.markdown("---")
+st.subheader("Gamma Profile (Black-Scholes)")
+st.caption("Model gamma re-evaluated at hypothetical spot levels; flip is where total GEX crosses zero.")
+profile = gamma_profile(chain_df[chain_df["ticker"] == ticker])
+model_flip = profile.flip(ticker)
+st.plotly_chart(
+    gamma_profile_curve(profile.for_ticker(ticker), float(profile.flips["spot"].iloc[0]), model_flip),
+    use_container_width=True,
+)
+if not math.isnan(model_flip):
+    st.caption(f"Model zero-gamma level: {model_flip:.1f}")
+
+st.markdown("---")
+st.subheader("Market GEX Leaderboard")
+render_table(book.leaderboard(20), height=320)
@@ -2,8 +2,8 @@
 
 import streamlit as st
 
-from quanthub.analytics import unusual_scores
 from quanthub.data_access import load_data
+from quanthub.memo import top_prints, unusual_scores
 from quanthub.ui import demo_banner, render_table, sidebar_controls
 from quanthub.viz_engine import unusual_scores_bar
 
@@ -18,23 +18,28 @@ bundle = load_data(
     seed=int(controls["seed"]),
     live_mode=bool(controls["live_mode"]),
     refresh_tick=0,
+    replay=controls["replay"],
 )
 
 trades_df = bundle["trades_df"]
 
 st.title("Unusual Activity Scanner")
-st.caption("Ranked tickers with z-score boosted unusual flow")
+st.caption("Ranked tickers with z-score boosted unusual flow against multi-day per-ticker baselines")
 
-scores_df = unusual_scores(trades_df)
+scores_df = unusual_scores(trades_df, bundle["baseline_df"])
 st.plotly_chart(unusual_scores_bar(scores_df.head(12)), use_container_width=True)
 
 col1, col2 = st.columns([1, 1.6])
 with col1:
     st.subheader("Scanner Rankings")
     render_table(scores_df.head(20), height=420)
+    with st.expander("Premium baselines"):
+        render_table(bundle["baseline_df"].reset_index(), height=240)
 
 with col2:
     st.subheader("Ticker Detail")
     selected = st.selectbox("Select ticker", scores_df["ticker"].tolist(), index=0)
-    details = trades_df[trades_df["ticker"] == selected].sort_values("premium", ascending=False)
-    render_table(details.head(50), height=420)
+    # Top prints for every ticker are ranked once per snapshot (sharded on large
+    # tapes), so switching tickers is a lookup.
+    details = top_prints(trades_df, n=50)
+    render_table(details[details["ticker"] == selected], height=420)
@@ -2,9 +2,11 @@
 
 import streamlit as st
 
-from quanthub.analytics import kpi_summary
+from quanthub.alerts import RULE_KINDS, WINDOWS, AlertEngine, AlertRule
 from quanthub.data_access import load_data
-from quanthub.ui import demo_banner, sidebar_controls
+from quanthub.data_mock import TICKERS
+from quanthub.memo import gex_book
+from quanthub.ui import demo_banner, render_table, sidebar_controls
 
 
 st.set_page_config(page_title="QuantHub · Alerts", page_icon="🔔", layout="wide")
@@ -17,29 +19,41 @@ bundle = load_data(
     seed=int(controls["seed"]),
     live_mode=bool(controls["live_mode"]),
     refresh_tick=0,
+    replay=controls["replay"],
 )
 
 trades_df = bundle["trades_df"]
-kpis = kpi_summary(trades_df)
 
 if "alert_rules" not in st.session_state:
     st.session_state.alert_rules = []
-if "alert_log" not in st.session_state:
-    st.session_state.alert_log = []
+
+# One engine per data stream: its cursor assumes a single, growing tape. A new
+# replay config or a restarted worker is a new stream that starts from the open.
+engine_key = bundle["stream"]
+if st.session_state.get("alert_engine_key") != engine_key:
+    st.session_state.alert_engine = AlertEngine()
+    st.session_state.alert_engine_key = engine_key
+engine = st.session_state.alert_engine
 
 st.title("Alerts (Demo)")
-st.caption("Create rules and simulate triggers in mock mode")
+st.caption("Create rules evaluated over sliding windows as trades arrive")
 
 with st.form("alert_form"):
-    col1, col2, col3 = st.columns(3)
-    rule_type = col1.selectbox("Rule Type", ["Call premium >", "Sweep count >", "GEX flip proximity"])
-    threshold = col2.number_input("Threshold", min_value=1, value=250000)
-    window = col3.selectbox("Window", ["5m", "15m", "60m"])
+    col1, col2, col3, col4 = st.columns(4)
+    rule_type = col1.selectbox("Rule Type", list(RULE_KINDS))
+    threshold = col2.number_input(
+        "Threshold",
+        min_value=1,
+        value=250000,
+        help="Premium in $, sweep count, or distance from the gamma flip in bps.",
+    )
+    window = col3.selectbox("Window", list(WINDOWS))
+    ticker = col4.selectbox("Ticker", ["All"] + TICKERS)
     submitted = st.form_submit_button("Add Alert Rule")
 
 if submitted:
     st.session_state.alert_rules.append(
-        {"rule": rule_type, "threshold": threshold, "window": window}
+        {"rule": rule_type, "threshold": threshold, "window": window, "ticker": ticker}
     )
     st.success("Alert rule added.")
 
@@ -53,25 +67,18 @@ else:
 st.markdown("---")
 st.subheader("Live Alert Feed")
 
-# Simulate triggers
-triggers = []
-if kpis["total_flow"] > 5e8:
-    triggers.append("High flow detected")
-if kpis["call_put_ratio"] > 1.8:
-    triggers.append("Call-heavy imbalance")
-if kpis["unusual_count"] > 120:
-    triggers.append("Unusual activity spike")
-
-for trigger in triggers:
-    st.session_state.alert_log.append(
-        {"timestamp": controls["last_updated"], "message": trigger}
-    )
+summary = gex_book(bundle["chain_df"]).summary
+engine.set_rules(AlertRule.from_dict(rule) for rule in st.session_state.alert_rules)
+new_alerts = engine.update(trades_df, flips=dict(zip(summary["ticker"].astype(str), summary["gamma_flip"])))
+
+for alert in new_alerts[-3:]:
     try:
-        st.toast(trigger)
+        st.toast(alert.message)
     except Exception:
         pass
 
-if st.session_state.alert_log:
-    st.table(st.session_state.alert_log[-10:])
+if engine.log:
+    st.caption(f"{len(new_alerts)} new alert(s) this refresh · showing the latest {len(engine.log)}")
+    render_table(engine.log_frame(), height=360)
 else:
     st.info("No alerts triggered yet.")
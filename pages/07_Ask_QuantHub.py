@@ -2,9 +2,9 @@
 
 import streamlit as st
 
-from quanthub.chatbot import handle_chat
+from quanthub.chatbot import handle_chat, llm_stats
 from quanthub.data_access import load_data
-from quanthub.ui import demo_banner, render_table, sidebar_controls
+from quanthub.ui import demo_banner, render_export, render_table, sidebar_controls
 
 
 st.set_page_config(page_title="QuantHub · Ask QuantHub", page_icon="🤖", layout="wide")
@@ -17,6 +17,7 @@ bundle = load_data(
     seed=int(controls["seed"]),
     live_mode=bool(controls["live_mode"]),
     refresh_tick=0,
+    replay=controls["replay"],
 )
 
 if "chat_history" not in st.session_state:
@@ -49,6 +50,7 @@ with left:
             st.session_state.context,
             llm_enabled=llm_enabled,
             llm_key=st.secrets.get("OPENAI_API_KEY") if llm_enabled else None,
+            llm_base_url=st.secrets.get("OPENAI_BASE_URL") or None,
         )
         st.session_state.context = context
         st.session_state.chat_history.append({"role": "assistant", "content": response.text})
@@ -60,6 +62,13 @@ with left:
         with st.chat_message("assistant"):
             st.markdown(response.text)
 
+    if llm_enabled and st.secrets.get("OPENAI_API_KEY"):
+        stats = llm_stats(st.secrets["OPENAI_API_KEY"], st.secrets.get("OPENAI_BASE_URL") or None)
+        st.caption(
+            f"LLM routing · cache hit rate {stats['hit_rate']:.0%} over {stats['requests']} requests "
+            f"· {stats['timeout']} timeouts fell back to rules"
+        )
+
     st.markdown("#### Suggested Prompts")
     st.write("• set ticker=SPY")
     st.write("• flow summary for SPY")
@@ -77,9 +86,4 @@ with right:
 
     if st.session_state.workspace["table"] is not None:
         render_table(st.session_state.workspace["table"].head(50), height=320)
-        st.download_button(
-            "Download CSV",
-            data=st.session_state.workspace["table"].to_csv(index=False),
-            file_name="quanthub_export.csv",
-            mime="text/csv",
-        )
+        render_export(st.session_state.workspace["table"], "quanthub_export", key="workspace_export")
@@ -0,0 +1,252 @@
+"""Sliding-window alert rules evaluated incrementally for QuantHub demo."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .tape import TapeCursor
+
+
+RULE_KINDS = ("Call premium >", "Sweep count >", "GEX flip proximity")
+WINDOWS = {"5m": 5, "15m": 15, "60m": 60}
+
+# Metric channels: windowed call premium, windowed sweep count, and the
+# distance of the latest underlying print from the gamma flip in bps.
+_CALL_PREMIUM, _SWEEPS, _FLIP_BPS = range(3)
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    kind: str
+    threshold: float
+    window: str = "5m"
+    ticker: Optional[str] = None  # None applies the rule to every ticker
+
+    @classmethod
+    def from_dict(cls, rule: Mapping[str, object]) -> "AlertRule":
+        ticker = rule.get("ticker")
+        return cls(
+            kind=str(rule["rule"]),
+            threshold=float(rule["threshold"]),
+            window=str(rule.get("window", "5m")),
+            ticker=None if ticker in (None, "", "All") else str(ticker),
+        )
+
+    @property
+    def metric(self) -> int:
+        if self.kind not in RULE_KINDS:
+            raise ValueError(f"Unknown alert rule: {self.kind}")
+        return RULE_KINDS.index(self.kind)
+
+    @property
+    def minutes(self) -> int:
+        return WINDOWS[self.window]
+
+
+@dataclass(frozen=True)
+class Alert:
+    timestamp: pd.Timestamp
+    ticker: str
+    rule: AlertRule
+    value: float
+
+    @property
+    def message(self) -> str:
+        if self.rule.metric == _FLIP_BPS:
+            return f"{self.ticker} within {self.value:.0f} bps of gamma flip"
+        if self.rule.metric == _SWEEPS:
+            return f"{self.ticker} {self.value:.0f} sweeps in {self.rule.window}"
+        return f"{self.ticker} ${self.value / 1e6:.2f}M call premium in {self.rule.window}"
+
+    def as_row(self) -> Dict[str, object]:
+        return {
+            "timestamp": self.timestamp,
+            "ticker": self.ticker,
+            "rule": f"{self.rule.kind} {self.rule.threshold:g} ({self.rule.window})",
+            "value": self.value,
+            "message": self.message,
+        }
+
+
+class AlertEngine:
+    """Evaluates every (rule, ticker) pair as minute bins fill in.
+
+    Trades are folded into per-ticker minute bins once (via a ``TapeCursor``),
+    windowed sums come from a cumulative sum over the bins, and all pairs are
+    checked for every new minute in one array expression. A pair alerts when
+    its condition turns true and re-arms once it turns false again; the
+    latest, still-filling minute is re-checked on the next update without
+    alerting twice. Rules added later are replayed over the retained history.
+    """
+
+    def __init__(self, history_minutes: int = 24 * 60, max_log: int = 500) -> None:
+        self.history_minutes = history_minutes
+        self.cursor = TapeCursor()
+        self.log: Deque[Alert] = deque(maxlen=max_log)
+        self._rules: Tuple[AlertRule, ...] = ()
+        self._tickers: Dict[str, int] = {}
+        self._origin: Optional[int] = None
+        self._latest: Optional[int] = None
+        self._resume: Optional[int] = None
+        self._bins = np.zeros((2, 0, 0))
+        self._spot = np.full((0, 0), np.nan)
+        self._flips = np.full(0, np.nan)
+        # (rule, ticker) -> (active on the minute before the resume point, last minute alerted)
+        self._pairs: Dict[Tuple[AlertRule, str], Tuple[bool, int]] = {}
+
+    def set_rules(self, rules: Iterable[AlertRule]) -> None:
+        self._rules = tuple(dict.fromkeys(rules))
+        live = set(self._rules)
+        self._pairs = {key: state for key, state in self._pairs.items() if key[0] in live}
+
+    def set_flips(self, flips: Mapping[str, float]) -> None:
+        self._ensure_tickers(list(flips))
+        for ticker, level in flips.items():
+            self._flips[self._tickers[ticker]] = level
+
+    def update(self, trades_df: pd.DataFrame, flips: Optional[Mapping[str, float]] = None) -> List[Alert]:
+        """Fold in unseen trades, evaluate through the latest minute and return new alerts."""
+        if flips:
+            self.set_flips(flips)
+        batch = self.cursor.take(trades_df)
+        if not batch.empty:
+            self._ingest(batch)
+        alerts = self._evaluate()
+        self.log.extend(alerts)
+        return alerts
+
+    def log_frame(self) -> pd.DataFrame:
+        rows = [alert.as_row() for alert in reversed(self.log)]
+        return pd.DataFrame(rows, columns=["timestamp", "ticker", "rule", "value", "message"])
+
+    def _ensure_tickers(self, tickers: Iterable[str]) -> None:
+        for ticker in tickers:
+            if ticker not in self._tickers:
+                self._tickers[ticker] = len(self._tickers)
+        missing = len(self._tickers) - self._bins.shape[1]
+        if missing:
+            width = self._bins.shape[2]
+            self._bins = np.concatenate([self._bins, np.zeros((2, missing, width))], axis=1)
+            self._spot = np.vstack([self._spot, np.full((missing, width), np.nan)])
+            self._flips = np.r_[self._flips, np.full(missing, np.nan)]
+
+    def _ingest(self, batch: pd.DataFrame) -> None:
+        minutes = batch["timestamp"].to_numpy().astype("datetime64[m]").astype(np.int64)
+        codes, uniques = pd.factorize(batch["ticker"])
+        self._ensure_tickers(str(t) for t in uniques)
+        rows = np.array([self._tickers[str(t)] for t in uniques], dtype=np.int64)[codes]
+
+        if self._origin is None:
+            self._origin = int(minutes[0])
+        self._latest = max(self._latest if self._latest is not None else int(minutes[-1]), int(minutes[-1]))
+        self._grow(self._latest - self._origin + 1)
+
+        cols = minutes - self._origin
+        keep = cols >= 0  # older than the retained history
+        rows, cols, batch = rows[keep], cols[keep], batch[keep]
+        premium = batch["premium"].to_numpy(dtype=float)
+        calls = (batch["type"] == "CALL").to_numpy()
+        sweeps = (batch["tags"] == "sweep").to_numpy()
+        np.add.at(self._bins[_CALL_PREMIUM], (rows[calls], cols[calls]), premium[calls])
+        np.add.at(self._bins[_SWEEPS], (rows[sweeps], cols[sweeps]), 1.0)
+
+        # Last underlying print per ticker-minute (the batch is in time order).
+        cell = rows * self._spot.shape[1] + cols
+        _, first_from_end = np.unique(cell[::-1], return_index=True)
+        last = len(cell) - 1 - first_from_end
+        self._spot[rows[last], cols[last]] = batch["price"].to_numpy(dtype=float)[last]
+        self._trim()
+
+    def _grow(self, width: int) -> None:
+        extra = width - self._bins.shape[2]
+        if extra > 0:
+            n = self._bins.shape[1]
+            self._bins = np.concatenate([self._bins, np.zeros((2, n, extra))], axis=2)
+            self._spot = np.hstack([self._spot, np.full((n, extra), np.nan)])
+
+    def _trim(self) -> None:
+        drop = self._bins.shape[2] - self.history_minutes
+        if drop > 0:
+            self._bins = self._bins[:, :, drop:].copy()
+            self._spot = self._spot[:, drop:].copy()
+            self._origin += drop
+
+    def _compile(self) -> Tuple[List[Tuple[AlertRule, str]], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        keys = []
+        for rule in self._rules:
+            tickers = list(self._tickers) if rule.ticker is None else [rule.ticker]
+            keys.extend((rule, ticker) for ticker in tickers if ticker in self._tickers)
+        metric = np.array([rule.metric for rule, _ in keys], dtype=np.int64)
+        rows = np.array([self._tickers[ticker] for _, ticker in keys], dtype=np.int64)
+        window = np.array([rule.minutes for rule, _ in keys], dtype=np.int64)
+        threshold = np.array([rule.threshold for rule, _ in keys], dtype=float)
+        return keys, metric, rows, window, threshold
+
+    def _evaluate(self) -> List[Alert]:
+        if self._latest is None or not self._rules:
+            return []
+        keys, metric, rows, window, threshold = self._compile()
+        if not keys:
+            return []
+
+        latest = self._latest - self._origin
+        resume = 0 if self._resume is None else min(max(self._resume - self._origin, 0), latest)
+        fresh = np.array([key not in self._pairs for key in keys])
+        prior = np.array([self._pairs.get(key, (False, -1))[0] for key in keys])
+        fired = np.array([self._pairs.get(key, (False, -1))[1] for key in keys], dtype=np.int64)
+
+        start = 0 if fresh.any() else resume
+        cols = np.arange(start, latest + 1)
+        base = max(start - int(window.max()), 0)
+        cumulative = np.zeros((2, self._bins.shape[1], latest + 2 - base))
+        np.cumsum(self._bins[:, :, base : latest + 1], axis=2, out=cumulative[:, :, 1:])
+
+        hi = (cols + 1 - base)[None, :]
+        lo = np.maximum(cols[None, :] + 1 - window[:, None], base) - base
+        channel = np.minimum(metric, _SWEEPS)[:, None]
+        values = cumulative[channel, rows[:, None], hi] - cumulative[channel, rows[:, None], lo]
+
+        is_flip = metric == _FLIP_BPS
+        if is_flip.any():
+            spot = _ffill(self._spot[:, : latest + 1])[:, cols]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                bps = np.abs(spot - self._flips[:, None]) / self._flips[:, None] * 1e4
+            values[is_flip] = bps[rows[is_flip]]
+            active = np.where(is_flip[:, None], values < threshold[:, None], values > threshold[:, None])
+        else:
+            active = values > threshold[:, None]
+
+        # Minutes already evaluated for a pair keep its saved state, so only
+        # genuinely new crossings can alert.
+        evaluated = cols[None, :] < np.where(fresh, 0, resume)[:, None]
+        active = np.where(evaluated, prior[:, None], active)
+        previous = np.hstack([prior[:, None], active[:, :-1]])
+        minute = self._origin + cols
+        edges = active & ~previous & (minute[None, :] > fired[:, None])
+
+        alerts = []
+        pair_idx, col_idx = np.nonzero(edges)
+        for p, c in sorted(zip(pair_idx.tolist(), col_idx.tolist()), key=lambda pc: pc[1]):
+            rule, ticker = keys[p]
+            stamp = pd.Timestamp(np.datetime64(int(minute[c]), "m"))
+            alerts.append(Alert(timestamp=stamp, ticker=ticker, rule=rule, value=float(values[p, c])))
+            fired[p] = max(fired[p], int(minute[c]))
+
+        # Resume at the latest minute next time: it may still be filling.
+        before = active[:, -2] if len(cols) > 1 else prior
+        self._pairs = {key: (bool(before[i]), int(fired[i])) for i, key in enumerate(keys)}
+        self._resume = self._latest
+        return alerts
+
+
+def _ffill(values: np.ndarray) -> np.ndarray:
+    if values.size == 0:
+        return values
+    idx = np.where(np.isnan(values), 0, np.arange(values.shape[1])[None, :])
+    np.maximum.accumulate(idx, axis=1, out=idx)
+    return values[np.arange(values.shape[0])[:, None], idx]
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from .sketch import DEFAULT_K as DEFAULT_SKETCH_K
+from .sketch import QuantileSketch
+from .tape import TapeCursor
+
 
 @dataclass
 class GexSummary:
@@ -17,45 +22,187 @@ class GexSummary:
     total_gex: float
 
 
+class FlowAccumulator:
+    """Per-minute CALL/PUT premium buckets updated in place from trade batches.
+
+    Each ``update`` costs O(batch); ``frame`` materializes the same shape as
+    ``flow_by_minute`` (minute, CALL, PUT, net_flow) from the resident buckets.
+    """
+
+    _COLUMNS = ("CALL", "PUT")
+
+    def __init__(self, capacity: int = 512) -> None:
+        self._slots: Dict[pd.Timestamp, int] = {}
+        self._minutes: List[pd.Timestamp] = []
+        self._premium = np.zeros((capacity, len(self._COLUMNS)))
+        self.rows_seen = 0
+
+    def __len__(self) -> int:
+        return len(self._minutes)
+
+    def reset(self) -> None:
+        self._slots.clear()
+        self._minutes.clear()
+        self._premium[:] = 0
+        self.rows_seen = 0
+
+    def update(self, trades_df: pd.DataFrame) -> "FlowAccumulator":
+        if trades_df.empty:
+            return self
+        option_type = trades_df["type"].to_numpy()
+        column = np.full(len(trades_df), -1)
+        for idx, name in enumerate(self._COLUMNS):
+            column[option_type == name] = idx
+        codes, minutes = pd.factorize(trades_df["timestamp"].dt.floor("1min"))
+        slot_of_code = np.array([self._slot(minute) for minute in minutes], dtype=np.int64)
+        # NaT timestamps factorize to -1; like the groupby they replace, skip those rows.
+        keep = (column >= 0) & (codes >= 0)
+
+        np.add.at(
+            self._premium,
+            (slot_of_code[codes[keep]], column[keep]),
+            np.nan_to_num(trades_df["premium"].to_numpy(dtype=float)[keep]),
+        )
+        self.rows_seen += len(trades_df)
+        return self
+
+    def frame(self) -> pd.DataFrame:
+        minutes = pd.DatetimeIndex(self._minutes)
+        order = minutes.argsort()
+        premium = self._premium[: len(minutes)][order]
+        flow = pd.DataFrame(
+            {
+                "minute": minutes[order],
+                "CALL": premium[:, 0],
+                "PUT": premium[:, 1],
+            }
+        )
+        flow["net_flow"] = flow["CALL"] - flow["PUT"]
+        return flow
+
+    def _slot(self, minute: pd.Timestamp) -> int:
+        slot = self._slots.get(minute)
+        if slot is None:
+            slot = len(self._minutes)
+            if slot == len(self._premium):
+                grown = np.zeros((max(2 * slot, 1), len(self._COLUMNS)))
+                grown[:slot] = self._premium
+                self._premium = grown
+            self._slots[minute] = slot
+            self._minutes.append(minute)
+        return slot
+
+
 def flow_by_minute(trades_df: pd.DataFrame) -> pd.DataFrame:
-    df = trades_df.copy()
-    df["minute"] = df["timestamp"].dt.floor("1min")
-    flow = (
-        df.groupby(["minute", "type"])["premium"]
-        .sum()
-        .reset_index()
-        .pivot(index="minute", columns="type", values="premium")
-        .fillna(0)
-        .reset_index()
-    )
-    flow["net_flow"] = flow.get("CALL", 0) - flow.get("PUT", 0)
-    return flow
+    return FlowAccumulator().update(trades_df).frame()
 
 
-def kpi_summary(trades_df: pd.DataFrame) -> Dict[str, float]:
-    total_flow = trades_df["premium"].sum()
-    call_premium = trades_df.loc[trades_df["type"] == "CALL", "premium"].sum()
-    put_premium = trades_df.loc[trades_df["type"] == "PUT", "premium"].sum()
-    call_put_ratio = call_premium / max(put_premium, 1)
+UNUSUAL_QUANTILE = 0.93
+
+
+class KpiAccumulator:
+    """Running headline KPIs: premium and greek sums plus a premium quantile sketch.
+
+    ``update`` folds a batch in with one fused pass over its columns (type and
+    side come in as category codes, so there are no string masks). Counts
+    and sums add and the sketch merges, so per-batch or per-shard
+    accumulators ``merge`` into the figures for the whole tape. ``take``
+    folds in only prints past ``cursor``, for a tape that grows between calls.
+    """
+
+    def __init__(self, sketch_k: int = DEFAULT_SKETCH_K) -> None:
+        self.count = 0
+        self.premium = np.zeros(3)  # missing type, CALL, PUT
+        self.net_delta = 0.0
+        self.net_gamma = 0.0
+        self.sketch = QuantileSketch(sketch_k)
+        self.cursor = TapeCursor()
+        self.version: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, object]:
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def update(self, trades_df: pd.DataFrame) -> "KpiAccumulator":
+        if trades_df.empty:
+            return self
+        premium = trades_df["premium"].to_numpy(dtype=float)
+        option_type = _category_codes(trades_df["type"], ("CALL", "PUT"))
+        self.premium += np.bincount(option_type, weights=premium, minlength=3)
+
+        # Contracts signed by side: +100 per bought contract, -100 per sold.
+        multiplier = np.array([100.0, 100.0, -100.0])[_category_codes(trades_df["side"], ("BUY", "SELL"))]
+        signed = multiplier * trades_df["size"].to_numpy(dtype=float)
+        self.net_delta += float(np.dot(trades_df["delta"].to_numpy(dtype=float), signed))
+        self.net_gamma += float(np.dot(trades_df["gamma"].to_numpy(dtype=float), signed))
+
+        self.sketch.update(premium)
+        self.count += len(trades_df)
+        return self
+
+    def take(self, trades_df: pd.DataFrame, version: Optional[str] = None) -> int:
+        """Fold in prints past the cursor; a repeated ``version`` is skipped. Returns rows used."""
+        with self._lock:
+            if version is not None and version == self.version:
+                return 0
+            self.version = version
+            batch = self.cursor.take(trades_df)
+            self.update(batch)
+        return len(batch)
+
+    def merge(self, other: "KpiAccumulator") -> "KpiAccumulator":
+        self.count += other.count
+        self.premium += other.premium
+        self.net_delta += other.net_delta
+        self.net_gamma += other.net_gamma
+        self.sketch.merge(other.sketch)
+        return self
+
+    def summary(self, unusual_quantile: float = UNUSUAL_QUANTILE) -> Dict[str, float]:
+        threshold = self.sketch.quantile(unusual_quantile)
+        return {
+            "total_flow": float(self.premium.sum()),
+            "call_put_ratio": float(self.premium[1] / max(self.premium[2], 1)),
+            "net_delta": self.net_delta,
+            "net_gamma": self.net_gamma,
+            "unusual_count": int(round(self.count - self.sketch.rank(threshold))) if self.count else 0,
+        }
+
+
+def _category_codes(values: pd.Series, categories: Tuple[str, ...]) -> np.ndarray:
+    """Position of each value in ``categories`` plus one; 0 marks anything else."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        lookup = np.array([categories.index(c) + 1 if c in categories else 0 for c in values.cat.categories] + [0])
+        return lookup[values.cat.codes.to_numpy()]  # code -1 (missing) hits the trailing 0
+    codes = np.zeros(len(values), dtype=np.intp)
+    for idx, name in enumerate(categories):
+        codes[values.to_numpy() == name] = idx + 1
+    return codes
+
+
+def kpi_accumulator(trades_df: pd.DataFrame) -> KpiAccumulator:
+    return KpiAccumulator().update(trades_df)
 
-    side_mult = trades_df["side"].map({"BUY": 1, "SELL": -1}).fillna(1)
-    net_delta = (trades_df["delta"] * trades_df["size"] * 100 * side_mult).sum()
-    net_gamma = (trades_df["gamma"] * trades_df["size"] * 100 * side_mult).sum()
 
-    unusual_count = int((trades_df["premium"] > trades_df["premium"].quantile(0.93)).sum())
+def kpi_summary(trades_df: pd.DataFrame) -> Dict[str, float]:
+    return kpi_accumulator(trades_df).summary()
+
 
-    return {
-        "total_flow": float(total_flow),
-        "call_put_ratio": float(call_put_ratio),
-        "net_delta": float(net_delta),
-        "net_gamma": float(net_gamma),
-        "unusual_count": unusual_count,
-    }
+def top_prints(trades_df: pd.DataFrame, n: int = 50) -> pd.DataFrame:
+    """The ``n`` largest prints of every ticker, largest first."""
+    ranked = trades_df.sort_values("premium", ascending=False, kind="stable")
+    return ranked.groupby("ticker", observed=True, sort=False).head(n)
 
 
 def top_strikes(trades_df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
     return (
-        trades_df.groupby("strike")["premium"]
+        trades_df.groupby("strike", observed=True)["premium"]
         .sum()
         .sort_values(ascending=False)
         .head(n)
@@ -63,24 +210,107 @@ def top_strikes(trades_df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
     )
 
 
-def sweep_heatmap(trades_df: pd.DataFrame) -> pd.DataFrame:
-    df = trades_df[trades_df["tags"] == "sweep"].copy()
-    df["minute"] = df["timestamp"].dt.floor("5min")
-    heat = (
-        df.groupby(["minute", "ticker"])["premium"]
-        .sum()
-        .reset_index()
-        .pivot(index="ticker", columns="minute", values="premium")
-        .fillna(0)
-    )
-    return heat
+class SweepGrid:
+    """Sweep premium binned into a preallocated ticker x time-bin array.
+
+    The time axis covers the full session at ``bin_minutes`` resolution and is
+    extended forward if prints arrive after the close; unseen tickers add rows.
+    ``update`` costs O(batch).
+    """
+
+    def __init__(
+        self,
+        tickers: List[str],
+        session_start: pd.Timestamp,
+        session_end: pd.Timestamp,
+        bin_minutes: int = 5,
+    ) -> None:
+        self.tickers = [str(t) for t in tickers]
+        self.start = pd.Timestamp(session_start)
+        self.width = pd.Timedelta(minutes=bin_minutes)
+        n_bins = max(int(np.ceil((pd.Timestamp(session_end) - self.start) / self.width)), 1)
+        self.values = np.zeros((len(self.tickers), n_bins))
+        self._row = {t: i for i, t in enumerate(self.tickers)}
+
+    @classmethod
+    def for_session(
+        cls,
+        trades_df: pd.DataFrame,
+        bin_minutes: int = 5,
+        session_open: str = "09:30",
+        session_close: str = "16:00",
+    ) -> "SweepGrid":
+        ticker = trades_df["ticker"]
+        if isinstance(ticker.dtype, pd.CategoricalDtype):
+            codes = ticker.cat.codes.to_numpy()
+            present = np.bincount(codes[codes >= 0], minlength=len(ticker.cat.categories)) > 0
+            tickers = list(ticker.cat.categories[present])
+        else:
+            tickers = sorted(ticker.unique())
+        day = trades_df["timestamp"].min().normalize() if not trades_df.empty else pd.Timestamp.now().normalize()
+        return cls(
+            tickers,
+            day + pd.Timedelta(session_open + ":00"),
+            day + pd.Timedelta(session_close + ":00"),
+            bin_minutes=bin_minutes,
+        )
+
+    @property
+    def bins(self) -> pd.DatetimeIndex:
+        return pd.date_range(self.start, periods=self.values.shape[1], freq=self.width, name="minute")
 
+    def update(self, trades_df: pd.DataFrame) -> "SweepGrid":
+        sweeps = trades_df[trades_df["tags"] == "sweep"]
+        if sweeps.empty:
+            return self
+        col = ((sweeps["timestamp"] - self.start) // self.width).to_numpy(dtype=np.int64)
+        codes, names = pd.factorize(sweeps["ticker"].astype(str))
+        for name in names:
+            if name not in self._row:
+                self._row[name] = len(self.tickers)
+                self.tickers.append(name)
+        row = np.array([self._row[name] for name in names], dtype=np.int64)[codes]
 
-def unusual_scores(trades_df: pd.DataFrame) -> pd.DataFrame:
+        keep = col >= 0
+        needed = (len(self.tickers), max(int(col.max()) + 1, self.values.shape[1]))
+        if needed != self.values.shape:
+            grown = np.zeros(needed)
+            grown[: self.values.shape[0], : self.values.shape[1]] = self.values
+            self.values = grown
+        np.add.at(self.values, (row[keep], col[keep]), sweeps["premium"].to_numpy(dtype=float)[keep])
+        return self
+
+    def frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.values, index=pd.Index(self.tickers, name="ticker"), columns=self.bins)
+
+
+def sweep_heatmap(trades_df: pd.DataFrame, bin_minutes: int = 5) -> pd.DataFrame:
+    return SweepGrid.for_session(trades_df, bin_minutes=bin_minutes).update(trades_df).frame()
+
+
+def unusual_scores(
+    trades_df: pd.DataFrame, baseline_df: Optional[pd.DataFrame] = None, min_history: int = 50
+) -> pd.DataFrame:
+    """Rank tickers by boosted premium z-score.
+
+    With ``baseline_df`` (see ``baselines.PremiumBaselines.frame``), tickers
+    with at least ``min_history`` trades are scored against their own
+    multi-day EW mean/std; the rest fall back to today's tape.
+    """
     df = trades_df.copy()
-    baseline = df.groupby("ticker")["premium"].mean().rename("baseline")
+    baseline = df.groupby("ticker", observed=True)["premium"].mean().rename("baseline")
     df = df.join(baseline, on="ticker")
-    df["z_score"] = (df["premium"] - df["baseline"]) / df["premium"].std()
+    scale = np.full(len(df), df["premium"].std())
+    if baseline_df is not None and not baseline_df.empty:
+        known = baseline_df[(baseline_df["count"] >= min_history) & (baseline_df["ewm_std"] > 0)]
+        codes, uniques = pd.factorize(df["ticker"])
+        pos = known.index.get_indexer(pd.Index(uniques).astype(str))[codes]
+        has = (codes >= 0) & (pos >= 0)
+        pos = np.where(has, pos, 0)
+        if len(known):
+            df["baseline"] = np.where(has, known["ewm_mean"].to_numpy()[pos], df["baseline"])
+            scale = np.where(has, known["ewm_std"].to_numpy()[pos], scale)
+    df["z_score"] = (df["premium"] - df["baseline"]) / scale
 
     df["near_term_boost"] = (df["expiry"] <= df["expiry"].min() + pd.Timedelta(days=7)).astype(int) * 0.4
     df["sweep_boost"] = (df["tags"] == "sweep").astype(int) * 0.35
@@ -89,7 +319,7 @@ def unusual_scores(trades_df: pd.DataFrame) -> pd.DataFrame:
     df["unusual_score"] = df["z_score"] + df["near_term_boost"] + df["sweep_boost"] + df["otm_boost"]
 
     scores = (
-        df.groupby("ticker")["unusual_score"]
+        df.groupby("ticker", observed=True)["unusual_score"]
         .mean()
         .sort_values(ascending=False)
         .reset_index()
@@ -99,7 +329,7 @@ def unusual_scores(trades_df: pd.DataFrame) -> pd.DataFrame:
 
 def compute_gex(chain_df: pd.DataFrame) -> GexSummary:
     df = chain_df.copy()
-    sign = df["call_put"].map({"CALL": 1, "PUT": -1}).fillna(1)
+    sign = np.where(df["call_put"] == "PUT", -1, 1)
     df["gex"] = -df["gamma"] * df["oi"] * 100 * sign
     gex_by_strike = df.groupby("strike")["gex"].sum().reset_index()
     gex_by_strike = gex_by_strike.sort_values("strike")
@@ -119,6 +349,94 @@ def compute_gex(chain_df: pd.DataFrame) -> GexSummary:
     )
 
 
+@dataclass
+class GexBook:
+    """GEX for every underlying in a chain, built in one grouped pass."""
+
+    by_expiry_strike: pd.DataFrame
+    by_strike: pd.DataFrame
+    summary: pd.DataFrame
+
+    def tickers(self) -> List[str]:
+        return self.summary["ticker"].astype(str).tolist()
+
+    def for_ticker(self, ticker: str) -> GexSummary:
+        rows = self.by_strike[self.by_strike["ticker"] == ticker]
+        stats = self.summary[self.summary["ticker"] == ticker]
+        if stats.empty:
+            raise KeyError(ticker)
+        stats = stats.iloc[0]
+        return GexSummary(
+            gex_by_strike=rows[["strike", "gex"]].reset_index(drop=True),
+            gamma_wall=float(stats["gamma_wall"]),
+            gamma_flip=float(stats["gamma_flip"]),
+            total_gex=float(stats["total_gex"]),
+        )
+
+    def expiry_breakdown(self, ticker: str) -> pd.DataFrame:
+        rows = self.by_expiry_strike[self.by_expiry_strike["ticker"] == ticker]
+        return rows[["expiry", "strike", "gex"]].reset_index(drop=True)
+
+    def leaderboard(self, n: int = 10) -> pd.DataFrame:
+        order = self.summary["total_gex"].abs().sort_values(ascending=False).index
+        return self.summary.loc[order].head(n).reset_index(drop=True)
+
+
+def build_gex_book(chain_df: pd.DataFrame) -> GexBook:
+    sign = np.where(chain_df["call_put"] == "PUT", -1, 1)
+    gex = pd.DataFrame(
+        {
+            "ticker": chain_df["ticker"],
+            "expiry": chain_df["expiry"],
+            "strike": chain_df["strike"],
+            "gex": -chain_df["gamma"].to_numpy(dtype=float) * chain_df["oi"].to_numpy() * 100 * sign,
+        }
+    )
+    by_expiry_strike = gex.groupby(["ticker", "expiry", "strike"], observed=True, sort=True)["gex"].sum().reset_index()
+    by_strike = by_expiry_strike.groupby(["ticker", "strike"], observed=True, sort=True)["gex"].sum().reset_index()
+    return GexBook(
+        by_expiry_strike=by_expiry_strike,
+        by_strike=by_strike,
+        summary=_gex_levels(by_strike),
+    )
+
+
+def _gex_levels(by_strike: pd.DataFrame) -> pd.DataFrame:
+    # by_strike is sorted by (ticker, strike); every ticker is one contiguous run.
+    codes, tickers = pd.factorize(by_strike["ticker"], sort=False)
+    strike = by_strike["strike"].to_numpy(dtype=float)
+    values = by_strike["gex"].to_numpy(dtype=float)
+    if len(values) == 0:
+        return pd.DataFrame(columns=["ticker", "total_gex", "gamma_wall", "gamma_flip"])
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    total_gex = np.add.reduceat(values, starts)
+
+    # First strike with the largest |gex| per ticker (matches idxmax tie-breaking).
+    by_magnitude = np.lexsort((-np.abs(values), codes))
+    first = np.r_[True, codes[by_magnitude][1:] != codes[by_magnitude][:-1]]
+    gamma_wall = strike[by_magnitude[first]]
+
+    # Zero-gamma flip: first sign change per ticker, linearly interpolated.
+    sign = np.sign(values)
+    crossing = np.flatnonzero((codes[1:] == codes[:-1]) & (sign[1:] != sign[:-1])) + 1
+    gamma_flip = gamma_wall.copy()
+    if len(crossing):
+        group, first_crossing = np.unique(codes[crossing], return_index=True)
+        hi = crossing[first_crossing]
+        lo = hi - 1
+        gamma_flip[group] = strike[lo] - values[lo] * (strike[hi] - strike[lo]) / (values[hi] - values[lo])
+
+    return pd.DataFrame(
+        {
+            "ticker": tickers,
+            "total_gex": total_gex,
+            "gamma_wall": gamma_wall,
+            "gamma_flip": gamma_flip,
+        }
+    )
+
+
 def narrative_summary(kpis: Dict[str, float], top_ticker: str, flow_trend: float) -> str:
     direction = "bullish" if flow_trend > 0 else "bearish"
     return (
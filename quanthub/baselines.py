@@ -0,0 +1,172 @@
+"""Streaming per-ticker premium baselines persisted across QuantHub sessions."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .tape import TapeCursor
+
+
+BASELINE_DIR_ENV = "QUANTHUB_BASELINE_DIR"
+DEFAULT_HALFLIFE = 1000  # trades per ticker, roughly a week of mock tape
+FILE_VERSION = 1
+
+# Per-ticker running state: Welford count/mean/M2 over all history, plus
+# exponentially weighted sums (value, value**2, weight) for the recent norm.
+_STATE = ("count", "mean", "m2", "ew_sum", "ew_sq", "ew_weight")
+
+
+def default_path(name: str) -> Path:
+    root = Path(os.environ.get(BASELINE_DIR_ENV, Path.home() / ".quanthub"))
+    return root / f"baselines-{name}.json"
+
+
+class PremiumBaselines:
+    """Running premium mean/variance per ticker, updated one batch at a time.
+
+    Only trades past the timestamp watermark are absorbed, so feeding the
+    same (or an overlapping) tape twice never double counts. Each batch
+    costs O(rows) and the stored state is O(tickers).
+    """
+
+    def __init__(self, halflife: float = DEFAULT_HALFLIFE, path: Optional[Union[str, Path]] = None) -> None:
+        self.halflife = float(halflife)
+        self.path = Path(path) if path is not None else None
+        self.cursor = TapeCursor()
+        self._tickers: Dict[str, int] = {}
+        self._state = np.zeros((len(_STATE), 0))
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tickers)
+
+    @property
+    def watermark(self) -> Optional[pd.Timestamp]:
+        return self.cursor.watermark
+
+    @property
+    def decay(self) -> float:
+        return 0.5 ** (1.0 / self.halflife)
+
+    def update(self, trades_df: pd.DataFrame) -> int:
+        """Absorb trades past the watermark; returns how many were used."""
+        with self._lock:
+            batch = self.cursor.take(trades_df)
+            if batch.empty:
+                return 0
+            self._absorb(batch["ticker"], batch["premium"].to_numpy(dtype=float))
+            return len(batch)
+
+    def frame(self) -> pd.DataFrame:
+        """Baseline table indexed by ticker: count, mean/std and their EW counterparts."""
+        with self._lock:
+            count, mean, m2, ew_sum, ew_sq, ew_weight = self._state
+            with np.errstate(invalid="ignore", divide="ignore"):
+                std = np.sqrt(np.where(count > 1, m2 / (count - 1), np.nan))
+                ew_mean = ew_sum / ew_weight
+                ew_std = np.sqrt(np.clip(ew_sq / ew_weight - ew_mean**2, 0.0, None))
+            index = pd.Index(list(self._tickers), name="ticker")
+            return pd.DataFrame(
+                {"count": count.astype(np.int64), "mean": mean, "std": std, "ewm_mean": ew_mean, "ewm_std": ew_std},
+                index=index,
+            )
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> Path:
+        target = Path(path) if path is not None else self.path
+        if target is None:
+            raise ValueError("No path to save baselines to")
+        with self._lock:
+            payload = {
+                "version": FILE_VERSION,
+                "halflife": self.halflife,
+                "watermark": self.watermark.isoformat() if self.watermark is not None else None,
+                "at_watermark": self.cursor.seen_at_watermark,
+                "tickers": {
+                    ticker: dict(zip(_STATE, self._state[:, row].tolist())) for ticker, row in self._tickers.items()
+                },
+            }
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a crash mid-save never leaves a truncated file.
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix=".tmp")
+        with os.fdopen(fd, "w") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp, target)
+        return target
+
+    @classmethod
+    def load(cls, path: Union[str, Path], halflife: float = DEFAULT_HALFLIFE) -> "PremiumBaselines":
+        """Restore saved baselines, or start empty if the file is missing or unreadable."""
+        baselines = cls(halflife=halflife, path=path)
+        try:
+            payload = json.loads(Path(path).read_text())
+        except (OSError, ValueError):
+            return baselines
+        if payload.get("version") != FILE_VERSION:
+            return baselines
+
+        baselines.halflife = float(payload.get("halflife", halflife))
+        if payload.get("watermark"):
+            baselines.cursor = TapeCursor(pd.Timestamp(payload["watermark"]), int(payload.get("at_watermark", 0)))
+        tickers = payload.get("tickers", {})
+        baselines._tickers = {ticker: row for row, ticker in enumerate(tickers)}
+        baselines._state = np.array([[tickers[t].get(name, 0.0) for t in tickers] for name in _STATE], dtype=float)
+        baselines._state = baselines._state.reshape(len(_STATE), len(tickers))
+        return baselines
+
+    def _absorb(self, tickers: pd.Series, premium: np.ndarray) -> None:
+        codes, uniques = pd.factorize(tickers)
+        rows = self._rows([str(t) for t in uniques])[codes]
+        n_rows = self._state.shape[1]
+
+        # Batch moments per ticker, merged into the running state with Chan's
+        # parallel update so the result matches a trade-by-trade Welford pass.
+        n_b = np.bincount(rows, minlength=n_rows).astype(float)
+        sum_b = np.bincount(rows, weights=premium, minlength=n_rows)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_b = np.where(n_b > 0, sum_b / n_b, 0.0)
+        m2_b = np.bincount(rows, weights=(premium - mean_b[rows]) ** 2, minlength=n_rows)
+
+        count, mean, m2, ew_sum, ew_sq, ew_weight = self._state
+        total = count + n_b
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mean_b - mean
+            merged_mean = np.where(total > 0, mean + delta * n_b / total, 0.0)
+            merged_m2 = m2 + m2_b + np.where(total > 0, delta**2 * count * n_b / total, 0.0)
+
+        # EW sums decay by one step per trade of the same ticker, so within a
+        # batch a trade's weight is decay ** (later trades of that ticker).
+        order = np.argsort(rows, kind="stable")
+        starts = np.r_[0, np.cumsum(np.bincount(rows, minlength=n_rows))[:-1]]
+        later = np.empty(len(rows), dtype=np.int64)
+        later[order] = np.arange(len(rows)) - starts[rows[order]]
+        later = n_b[rows].astype(np.int64) - 1 - later
+        weight = self.decay**later
+        carry = self.decay**n_b
+
+        self._state = np.vstack(
+            [
+                total,
+                merged_mean,
+                merged_m2,
+                ew_sum * carry + np.bincount(rows, weights=weight * premium, minlength=n_rows),
+                ew_sq * carry + np.bincount(rows, weights=weight * premium**2, minlength=n_rows),
+                ew_weight * carry + np.bincount(rows, weights=weight, minlength=n_rows),
+            ]
+        )
+
+    def _rows(self, tickers: list) -> np.ndarray:
+        for ticker in tickers:
+            if ticker not in self._tickers:
+                self._tickers[ticker] = len(self._tickers)
+        missing = len(self._tickers) - self._state.shape[1]
+        if missing:
+            self._state = np.hstack([self._state, np.zeros((len(_STATE), missing))])
+        return np.array([self._tickers[t] for t in tickers], dtype=np.int64)
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, Dict, Optional, Tuple
 
 import pandas as pd
 
-from .analytics import flow_by_minute, top_strikes, compute_gex, unusual_scores
+from .flow_index import FlowIndex, FlowQuery
+from .llm_router import get_router
+from .memo import flow_by_minute, flow_index, gex_book, top_strikes, unusual_scores
 from .viz_engine import flow_timeseries, gex_by_strike, price_flow_overlay, top_strikes_bar, unusual_scores_bar
 
 
@@ -30,7 +31,7 @@ def _parse_filters(message: str, context: Dict[str, Any]) -> Dict[str, Any]:
 
     window_match = re.search(r"window\s*=\s*(\d+)(m|h|d)", msg)
     if window_match:
-        context["window"] = window_match.group(0)
+        context["window"] = window_match.group(1) + window_match.group(2)
 
     premium_match = re.search(r"min_premium\s*=\s*([\d\.]+)", msg)
     if premium_match:
@@ -43,6 +44,45 @@ def _parse_filters(message: str, context: Dict[str, Any]) -> Dict[str, Any]:
     return context
 
 
+_WINDOW_UNITS = {"m": "min", "h": "h", "d": "D"}
+
+
+def _window_delta(window: Any) -> Optional[pd.Timedelta]:
+    match = re.search(r"(\d+)\s*(m|h|d)", str(window or "").lower())
+    if not match or int(match.group(1)) == 0:
+        return None
+    return pd.Timedelta(int(match.group(1)), _WINDOW_UNITS[match.group(2)])
+
+
+def _compile_query(context: Dict[str, Any], index: FlowIndex) -> FlowQuery:
+    """Chat filters as one tape query: window -> time slice, premium -> range, sweeps -> tag."""
+    start = None
+    delta = _window_delta(context.get("window"))
+    if delta is not None and index.last_print is not None:
+        # "Last 60m" ends at the latest print: (last - 60m, last].
+        start = index.last_print - delta + pd.Timedelta(1, "ns")
+    try:
+        min_premium = float(context["min_premium"]) if context.get("min_premium") is not None else None
+    except (TypeError, ValueError):
+        min_premium = None
+    sweeps_only = str(context.get("sweeps_only", False)).lower() == "true"
+    return FlowQuery(
+        ticker=context.get("ticker", "SPY"),
+        min_premium=min_premium,
+        tag="sweep" if sweeps_only else None,
+        start=start,
+    )
+
+
+def _scope(context: Dict[str, Any], query: FlowQuery) -> str:
+    parts = [f"last {context['window']}" if query.start is not None else "the session"]
+    if query.min_premium is not None:
+        parts.append(f"premium ≥ ${query.min_premium:,.0f}")
+    if query.tag == "sweep":
+        parts.append("sweeps only")
+    return ", ".join(parts)
+
+
 def _intent_from_message(message: str) -> str:
     msg = message.lower()
     if msg.startswith("set ") or "ticker=" in msg or "window=" in msg or "min_premium=" in msg:
@@ -64,28 +104,15 @@ def _intent_from_message(message: str) -> str:
     return "flow_summary"
 
 
-def _llm_route(message: str, api_key: str) -> Optional[Dict[str, Any]]:
-    try:
-        from openai import OpenAI
-    except Exception:
+def _llm_route(message: str, api_key: str, base_url: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    route = get_router(api_key, _intent_from_message, base_url=base_url).route(message)
+    if route.source == "fallback":
         return None
+    return {"intent": route.intent, "params": route.params}
 
-    client = OpenAI(api_key=api_key)
-    system = (
-        "You are QuantHub routing engine. Output STRICT JSON ONLY: "
-        "{\"intent\":\"...\",\"params\":{}}. "
-        "Valid intents: flow_summary, call_put, top_strikes, unusual, gex, price_flow, set_filter, export_csv."
-    )
-    resp = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[{"role": "system", "content": system}, {"role": "user", "content": message}],
-        temperature=0,
-    )
-    content = resp.choices[0].message.content or ""
-    try:
-        return json.loads(content)
-    except Exception:
-        return None
+
+def llm_stats(api_key: str, base_url: Optional[str] = None) -> Dict[str, float]:
+    return get_router(api_key, _intent_from_message, base_url=base_url).stats()
 
 
 def handle_chat(
@@ -94,12 +121,13 @@ def handle_chat(
     context: Dict[str, Any],
     llm_enabled: bool = False,
     llm_key: Optional[str] = None,
+    llm_base_url: Optional[str] = None,
 ) -> Tuple[ChatResponse, Dict[str, Any]]:
     context = _parse_filters(message, context)
     intent = _intent_from_message(message)
 
     if llm_enabled and llm_key:
-        llm_result = _llm_route(message, llm_key)
+        llm_result = _llm_route(message, llm_key, llm_base_url)
         if llm_result and "intent" in llm_result:
             intent = llm_result["intent"]
             for key, value in llm_result.get("params", {}).items():
@@ -109,8 +137,13 @@ def handle_chat(
     price_df = data_bundle["price_df"]
     chain_df = data_bundle["chain_df"]
 
-    ticker = context.get("ticker", "SPY")
-    filtered = trades_df[trades_df["ticker"] == ticker]
+    # Every predicate is pushed into the tape index before analytics run, so
+    # each answer only touches the matching slice.
+    index = flow_index(trades_df)
+    query = _compile_query(context, index)
+    ticker = query.ticker
+    scope = _scope(context, query)
+    filtered = index.take(query)
 
     if intent == "set_filter":
         return ChatResponse(
@@ -124,7 +157,7 @@ def handle_chat(
         chart = flow_timeseries(flow_df)
         summary = (
             f"Flow summary for {ticker}: net flow of "
-            f"${flow_df['net_flow'].sum()/1e6:.1f}M over the session."
+            f"${flow_df['net_flow'].sum()/1e6:.1f}M over {scope}."
         )
         return ChatResponse(text=summary, chart=chart, table=flow_df.tail(25), summary=summary), context
 
@@ -132,7 +165,7 @@ def handle_chat(
         flow_df = flow_by_minute(filtered)
         chart = flow_timeseries(flow_df)
         return ChatResponse(
-            text=f"Call vs Put premium for {ticker}.",
+            text=f"Call vs Put premium for {ticker} ({scope}).",
             chart=chart,
             table=flow_df.tail(30),
         ), context
@@ -141,22 +174,27 @@ def handle_chat(
         top_df = top_strikes(filtered)
         chart = top_strikes_bar(top_df)
         return ChatResponse(
-            text=f"Top strikes by premium for {ticker}.",
+            text=f"Top strikes by premium for {ticker} ({scope}).",
             chart=chart,
             table=top_df,
         ), context
 
     if intent == "unusual":
-        scores_df = unusual_scores(trades_df)
+        # Market-wide: every predicate except the ticker applies.
+        market = index.take(replace(query, ticker=None))
+        scores_df = unusual_scores(market, data_bundle.get("baseline_df"))
         chart = unusual_scores_bar(scores_df.head(10))
         return ChatResponse(
-            text="Unusual activity scanner for the market.",
+            text=f"Unusual activity scanner for the market ({scope}).",
             chart=chart,
             table=scores_df.head(15),
         ), context
 
     if intent == "gex":
-        gex = compute_gex(chain_df[chain_df["ticker"] == ticker])
+        try:
+            gex = gex_book(chain_df).for_ticker(ticker)
+        except KeyError:
+            return ChatResponse(text=f"No option chain loaded for {ticker}."), context
         chart = gex_by_strike(gex.gex_by_strike)
         summary = f"Gamma wall at {gex.gamma_wall:.1f}, flip near {gex.gamma_flip:.1f}."
         return ChatResponse(
@@ -168,16 +206,18 @@ def handle_chat(
 
     if intent == "price_flow":
         flow_df = flow_by_minute(filtered)
+        if query.start is not None:
+            price_df = price_df[price_df["timestamp"] >= query.start]
         chart = price_flow_overlay(flow_df, price_df, ticker)
         return ChatResponse(
-            text=f"Price vs flow overlay for {ticker}.",
+            text=f"Price vs flow overlay for {ticker} ({scope}).",
             chart=chart,
             table=flow_df.tail(20),
         ), context
 
     if intent == "export_csv":
         return ChatResponse(
-            text="Export requested. Use the 'Download CSV' button in the workspace.",
+            text="Export requested. Use the Download button in the workspace (CSV, Parquet or Arrow IPC).",
             table=filtered.head(200),
         ), context
 
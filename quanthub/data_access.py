@@ -2,21 +2,168 @@
 
 from __future__ import annotations
 
+import itertools
 from datetime import datetime
-from typing import Dict
+from typing import Callable, Dict, Optional, Tuple
 
 import streamlit as st
 
-from .data_mock import MockBundle, TICKERS, generate_mock_bundle
+import pandas as pd
+
+from .analytics import KpiAccumulator
+from .baselines import PremiumBaselines, default_path
+from .data_mock import MockBundle, MockLiveFeed, TICKERS, generate_mock_bundle
+from .live_store import LiveStore
+from .memo import ANALYTICS_CACHE, flow_by_minute, stamp_snapshot
+from .movers import MoversTracker
+from .perf import span
+from .refresher import DEFAULT_IDLE_SECONDS, RefreshWorker, WorkerRegistry
+from .replay import ReplayConfig, replay_source
+from .snapshot_store import default_store, load_mock_bundle
 from .snowflake_io import fetch_snowflake_bundle, snowflake_available
 
 
-@st.cache_data(show_spinner=False)
+LIVE_REFRESH_SECONDS = 5.0
+SNOWFLAKE_REFRESH_SECONDS = 15.0
+REPLAY_REFRESH_SECONDS = 1.0
+REPLAY_IDLE_SECONDS = 60.0
+
+# Live workers (one per seed) own their feed buffers; seeds nobody reads are
+# stopped after DEFAULT_IDLE_SECONDS and at most this many run at once.
+_LIVE_WORKERS = WorkerRegistry(max_workers=4)
+# Each replay holds a whole generated tape and a producer thread, so only the
+# two most recent configs keep running.
+_REPLAY_WORKERS = WorkerRegistry(max_workers=2)
+_GENERATIONS = itertools.count(1)
+
+
+@st.cache_resource(show_spinner=False)
 def _load_mock(seed: int) -> MockBundle:
-    return generate_mock_bundle(seed=seed, tickers=TICKERS)
+    # One shared, read-only bundle per process. With pyarrow it is a memory
+    # map of the on-disk snapshot, so worker processes and restarts share
+    # one physical copy instead of regenerating or unpickling it.
+    store = default_store()
+    if store is None:
+        return generate_mock_bundle(seed=seed, tickers=TICKERS)
+    return load_mock_bundle(store, seed, TICKERS)
+
+
+@st.cache_resource(show_spinner=False)
+def _baselines(name: str) -> PremiumBaselines:
+    return PremiumBaselines.load(default_path(name))
+
+
+@st.cache_resource(show_spinner=False)
+def _movers(stream: str) -> MoversTracker:
+    return MoversTracker()
+
+
+@st.cache_resource(show_spinner=False)
+def _kpis(stream: str) -> KpiAccumulator:
+    return KpiAccumulator()
 
 
-def load_data(source: str, seed: int, live_mode: bool, refresh_tick: int) -> Dict[str, object]:
+def _live_worker(seed: int) -> RefreshWorker:
+    def build() -> RefreshWorker:
+        # Resources are resolved here, on a script thread; the worker thread
+        # only touches the objects it closes over.
+        store = LiveStore(MockLiveFeed(seed=seed, tickers=TICKERS))
+        load = _store_loader(store, ("Live", seed), f"live:{seed}", seed, _baselines("mock"))
+        return RefreshWorker(
+            load, interval=LIVE_REFRESH_SECONDS, name=f"quanthub-live-{seed}", idle_timeout=DEFAULT_IDLE_SECONDS
+        )
+
+    return _LIVE_WORKERS.get(seed, build)
+
+
+def _replay_worker(config: ReplayConfig, seed: int) -> RefreshWorker:
+    def build() -> RefreshWorker:
+        stream = f"replay:{config.scenario}:{config.speed}:{seed}"
+        replay = replay_source(config, seed, TICKERS)
+        # Every run replays its tape from the start. Baselines shared across runs
+        # would already be past it and never move, so each replay builds its own
+        # in memory and their watermark follows the replay.
+        load = _store_loader(LiveStore(replay), ("Replay", stream), stream, seed, PremiumBaselines())
+        return RefreshWorker(
+            load,
+            interval=REPLAY_REFRESH_SECONDS,
+            name=f"quanthub-{stream}",
+            idle_timeout=REPLAY_IDLE_SECONDS,
+            on_stop=replay.stop,
+        )
+
+    return _REPLAY_WORKERS.get((config, seed), build)
+
+
+def _store_loader(
+    store: LiveStore, source: Tuple[str, object], stream: str, seed: int, baselines: PremiumBaselines
+) -> Callable[[], Optional[Dict[str, object]]]:
+    # Movers and KPIs live and die with the worker. A restarted worker counts
+    # its store's versions from scratch, so the generation keeps them unique.
+    movers, kpis = MoversTracker(), KpiAccumulator()
+    generation = next(_GENERATIONS)
+    published = {"version": None}
+
+    def load() -> Optional[Dict[str, object]]:
+        snapshot = store.refresh()
+        if snapshot.version == published["version"]:
+            return None
+        published["version"] = snapshot.version
+        bundle = {
+            "trades_df": snapshot.trades_df,
+            "price_df": snapshot.price_df,
+            "chain_df": snapshot.chain_df,
+            "updated_at": snapshot.updated_at,
+            "seed": seed,
+            "stream": f"{stream}:{generation}",
+            "version": f"{stream}:{generation}.{snapshot.version}",
+            "store": store,
+            "feed_stats": getattr(store.source, "stats", dict)(),
+        }
+        return _publish(source, bundle, baselines, movers, kpis)
+
+    return load
+
+
+@st.cache_resource(show_spinner=False)
+def _snowflake_worker(creds_items: Tuple[Tuple[str, str], ...]) -> RefreshWorker:
+    creds = dict(creds_items)
+    baselines = _baselines("snowflake")
+    movers = _movers(f"snowflake:{creds['account']}")
+    kpis = _kpis(f"snowflake:{creds['account']}")
+    published = {"version": None}
+
+    def load() -> Optional[Dict[str, object]]:
+        bundle = fetch_snowflake_bundle(creds)
+        if not bundle or bundle["trades_df"].empty:
+            return None
+        bundle["stream"] = f"snowflake:{creds['account']}"
+        bundle["version"] = f"snowflake:{bundle['source_version']}"
+        if bundle["version"] == published["version"]:
+            return None
+        published["version"] = bundle["version"]
+        return _publish(("Snowflake", creds["account"]), bundle, baselines, movers, kpis)
+
+    return RefreshWorker(load, interval=SNOWFLAKE_REFRESH_SECONDS, name="quanthub-snowflake").start()
+
+
+def load_data(
+    source: str, seed: int, live_mode: bool, refresh_tick: int, replay: Optional[ReplayConfig] = None
+) -> Dict[str, object]:
+    with span("data_access.load_data") as info:
+        bundle = _load_bundle(source, seed, live_mode, refresh_tick, replay)
+        info["rows"] = len(bundle["trades_df"])
+    return bundle
+
+
+def _load_bundle(
+    source: str, seed: int, live_mode: bool, refresh_tick: int, replay: Optional[ReplayConfig]
+) -> Dict[str, object]:
+    """Bundle for the current rerun.
+
+    Live and Snowflake data come from one shared background worker per
+    stream, so sessions only read the latest published snapshot.
+    """
     if source == "Snowflake" and snowflake_available():
         creds = {
             "user": st.secrets.get("SNOWFLAKE_USER", ""),
@@ -26,16 +173,72 @@ def load_data(source: str, seed: int, live_mode: bool, refresh_tick: int) -> Dic
             "database": st.secrets.get("SNOWFLAKE_DATABASE", ""),
             "schema": st.secrets.get("SNOWFLAKE_SCHEMA", ""),
         }
-        bundle = fetch_snowflake_bundle(creds)
-        if bundle and not bundle["trades_df"].empty:
-            return bundle
+        snapshot = _snowflake_worker(tuple(sorted(creds.items()))).latest()
+        if snapshot is not None:
+            return dict(snapshot.bundle)
+
+    if source == "Replay":
+        snapshot = _replay_worker(replay or ReplayConfig(), seed).latest()
+        if snapshot is not None:
+            return dict(snapshot.bundle)
+
+    if live_mode:
+        snapshot = _live_worker(seed).latest()
+        if snapshot is not None:
+            return dict(snapshot.bundle)
 
     # Mock mode fallback
     bundle = _load_mock(seed + refresh_tick)
-    return {
-        "trades_df": bundle.trades_df,
-        "price_df": bundle.price_df,
-        "chain_df": bundle.chain_df,
-        "updated_at": datetime.now(),
-        "seed": seed,
-    }
+    return _publish(
+        ("Mock", seed),
+        {
+            "trades_df": bundle.trades_df,
+            "price_df": bundle.price_df,
+            "chain_df": bundle.chain_df,
+            "updated_at": datetime.now(),
+            "seed": seed,
+            "stream": f"mock:{seed + refresh_tick}",
+            "version": f"mock:{seed + refresh_tick}",
+        },
+        _baselines("mock"),
+        _movers(f"mock:{seed + refresh_tick}"),
+        _kpis(f"mock:{seed + refresh_tick}"),
+    )
+
+
+def _publish(
+    source: Tuple[str, object],
+    bundle: Dict[str, object],
+    baselines: PremiumBaselines,
+    movers: MoversTracker,
+    kpis: KpiAccumulator,
+) -> Dict[str, object]:
+    # Stamped frames are keyed by snapshot version without hashing them, and
+    # a new version for the same source drops results derived from the old one.
+    for name in ("trades_df", "price_df", "chain_df"):
+        stamp_snapshot(bundle[name], bundle["version"])
+    ANALYTICS_CACHE.observe_snapshot(source, bundle["version"])
+
+    # Live and mock share the synthetic universe; the watermark keeps a tape
+    # that is reloaded or replayed from being counted twice.
+    if baselines.update(bundle["trades_df"]) and baselines.path is not None:
+        try:
+            baselines.save()
+        except OSError:
+            pass
+    bundle["baseline_df"] = baselines.frame()
+    movers.update(bundle["trades_df"], version=bundle["version"])
+    bundle["movers"] = movers
+    # Headline cards read running totals, so they cost the same however long the tape.
+    kpis.take(bundle["trades_df"], version=bundle["version"])
+    bundle["kpis"] = kpis.summary()
+    return bundle
+
+
+def ticker_flow(bundle: Dict[str, object], ticker: str) -> pd.DataFrame:
+    """Per-minute flow for one ticker, read from live accumulators when available."""
+    store = bundle.get("store")
+    if isinstance(store, LiveStore):
+        return store.flow(ticker)
+    trades_df = bundle["trades_df"]
+    return flow_by_minute(trades_df[trades_df["ticker"] == ticker])
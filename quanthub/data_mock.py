@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
+import itertools
+import string
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
+from .tape import compact_trades, ticker_dtype
 
 TICKERS = ["SPY", "QQQ", "AAPL", "MSFT", "NVDA", "TSLA", "AMZN", "META"]
+CHAIN_EXPIRY_DAYS = (7, 14, 30, 60)
+CHAIN_GENERATOR_VERSION = 2
+
+BASE_PRICE = {
+    "SPY": 512,
+    "QQQ": 438,
+    "AAPL": 182,
+    "MSFT": 418,
+    "NVDA": 760,
+    "TSLA": 196,
+    "AMZN": 176,
+    "META": 468,
+}
 
 
 @dataclass
@@ -36,26 +52,22 @@ def generate_trades_df(seed: int, tickers: List[str], n_trades: int = 1400) -> p
     now = datetime.now()
     timestamps = _intraday_index(now)
     trade_times = rng.choice(timestamps, size=n_trades, replace=True)
-    ticker = rng.choice(tickers, size=n_trades, replace=True)
+    return _draw_trades(rng, tickers, trade_times, now).sort_values("timestamp")
+
+
+def _draw_trades(rng: np.random.Generator, tickers: List[str], trade_times: np.ndarray, now: datetime) -> pd.DataFrame:
+    n_trades = len(trade_times)
+    # Index draws consume the generator exactly like choosing the symbols directly.
+    ticker_idx = rng.choice(len(tickers), size=n_trades, replace=True)
+    ticker = np.asarray(tickers)[ticker_idx]
     option_type = rng.choice(["CALL", "PUT"], size=n_trades, p=[0.56, 0.44])
     side = rng.choice(["BUY", "SELL"], size=n_trades, p=[0.62, 0.38])
     tags = rng.choice(["sweep", "block", "split"], size=n_trades, p=[0.32, 0.2, 0.48])
 
-    base_price = {
-        "SPY": 512,
-        "QQQ": 438,
-        "AAPL": 182,
-        "MSFT": 418,
-        "NVDA": 760,
-        "TSLA": 196,
-        "AMZN": 176,
-        "META": 468,
-    }
-
-    spot = np.array([base_price[t] for t in ticker])
+    spot = np.array([BASE_PRICE[t] for t in tickers], dtype=float)[ticker_idx]
     strike = np.round(spot * rng.normal(1.0, 0.06, size=n_trades), 1)
     expiry_days = rng.choice([7, 14, 30, 45, 60], size=n_trades, p=[0.18, 0.22, 0.3, 0.2, 0.1])
-    expiry = [now.date() + timedelta(days=int(x)) for x in expiry_days]
+    expiry = np.datetime64(now.date(), "D") + expiry_days.astype("timedelta64[D]")
 
     size = rng.integers(10, 1200, size=n_trades)
     iv = np.round(rng.normal(0.42, 0.12, size=n_trades).clip(0.12, 0.95), 3)
@@ -68,7 +80,7 @@ def generate_trades_df(seed: int, tickers: List[str], n_trades: int = 1400) -> p
     sentiment = np.where(option_type == "CALL", "bullish", "bearish")
     sentiment = np.where(side == "SELL", "bearish", sentiment)
 
-    return pd.DataFrame(
+    trades_df = pd.DataFrame(
         {
             "timestamp": trade_times,
             "ticker": ticker,
@@ -85,7 +97,8 @@ def generate_trades_df(seed: int, tickers: List[str], n_trades: int = 1400) -> p
             "tags": tags,
             "sentiment": sentiment,
         }
-    ).sort_values("timestamp")
+    )
+    return compact_trades(trades_df, tickers=tickers)
 
 
 def generate_price_df(seed: int, tickers: List[str]) -> pd.DataFrame:
@@ -93,34 +106,98 @@ def generate_price_df(seed: int, tickers: List[str]) -> pd.DataFrame:
     now = datetime.now()
     idx = _intraday_index(now)
 
-    base = {
-        "SPY": 512,
-        "QQQ": 438,
-        "AAPL": 182,
-        "MSFT": 418,
-        "NVDA": 760,
-        "TSLA": 196,
-        "AMZN": 176,
-        "META": 468,
-    }
-
     frames = []
     for t in tickers:
         drift = rng.normal(0.0004, 0.0001)
         noise = rng.normal(0, 0.6, size=len(idx))
-        series = base[t] + np.cumsum(noise) + (np.arange(len(idx)) * drift)
+        series = BASE_PRICE[t] + np.cumsum(noise) + (np.arange(len(idx)) * drift)
         frames.append(pd.DataFrame({"timestamp": idx, "ticker": t, "price": np.round(series, 2)}))
     return pd.concat(frames, ignore_index=True)
 
 
-def generate_chain_df(seed: int, tickers: List[str]) -> pd.DataFrame:
+def ticker_universe(n: int) -> List[str]:
+    """The demo tickers followed by synthetic symbols, for load-sized universes."""
+    universe = list(TICKERS[:n])
+    letters = string.ascii_uppercase
+    for length in (3, 4):
+        for chars in itertools.product(letters, repeat=length):
+            if len(universe) >= n:
+                return universe
+            symbol = "".join(chars)
+            if symbol not in TICKERS:
+                universe.append(symbol)
+    return universe
+
+
+def generate_chain_df(
+    seed: int,
+    tickers: List[str],
+    strikes_per_expiry: int = 25,
+    expiry_days: Sequence[int] = CHAIN_EXPIRY_DAYS,
+    version: int = CHAIN_GENERATOR_VERSION,
+) -> pd.DataFrame:
+    """Mock option chain, one row per ticker x expiry x strike x call/put.
+
+    ``version=2`` draws every column in one vectorized call per field and
+    returns compact dtypes. ``version=1`` is the original row-by-row
+    generator, kept so older seeds reproduce their exact output.
+    """
+    if version == 1:
+        return _generate_chain_df_v1(seed, tickers, strikes_per_expiry, expiry_days)
+    if version != 2:
+        raise ValueError(f"Unknown chain generator version: {version}")
+
+    rng = _rng(seed + 42)
+    now = datetime.now()
+    n_tickers, n_expiries, n_strikes = len(tickers), len(expiry_days), strikes_per_expiry
+    per_ticker = n_expiries * n_strikes * 2
+    n_rows = n_tickers * per_ticker
+
+    spot = rng.uniform(80, 780, size=n_tickers)
+    strikes = np.round(spot[:, None] * np.linspace(0.8, 1.2, n_strikes), 1)
+
+    ticker_idx = np.repeat(np.arange(n_tickers), per_ticker)
+    expiry_idx = np.tile(np.repeat(np.arange(n_expiries), n_strikes * 2), n_tickers)
+    strike = np.broadcast_to(strikes[:, None, :, None], (n_tickers, n_expiries, n_strikes, 2)).ravel()
+    call_put_idx = np.tile(np.array([0, 1], dtype=np.int8), n_rows // 2)
+
+    expiries = np.datetime64(now.date(), "D") + np.asarray(expiry_days).astype("timedelta64[D]")
+    dtype = ticker_dtype(tickers)
+    ticker_codes = dtype.categories.get_indexer(tickers)
+
+    oi = rng.integers(120, 3200, size=n_rows, dtype=np.int32)
+    iv = np.round(np.clip(rng.normal(0.38, 0.12, size=n_rows), 0.12, 0.9), 3).astype(np.float32)
+    gamma = np.round(np.clip(rng.normal(0.05, 0.025, size=n_rows), 0.005, 0.22), 4).astype(np.float32)
+    volume = rng.integers(20, 1500, size=n_rows, dtype=np.int32)
+
+    return pd.DataFrame(
+        {
+            "ticker": pd.Categorical.from_codes(ticker_codes[ticker_idx], dtype=dtype),
+            "spot": np.round(spot, 2)[ticker_idx],
+            "strike": strike,
+            "expiry": pd.to_datetime(expiries[expiry_idx]),
+            "oi": oi,
+            "iv": iv,
+            "gamma": gamma,
+            "volume": volume,
+            "call_put": pd.Categorical.from_codes(call_put_idx, categories=["CALL", "PUT"]),
+        }
+    )
+
+
+def _generate_chain_df_v1(
+    seed: int,
+    tickers: List[str],
+    strikes_per_expiry: int = 25,
+    expiry_days: Sequence[int] = CHAIN_EXPIRY_DAYS,
+) -> pd.DataFrame:
     rng = _rng(seed + 42)
     now = datetime.now()
     rows = []
     for t in tickers:
         spot = rng.uniform(80, 780)
-        strikes = np.round(np.linspace(spot * 0.8, spot * 1.2, 25), 1)
-        expiries = [now.date() + timedelta(days=d) for d in (7, 14, 30, 60)]
+        strikes = np.round(np.linspace(spot * 0.8, spot * 1.2, strikes_per_expiry), 1)
+        expiries = [now.date() + timedelta(days=d) for d in expiry_days]
         for expiry in expiries:
             for strike in strikes:
                 for call_put in ("CALL", "PUT"):
@@ -156,3 +233,177 @@ def generate_mock_bundle(seed: int = 7, tickers: List[str] | None = None) -> Moc
         seed=seed,
         updated_at=datetime.now(),
     )
+
+
+SESSION_PROFILES = ("normal", "heavy_open", "expiry")
+
+
+def _minute_weights(profile: str, minutes: int = 390) -> np.ndarray:
+    # U-shaped intraday activity: busy open and close, quiet lunch.
+    position = np.linspace(-1.0, 1.0, minutes)
+    weights = 1.0 + 2.5 * position**2
+    if profile == "heavy_open":
+        weights[:30] *= 6.0
+    elif profile == "expiry":
+        weights[-60:] *= 4.0
+    return weights / weights.sum()
+
+
+def generate_session_tape(
+    seed: int,
+    tickers: List[str] | None = None,
+    sessions: int = 3,
+    trades_per_session: int = 20_000,
+    profile: str = "normal",
+    end: datetime | None = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Trades and one-minute price bars for ``sessions`` consecutive weekdays ending at ``end``.
+
+    ``profile`` shapes the last session: ``"heavy_open"`` packs the first half
+    hour, ``"expiry"`` triples volume, leans into the close and makes a third
+    of the prints same-day expiries.
+    """
+    if profile not in SESSION_PROFILES:
+        raise ValueError(f"Unknown session profile: {profile}")
+    tickers = tickers or TICKERS
+    rng = _rng(seed + 211)
+    days = pd.bdate_range(end=pd.Timestamp(end or datetime.now()).normalize(), periods=sessions)
+    last_price = {t: float(BASE_PRICE[t]) for t in tickers}
+
+    trades, prices = [], []
+    for i, day in enumerate(days):
+        last = i == len(days) - 1
+        shape = profile if last else "normal"
+        n_trades = trades_per_session * (3 if shape == "expiry" else 1)
+        index = _intraday_index(day.to_pydatetime())
+        minute = rng.choice(len(index), size=n_trades, p=_minute_weights(shape, len(index)))
+        offsets = rng.uniform(0.0, 60.0, size=n_trades)
+        trade_times = np.sort(index.to_numpy()[minute] + (offsets * 1e9).astype("timedelta64[ns]"))
+        session = _draw_trades(rng, tickers, trade_times, day.to_pydatetime())
+        if shape == "expiry":
+            same_day = rng.random(len(session)) < 0.35
+            session.loc[same_day, "expiry"] = day
+        trades.append(session)
+
+        for t in tickers:
+            series = last_price[t] + np.cumsum(rng.normal(0, 0.6, size=len(index)))
+            last_price[t] = float(series[-1])
+            prices.append(pd.DataFrame({"timestamp": index, "ticker": t, "price": np.round(series, 2)}))
+
+    trades_df = pd.concat(trades, ignore_index=True)
+    price_df = pd.concat(prices, ignore_index=True).sort_values("timestamp", kind="stable", ignore_index=True)
+    return trades_df, price_df
+
+
+def chunk_rng(seed: int, index: int) -> np.random.Generator:
+    """Independent stream per chunk, fixed by (seed, chunk index) alone."""
+    return np.random.default_rng(np.random.SeedSequence(entropy=seed, spawn_key=(index,)))
+
+
+def generate_trades_chunk(
+    seed: int,
+    index: int,
+    n_trades: int,
+    chunk_rows: int,
+    days: Sequence[pd.Timestamp],
+    tickers: List[str] | None = None,
+) -> pd.DataFrame:
+    """Rows ``[index * chunk_rows, ...)`` of an ``n_trades`` tape over the sessions on ``days``.
+
+    Chunk ``i`` owns an equal share of the sessions' trading intensity, so
+    chunks are disjoint, in time order and generated without reference to
+    each other. Timestamps are sorted uniforms built by cumulative
+    exponential spacing, which is O(rows) rather than a sort.
+    """
+    tickers = tickers or TICKERS
+    rng = chunk_rng(seed, index)
+    rows = min(chunk_rows, n_trades - index * chunk_rows)
+    opens = np.array([_intraday_index(pd.Timestamp(day).to_pydatetime())[0] for day in days], dtype="datetime64[ns]")
+    weights = np.tile(_minute_weights("normal"), len(days))
+    cdf = np.r_[0.0, np.cumsum(weights)] / weights.sum()
+
+    low, high = index * chunk_rows / n_trades, (index * chunk_rows + rows) / n_trades
+    spacing = np.cumsum(rng.standard_exponential(rows + 1))
+    quantiles = low + (high - low) * spacing[:-1] / spacing[-1]
+    position = np.interp(quantiles, cdf, np.arange(len(cdf)))  # fractional minute across all sessions
+
+    minutes_per_day = len(weights) // len(days)
+    session = np.minimum(position // minutes_per_day, len(days) - 1).astype(np.int64)
+    offset = ((position - session * minutes_per_day) * 60e9).astype("timedelta64[ns]")
+    trade_times = opens[session] + offset
+
+    bounds = np.searchsorted(session, np.arange(len(days) + 1))
+    parts = [
+        _draw_trades(rng, tickers, trade_times[bounds[d] : bounds[d + 1]], pd.Timestamp(days[d]).to_pydatetime())
+        for d in range(len(days))
+        if bounds[d + 1] > bounds[d]
+    ]
+    return pd.concat(parts, ignore_index=True)
+
+
+@dataclass
+class LiveDelta:
+    trades_df: pd.DataFrame
+    price_df: pd.DataFrame
+    as_of: datetime
+
+
+class MockLiveFeed:
+    """Mock live source that emits only the trades and price bars since its last poll.
+
+    The session opens with ``generate_mock_bundle(seed)``; after that a
+    simulated clock runs on from the end of that tape at ``speed`` x wall time
+    and each poll draws Poisson(``trades_per_minute``) prints per elapsed
+    minute plus one price bar per ticker per minute boundary crossed.
+    """
+
+    def __init__(
+        self,
+        seed: int = 7,
+        tickers: List[str] | None = None,
+        trades_per_minute: float = 6.0,
+        speed: float = 1.0,
+    ) -> None:
+        self.seed = seed
+        self.tickers = tickers or TICKERS
+        self.trades_per_minute = trades_per_minute
+        self.speed = speed
+        self._rng = _rng(seed + 101)
+        self._wall: datetime | None = None
+        self._clock: pd.Timestamp | None = None
+        self._last_price: Dict[str, float] = {}
+
+    def initial(self) -> MockBundle:
+        bundle = generate_mock_bundle(seed=self.seed, tickers=self.tickers)
+        self._wall = datetime.now()
+        self._clock = max(bundle.trades_df["timestamp"].max(), bundle.price_df["timestamp"].max())
+        last = bundle.price_df.groupby("ticker")["price"].last()
+        self._last_price = {t: float(last.get(t, BASE_PRICE[t])) for t in self.tickers}
+        return bundle
+
+    def poll(self, elapsed: timedelta | None = None) -> LiveDelta:
+        if self._clock is None:
+            raise RuntimeError("Call initial() before poll()")
+        now = datetime.now()
+        if elapsed is None:
+            elapsed = (now - self._wall) * self.speed
+        self._wall = now
+        start, end = self._clock, self._clock + pd.Timedelta(elapsed)
+        self._clock = end
+
+        minutes = max(elapsed.total_seconds(), 0.0) / 60.0
+        n_trades = int(self._rng.poisson(self.trades_per_minute * minutes))
+        offsets = np.sort(self._rng.uniform(0.0, 1.0, size=n_trades))
+        span_ns = (end - start) // pd.Timedelta(1, "ns")
+        trade_times = start.to_datetime64() + (offsets * span_ns).astype("timedelta64[ns]")
+        trades_df = _draw_trades(self._rng, self.tickers, trade_times, now)
+
+        bars = pd.date_range(start.floor("1min") + pd.Timedelta(minutes=1), end, freq="1min")
+        frames = []
+        for t in self.tickers:
+            series = self._last_price[t] + np.cumsum(self._rng.normal(0, 0.6, size=len(bars)))
+            if len(bars):
+                self._last_price[t] = float(series[-1])
+            frames.append(pd.DataFrame({"timestamp": bars, "ticker": t, "price": np.round(series, 2)}))
+        price_df = pd.concat(frames, ignore_index=True).sort_values("timestamp", kind="stable")
+        return LiveDelta(trades_df=trades_df, price_df=price_df.reset_index(drop=True), as_of=now)
@@ -0,0 +1,78 @@
+"""Shape-preserving downsampling for QuantHub chart series."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def _numeric(x) -> np.ndarray:
+    values = np.asarray(x)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[ns]").astype(np.int64).astype(float)
+    return values.astype(float)
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of ``n_out`` points that keep the visual shape.
+
+    First and last points are always kept; each interior bucket contributes
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    xs, ys = _numeric(x), np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    prev = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], max(edges[bucket + 1], edges[bucket] + 1)
+        next_stop = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        avg_x = xs[stop:next_stop].mean() if next_stop > stop else xs[-1]
+        avg_y = ys[stop:next_stop].mean() if next_stop > stop else ys[-1]
+        area = np.abs(
+            (xs[prev] - avg_x) * (ys[start:stop] - ys[prev]) - (xs[prev] - xs[start:stop]) * (avg_y - ys[prev])
+        )
+        prev = start + int(np.nanargmax(area)) if len(area) else start
+        keep[bucket + 1] = prev
+    return keep
+
+
+def minmax_indices(y, n_buckets: int) -> np.ndarray:
+    """Min and max of each of ``n_buckets`` equal-count buckets, in original order."""
+    n = len(y)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+    ys = np.asarray(y, dtype=float)
+    bucket = (np.arange(n) * n_buckets) // n
+    order = np.lexsort((ys, bucket))
+    sorted_bucket = bucket[order]
+    first = np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]]
+    last = np.r_[sorted_bucket[1:] != sorted_bucket[:-1], True]
+    return np.unique(np.concatenate([order[first], order[last], [0, n - 1]]))
+
+
+def downsample(x, y, max_points: int, method: str = "lttb"):
+    """Return ``(x, y)`` reduced to about ``max_points`` points."""
+    n = len(y)
+    if max_points is None or n <= max_points:
+        return x, y
+    if method == "lttb":
+        idx = lttb_indices(x, y, max_points)
+    elif method == "minmax":
+        idx = minmax_indices(y, max(max_points // 2, 1))
+    else:
+        raise ValueError(f"Unknown downsampling method: {method}")
+    return _take(x, idx), _take(y, idx)
+
+
+def _take(values, idx: np.ndarray):
+    if isinstance(values, pd.Series):
+        return values.iloc[idx]
+    if isinstance(values, pd.Index):
+        return values[idx]
+    return np.asarray(values)[idx]
@@ -0,0 +1,91 @@
+"""Lazy, cached, chunked exports (CSV / Parquet / Arrow IPC) for QuantHub demo."""
+
+from __future__ import annotations
+
+import io
+from typing import BinaryIO, Dict, Iterator, List, Tuple
+
+import pandas as pd
+
+from .memo import AnalyticsCache, memoize
+
+
+# label -> (file extension, mime type, needs pyarrow)
+EXPORT_FORMATS: Dict[str, Tuple[str, str, bool]] = {
+    "CSV": ("csv", "text/csv", False),
+    "Parquet": ("parquet", "application/vnd.apache.parquet", True),
+    "Arrow IPC": ("arrow", "application/vnd.apache.arrow.file", True),
+}
+
+CHUNK_ROWS = 100_000
+
+EXPORT_CACHE = AnalyticsCache(maxsize=8)
+
+
+def arrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+
+        return True
+    except Exception:
+        return False
+
+
+def available_formats() -> List[str]:
+    has_arrow = arrow_available()
+    return [label for label, (_, _, needs_arrow) in EXPORT_FORMATS.items() if has_arrow or not needs_arrow]
+
+
+def iter_csv_chunks(df: pd.DataFrame, chunk_rows: int = CHUNK_ROWS) -> Iterator[bytes]:
+    for start in range(0, max(len(df), 1), chunk_rows):
+        chunk = df.iloc[start : start + chunk_rows]
+        yield chunk.to_csv(index=False, header=start == 0).encode("utf-8")
+
+
+def write_export(df: pd.DataFrame, fmt: str, sink: BinaryIO, chunk_rows: int = CHUNK_ROWS) -> None:
+    """Serialize ``df`` into ``sink`` one chunk at a time."""
+    if fmt == "CSV":
+        for block in iter_csv_chunks(df, chunk_rows):
+            sink.write(block)
+        return
+
+    import pyarrow as pa
+
+    schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+    if fmt == "Parquet":
+        import pyarrow.parquet as pq
+
+        with pq.ParquetWriter(sink, schema) as writer:
+            for start in range(0, len(df), chunk_rows):
+                chunk = df.iloc[start : start + chunk_rows]
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+        return
+    if fmt == "Arrow IPC":
+        with pa.ipc.new_file(sink, schema) as writer:
+            for start in range(0, len(df), chunk_rows):
+                chunk = df.iloc[start : start + chunk_rows]
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+        return
+    raise ValueError(f"Unknown export format: {fmt}")
+
+
+def _export_bytes(df: pd.DataFrame, fmt: str) -> bytes:
+    # The download button needs the whole file in memory; writing it chunk by
+    # chunk keeps the serializer's own intermediates to one chunk's worth.
+    buffer = io.BytesIO()
+    write_export(df, fmt, buffer)
+    return buffer.getvalue()
+
+
+# Downloads are keyed on the frame's content, never on the snapshot stamp it
+# may carry: hashing is linear like the serialization it saves, and a wrong
+# key here hands the user another table's file.
+export_bytes = memoize(_export_bytes, cache=EXPORT_CACHE, by_content=True)
+
+
+def export_name(stem: str, fmt: str) -> str:
+    return f"{stem}.{EXPORT_FORMATS[fmt][0]}"
+
+
+def export_mime(fmt: str) -> str:
+    return EXPORT_FORMATS[fmt][1]
@@ -0,0 +1,138 @@
+"""Prebuilt multi-attribute index over the trade tape for QuantHub flow filters."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class FlowQuery:
+    """A Flow blotter filter combination; ``None`` means "All"."""
+
+    ticker: Optional[str] = None
+    min_premium: Optional[float] = None
+    expiry_days: Optional[Tuple[int, int]] = None
+    tag: Optional[str] = None
+    option_type: Optional[str] = None
+    sentiment: Optional[str] = None
+    start: Optional[pd.Timestamp] = None  # inclusive print-time bounds
+    end: Optional[pd.Timestamp] = None
+
+
+def _codes(series: pd.Series) -> Tuple[np.ndarray, Dict[str, int]]:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes, categories = series.cat.codes.to_numpy(), series.cat.categories
+    else:
+        codes, categories = pd.factorize(series)
+    return codes, {str(value): code for code, value in enumerate(categories)}
+
+
+class FlowIndex:
+    """Per-ticker partitions sorted by premium plus code arrays for tag/type/sentiment.
+
+    A ticker + min-premium lookup is two binary searches that yield a
+    contiguous run of candidate rows; the remaining predicates only touch
+    those candidates.
+    """
+
+    def __init__(self, trades_df: pd.DataFrame) -> None:
+        self.trades_df = trades_df
+        ticker_codes, self._ticker_code = _codes(trades_df["ticker"])
+        premium = trades_df["premium"].to_numpy(dtype=float)
+
+        self._order = np.lexsort((premium, ticker_codes))
+        self._premium = premium[self._order]
+        sorted_codes = ticker_codes[self._order]
+        n_codes = max(self._ticker_code.values(), default=-1) + 1
+        self._bounds = np.searchsorted(sorted_codes, np.arange(n_codes + 1))
+
+        self._expiry = trades_df["expiry"].to_numpy().astype("datetime64[D]").astype(np.int64)
+        self._timestamp = trades_df["timestamp"].to_numpy().astype("datetime64[ns]")
+        self._time_sorted = bool(np.all(self._timestamp[1:] >= self._timestamp[:-1]))
+        self._attrs = {
+            "tag": _codes(trades_df["tags"]),
+            "option_type": _codes(trades_df["type"]),
+            "sentiment": _codes(trades_df["sentiment"]),
+        }
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @property
+    def tickers(self) -> List[str]:
+        return sorted(t for t, code in self._ticker_code.items() if self._bounds[code + 1] > self._bounds[code])
+
+    def positions(self, query: FlowQuery) -> np.ndarray:
+        """Row positions (ascending, i.e. tape order) matching ``query``."""
+        timed = query.start is not None or query.end is not None
+        if timed and self._time_sorted and query.ticker is None and query.min_premium is None:
+            # A time window alone is already a contiguous slice of the tape.
+            candidates = np.arange(*self.time_range(query.start, query.end))
+            timed = False
+        else:
+            candidates = self._candidates(query.ticker, query.min_premium)
+        if len(candidates) == 0:
+            return candidates
+
+        keep = np.ones(len(candidates), dtype=bool)
+        if timed and self._time_sorted:
+            lo, hi = self.time_range(query.start, query.end)
+            keep &= (candidates >= lo) & (candidates < hi)
+        elif timed:
+            stamps = self._timestamp[candidates]
+            if query.start is not None:
+                keep &= stamps >= np.datetime64(query.start, "ns")
+            if query.end is not None:
+                keep &= stamps <= np.datetime64(query.end, "ns")
+        if query.expiry_days is not None:
+            # Window is relative to the nearest expiry among ticker/premium matches.
+            expiry = self._expiry[candidates]
+            nearest = expiry.min()
+            keep &= (expiry >= nearest + query.expiry_days[0]) & (expiry <= nearest + query.expiry_days[1])
+        for name in ("tag", "option_type", "sentiment"):
+            value = getattr(query, name)
+            if value is None:
+                continue
+            codes, lookup = self._attrs[name]
+            if value not in lookup:
+                return candidates[:0]
+            keep &= codes[candidates] == lookup[value]
+        return np.sort(candidates[keep])
+
+    def time_range(self, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]) -> Tuple[int, int]:
+        """Row range ``[lo, hi)`` printed within ``[start, end]``; the whole tape if it is not time-sorted."""
+        if not self._time_sorted:
+            return 0, len(self._timestamp)
+        lo, hi = 0, len(self._timestamp)
+        if start is not None:
+            lo = int(np.searchsorted(self._timestamp, np.datetime64(start, "ns"), side="left"))
+        if end is not None:
+            hi = int(np.searchsorted(self._timestamp, np.datetime64(end, "ns"), side="right"))
+        return lo, hi
+
+    @property
+    def last_print(self) -> Optional[pd.Timestamp]:
+        return pd.Timestamp(self._timestamp.max()) if len(self._timestamp) else None
+
+    def take(self, query: FlowQuery) -> pd.DataFrame:
+        return self.trades_df.iloc[self.positions(query)]
+
+    def _candidates(self, ticker: Optional[str], min_premium: Optional[float]) -> np.ndarray:
+        if ticker is None:
+            codes = range(len(self._bounds) - 1)
+        elif ticker in self._ticker_code:
+            codes = [self._ticker_code[ticker]]
+        else:
+            return np.array([], dtype=np.int64)
+
+        runs = []
+        for code in codes:
+            start, stop = self._bounds[code], self._bounds[code + 1]
+            if min_premium is not None:
+                start += np.searchsorted(self._premium[start:stop], min_premium, side="left")
+            runs.append(self._order[start:stop])
+        return np.concatenate(runs) if runs else np.array([], dtype=np.int64)
@@ -0,0 +1,162 @@
+"""Vectorized Black-Scholes greeks and spot-grid gamma profiles for QuantHub demo."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+MIN_YEARS = 1.0 / (365.0 * 24.0)
+DEFAULT_GRID = np.linspace(0.8, 1.2, 81)
+
+try:
+    from scipy.special import ndtr as _norm_cdf
+except Exception:
+
+    def _norm_cdf(x: np.ndarray) -> np.ndarray:
+        # Abramowitz & Stegun 7.1.26 on erf, |error| < 1.5e-7.
+        z = np.abs(x) / np.sqrt(2.0)
+        t = 1.0 / (1.0 + 0.3275911 * z)
+        poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+        erf = 1.0 - poly * np.exp(-z * z)
+        return 0.5 * (1.0 + np.sign(x) * erf)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / np.sqrt(2.0 * np.pi)
+
+
+@dataclass
+class GammaProfile:
+    levels: pd.DataFrame
+    flips: pd.DataFrame
+
+    def for_ticker(self, ticker: str) -> pd.DataFrame:
+        return self.levels[self.levels["ticker"] == ticker].reset_index(drop=True)
+
+    def flip(self, ticker: str) -> float:
+        row = self.flips[self.flips["ticker"] == ticker]
+        return float(row["gamma_flip"].iloc[0]) if not row.empty else float("nan")
+
+
+def bs_greeks(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    iv: np.ndarray,
+    years: np.ndarray,
+    is_call: np.ndarray,
+    rate: float = 0.0,
+    dividend: float = 0.0,
+) -> Dict[str, np.ndarray]:
+    """Delta, gamma, vanna and charm (per year) for broadcastable inputs."""
+    spot = np.asarray(spot, dtype=float)
+    strike = np.asarray(strike, dtype=float)
+    iv = np.asarray(iv, dtype=float)
+    years = np.maximum(np.asarray(years, dtype=float), MIN_YEARS)
+
+    sqrt_t = np.sqrt(years)
+    vol_t = iv * sqrt_t
+    d1 = (np.log(spot / strike) + (rate - dividend + 0.5 * iv * iv) * years) / vol_t
+    d2 = d1 - vol_t
+    pdf = _norm_pdf(d1)
+    carry = np.exp(-dividend * years)
+
+    cdf = _norm_cdf(d1)
+    delta = np.where(is_call, carry * cdf, carry * (cdf - 1.0))
+    gamma = carry * pdf / (spot * vol_t)
+    vanna = -carry * pdf * d2 / iv
+    decay = carry * pdf * (2.0 * (rate - dividend) * years - d2 * vol_t) / (2.0 * years * vol_t)
+    charm = np.where(is_call, dividend * carry * cdf - decay, -dividend * carry * (1.0 - cdf) - decay)
+    return {"delta": delta, "gamma": gamma, "vanna": vanna, "charm": charm}
+
+
+def years_to_expiry(expiry: pd.Series, now: Optional[datetime] = None) -> np.ndarray:
+    now = pd.Timestamp(now or datetime.now())
+    expiry = pd.to_datetime(expiry) + pd.Timedelta(hours=16)
+    return np.maximum((expiry - now).dt.total_seconds().to_numpy() / (365.0 * 86400.0), MIN_YEARS)
+
+
+def chain_greeks(chain_df: pd.DataFrame, now: Optional[datetime] = None, rate: float = 0.0) -> pd.DataFrame:
+    """Model greeks for every contract, returned as columns alongside the chain."""
+    greeks = bs_greeks(
+        chain_df["spot"].to_numpy(),
+        chain_df["strike"].to_numpy(),
+        chain_df["iv"].to_numpy(),
+        years_to_expiry(chain_df["expiry"], now),
+        (chain_df["call_put"] == "CALL").to_numpy(),
+        rate=rate,
+    )
+    return chain_df.assign(**{f"model_{name}": values for name, values in greeks.items()})
+
+
+def gamma_profile(
+    chain_df: pd.DataFrame,
+    grid: np.ndarray = DEFAULT_GRID,
+    now: Optional[datetime] = None,
+    rate: float = 0.0,
+    chunk_rows: int = 65_536,
+) -> GammaProfile:
+    """Total GEX per ticker evaluated at ``spot * grid`` hypothetical spot levels.
+
+    Contracts are processed as (chunk x grid) arrays so memory stays bounded
+    on full chains. Exposure follows ``compute_gex``: -gamma * oi * 100 * sign.
+    """
+    grid = np.asarray(grid, dtype=float)
+    codes, tickers = pd.factorize(chain_df["ticker"], sort=True)
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+
+    spot = chain_df["spot"].to_numpy(dtype=float)[order]
+    strike = chain_df["strike"].to_numpy(dtype=float)[order]
+    iv = chain_df["iv"].to_numpy(dtype=float)[order]
+    years = years_to_expiry(chain_df["expiry"], now)[order]
+    is_call = (chain_df["call_put"] == "CALL").to_numpy()[order]
+    weight = -chain_df["oi"].to_numpy(dtype=float)[order] * 100 * np.where(is_call, 1.0, -1.0)
+
+    # Only gamma is needed on the grid, so the per-contract terms of d1 are
+    # hoisted and log(spot * g / K) splits into log(spot / K) + log(g).
+    vol_t = iv * np.sqrt(years)
+    log_moneyness = np.log(spot / strike) + (rate + 0.5 * iv * iv) * years
+    scale = weight / (spot * vol_t * np.sqrt(2.0 * np.pi))
+    log_grid = np.log(grid)
+
+    ticker_spot = np.zeros(len(tickers))
+    ticker_spot[codes] = spot
+    exposure = np.zeros((len(tickers), len(grid)))
+    for start in range(0, len(codes), chunk_rows):
+        stop = min(start + chunk_rows, len(codes))
+        d1 = (log_moneyness[start:stop, None] + log_grid[None, :]) / vol_t[start:stop, None]
+        contribution = np.exp(-0.5 * d1 * d1) * (scale[start:stop, None] / grid[None, :])
+        chunk_codes = codes[start:stop]
+        bounds = np.flatnonzero(np.r_[True, chunk_codes[1:] != chunk_codes[:-1]])
+        exposure[chunk_codes[bounds]] += np.add.reduceat(contribution, bounds, axis=0)
+
+    spot_levels = ticker_spot[:, None] * grid[None, :]
+    levels_df = pd.DataFrame(
+        {
+            "ticker": np.repeat(np.asarray(tickers), len(grid)),
+            "spot_level": spot_levels.ravel(),
+            "gex": exposure.ravel(),
+        }
+    )
+    return GammaProfile(levels=levels_df, flips=_profile_flips(tickers, ticker_spot, spot_levels, exposure))
+
+
+def _profile_flips(tickers, ticker_spot: np.ndarray, spot_levels: np.ndarray, exposure: np.ndarray) -> pd.DataFrame:
+    # Interpolated zero crossing of each curve; the one nearest spot wins.
+    flips = np.full(len(tickers), np.nan)
+    sign = np.sign(exposure)
+    rows, cols = np.nonzero(sign[:, 1:] != sign[:, :-1])
+    if len(rows):
+        lo_x, hi_x = spot_levels[rows, cols], spot_levels[rows, cols + 1]
+        lo_y, hi_y = exposure[rows, cols], exposure[rows, cols + 1]
+        crossing = lo_x - lo_y * (hi_x - lo_x) / (hi_y - lo_y)
+        distance = np.abs(crossing - ticker_spot[rows])
+        nearest = np.lexsort((distance, rows))
+        first = np.r_[True, rows[nearest][1:] != rows[nearest][:-1]]
+        flips[rows[nearest][first]] = crossing[nearest][first]
+    return pd.DataFrame({"ticker": np.asarray(tickers), "spot": ticker_spot, "gamma_flip": flips})
@@ -0,0 +1,166 @@
+"""Resident append-only store for QuantHub live mode."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .analytics import FlowAccumulator
+
+
+def _codes_dtype(n_categories: int) -> np.dtype:
+    # Mirrors the code width pandas picks, so Categorical.from_codes never recasts.
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class FrameBuffer:
+    """Columnar append buffer with amortized O(batch) appends.
+
+    ``frame()`` wraps the filled prefix of each column without copying, so a
+    returned frame stays valid (and unchanged) while later batches land past
+    its end or in a regrown buffer.
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        self.rows = 0
+        self._capacity = capacity
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._categories: Dict[str, pd.CategoricalDtype] = {}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def append(self, df: pd.DataFrame) -> None:
+        if not self._arrays and len(df.columns):
+            self._init_columns(df)
+        if df.empty:
+            return
+        self._reserve(self.rows + len(df))
+        stop = self.rows + len(df)
+        for name, array in self._arrays.items():
+            if name in self._categories:
+                array = self._category_codes(name, df[name])
+                self._arrays[name][self.rows : stop] = array
+            else:
+                array[self.rows : stop] = df[name].to_numpy(dtype=array.dtype)
+        self.rows = stop
+
+    def frame(self) -> pd.DataFrame:
+        columns = {}
+        for name, array in self._arrays.items():
+            view = array[: self.rows]
+            if name in self._categories:
+                view = pd.Categorical.from_codes(view, dtype=self._categories[name], validate=False)
+            columns[name] = view
+        return pd.DataFrame(columns, copy=False)
+
+    def _init_columns(self, df: pd.DataFrame) -> None:
+        capacity = max(self._capacity, len(df))
+        for name, series in df.items():
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                self._categories[name] = series.dtype
+                self._arrays[name] = np.zeros(capacity, dtype=_codes_dtype(len(series.dtype.categories)))
+            else:
+                self._arrays[name] = np.empty(capacity, dtype=series.to_numpy().dtype)
+        self._capacity = capacity
+
+    def _reserve(self, rows: int) -> None:
+        if rows <= self._capacity:
+            return
+        capacity = max(rows, 2 * self._capacity)
+        for name, array in self._arrays.items():
+            grown = np.empty(capacity, dtype=array.dtype)
+            grown[: self.rows] = array[: self.rows]
+            self._arrays[name] = grown
+        self._capacity = capacity
+
+    def _category_codes(self, name: str, values: pd.Series) -> np.ndarray:
+        dtype = self._categories[name]
+        unseen = pd.Index(pd.unique(values.dropna().astype(str))).difference(dtype.categories)
+        if len(unseen):
+            # New symbols are appended so existing codes stay valid.
+            dtype = pd.CategoricalDtype(list(dtype.categories) + list(unseen))
+            self._categories[name] = dtype
+            width = _codes_dtype(len(dtype.categories))
+            if width != self._arrays[name].dtype:
+                self._arrays[name] = self._arrays[name].astype(width)
+        return pd.Categorical(values, dtype=dtype).codes
+
+
+@dataclass(frozen=True)
+class LiveSnapshot:
+    trades_df: pd.DataFrame
+    price_df: pd.DataFrame
+    chain_df: pd.DataFrame
+    version: int
+    updated_at: datetime
+
+
+class LiveStore:
+    """Resident trades/prices fed by deltas from a live source.
+
+    ``source`` needs ``initial()`` returning a bundle with trades/price/chain
+    frames and ``poll()`` returning only what arrived since the previous call.
+    The version increases by one for every refresh that added rows.
+    """
+
+    def __init__(self, source: object) -> None:
+        self.source = source
+        self.version = 0
+        self.trades = FrameBuffer()
+        self.prices = FrameBuffer()
+        self._flows: Dict[str, FlowAccumulator] = {}
+        self._lock = threading.Lock()
+        self._snapshot: Optional[LiveSnapshot] = None
+
+        bundle = source.initial()
+        self.chain_df = bundle.chain_df
+        # Fix both schemas up front, so a source that starts empty still has columns.
+        self.trades.append(bundle.trades_df.iloc[:0])
+        self.prices.append(bundle.price_df.iloc[:0])
+        self._apply(bundle.trades_df, bundle.price_df)
+
+    def refresh(self) -> LiveSnapshot:
+        with self._lock:
+            delta = self.source.poll()
+            self._apply(delta.trades_df, delta.price_df)
+            return self._current()
+
+    def snapshot(self) -> LiveSnapshot:
+        with self._lock:
+            return self._current()
+
+    def flow(self, ticker: str) -> pd.DataFrame:
+        with self._lock:
+            accumulator = self._flows.get(ticker)
+            return accumulator.frame() if accumulator is not None else FlowAccumulator().frame()
+
+    def _apply(self, trades_df: pd.DataFrame, price_df: pd.DataFrame) -> None:
+        if trades_df.empty and price_df.empty:
+            return
+        self.trades.append(trades_df)
+        self.prices.append(price_df)
+        if not trades_df.empty:
+            for ticker, batch in trades_df.groupby("ticker", observed=True):
+                self._flows.setdefault(str(ticker), FlowAccumulator()).update(batch)
+        self.version += 1
+        self._snapshot = None
+
+    def _current(self) -> LiveSnapshot:
+        if self._snapshot is None:
+            self._snapshot = LiveSnapshot(
+                trades_df=self.trades.frame(),
+                price_df=self.prices.frame(),
+                chain_df=self.chain_df,
+                version=self.version,
+                updated_at=datetime.now(),
+            )
+        return self._snapshot
@@ -0,0 +1,259 @@
+"""Cached, latency-bounded LLM intent routing for the QuantHub chatbot."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+VALID_INTENTS = ("flow_summary", "call_put", "top_strikes", "unusual", "gex", "price_flow", "set_filter", "export_csv")
+SYSTEM_PROMPT = (
+    "You are QuantHub routing engine. Output STRICT JSON ONLY: "
+    "{\"intent\":\"...\",\"params\":{}}. "
+    f"Valid intents: {', '.join(VALID_INTENTS)}."
+)
+# Bump when the prompt or intent set changes so cached routes are not reused.
+PROMPT_VERSION = 1
+
+DEFAULT_MODEL = "gpt-4o-mini"
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+DEFAULT_BUDGET = 2.0
+CACHE_DIR_ENV = "QUANTHUB_CACHE_DIR"
+
+
+def default_cache_path() -> Path:
+    return Path(os.environ.get(CACHE_DIR_ENV, Path.home() / ".quanthub")) / "llm_routes.jsonl"
+
+
+def normalize_message(message: str) -> str:
+    """Case, whitespace and trailing punctuation do not change a route."""
+    return re.sub(r"\s+", " ", message.strip().lower()).rstrip(" ?!.")
+
+
+@dataclass(frozen=True)
+class Route:
+    intent: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    source: str = "fallback"  # "memory", "disk", "llm" or "fallback"
+    seconds: float = 0.0
+
+
+class _SdkTransport:
+    def __init__(self, api_key: str, base_url: Optional[str], timeout: float) -> None:
+        from openai import OpenAI
+
+        self._client = OpenAI(api_key=api_key, base_url=base_url, timeout=timeout, max_retries=0)
+
+    def complete(self, model: str, message: str) -> str:
+        resp = self._client.chat.completions.create(
+            model=model,
+            messages=[{"role": "system", "content": SYSTEM_PROMPT}, {"role": "user", "content": message}],
+            temperature=0,
+        )
+        return resp.choices[0].message.content or ""
+
+
+class _HttpTransport:
+    """Plain HTTP against an OpenAI-compatible endpoint, for when the SDK is not installed."""
+
+    def __init__(self, api_key: str, base_url: Optional[str], timeout: float) -> None:
+        self._url = (base_url or DEFAULT_BASE_URL).rstrip("/") + "/chat/completions"
+        self._headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        self._timeout = timeout
+
+    def complete(self, model: str, message: str) -> str:
+        body = json.dumps(
+            {
+                "model": model,
+                "messages": [{"role": "system", "content": SYSTEM_PROMPT}, {"role": "user", "content": message}],
+                "temperature": 0,
+            }
+        ).encode()
+        request = urllib.request.Request(self._url, data=body, headers=self._headers, method="POST")
+        with urllib.request.urlopen(request, timeout=self._timeout) as resp:
+            payload = json.loads(resp.read())
+        return payload["choices"][0]["message"]["content"] or ""
+
+
+def _make_transport(api_key: str, base_url: Optional[str], timeout: float) -> Any:
+    try:
+        return _SdkTransport(api_key, base_url, timeout)
+    except ImportError:
+        return _HttpTransport(api_key, base_url, timeout)
+
+
+def parse_route(content: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    try:
+        payload = json.loads(content)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("intent") not in VALID_INTENTS:
+        return None
+    params = payload.get("params") or {}
+    return payload["intent"], params if isinstance(params, dict) else {}
+
+
+class IntentRouter:
+    """Routes chat messages to ``{intent, params}`` through one reused LLM client.
+
+    Routes are cached by normalized message in an in-memory LRU backed by an
+    append-only JSONL file. A call that misses the latency budget answers
+    with ``fallback`` right away; the request keeps running in the
+    background and its answer is cached for the next time.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        fallback: Callable[[str], str],
+        base_url: Optional[str] = None,
+        model: str = DEFAULT_MODEL,
+        budget: float = DEFAULT_BUDGET,
+        cache_size: int = 512,
+        cache_path: Optional[Path] = None,
+        transport: Any = None,
+    ) -> None:
+        self.fallback = fallback
+        self.model = model
+        self.budget = budget
+        self.cache_size = cache_size
+        self.cache_path = cache_path
+        # Requests may outlive the budget, so give the transport some headroom.
+        self._transport = transport or _make_transport(api_key, base_url, timeout=max(budget * 5, 10.0))
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="quanthub-llm")
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._disk: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._pending: Dict[str, Any] = {}
+        self.counts = {"memory": 0, "disk": 0, "llm": 0, "timeout": 0, "error": 0, "invalid": 0}
+        self._load_disk()
+
+    def route(self, message: str) -> Route:
+        started = time.perf_counter()
+        key = f"{self.model}:{PROMPT_VERSION}:{normalize_message(message)}"
+
+        cached, source = self._lookup(key)
+        if cached is not None:
+            return Route(cached[0], dict(cached[1]), source, time.perf_counter() - started)
+
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pool.submit(self._call, key, message)
+                self._pending[key] = future
+        try:
+            routed = future.result(timeout=self.budget)
+        except FutureTimeout:
+            self._count("timeout")
+            routed = None
+        except Exception:
+            self._count("error")
+            routed = None
+        if routed is None:
+            return Route(self.fallback(message), {}, "fallback", time.perf_counter() - started)
+        self._count("llm")
+        return Route(routed[0], dict(routed[1]), "llm", time.perf_counter() - started)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            counts = dict(self.counts)
+            entries = len(self._memory)
+        hits = counts["memory"] + counts["disk"]
+        total = hits + counts["llm"] + counts["timeout"] + counts["error"] + counts["invalid"]
+        return {**counts, "entries": entries, "requests": total, "hit_rate": hits / total if total else 0.0}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._disk.clear()
+            self.counts = dict.fromkeys(self.counts, 0)
+        if self.cache_path is not None and self.cache_path.exists():
+            self.cache_path.unlink()
+
+    def _lookup(self, key: str) -> Tuple[Optional[Tuple[str, Dict[str, Any]]], str]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.counts["memory"] += 1
+                return self._memory[key], "memory"
+            if key in self._disk:
+                self._remember(key, self._disk[key])
+                self.counts["disk"] += 1
+                return self._disk[key], "disk"
+        return None, ""
+
+    def _call(self, key: str, message: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        try:
+            routed = parse_route(self._transport.complete(self.model, message))
+            if routed is None:
+                self._count("invalid")
+                return None
+            with self._lock:
+                self._remember(key, routed)
+                self._disk[key] = routed
+            self._append_disk(key, routed)
+            return routed
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def _remember(self, key: str, routed: Tuple[str, Dict[str, Any]]) -> None:
+        self._memory[key] = routed
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.cache_size:
+            self._memory.popitem(last=False)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counts[name] += 1
+
+    def _load_disk(self) -> None:
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            lines = self.cache_path.read_text().splitlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                row = json.loads(line)
+                self._disk[row["key"]] = (row["intent"], row.get("params") or {})
+            except (ValueError, KeyError, TypeError):
+                continue  # a torn last line from an interrupted write
+
+    def _append_disk(self, key: str, routed: Tuple[str, Dict[str, Any]]) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.cache_path.open("a") as handle:
+                handle.write(json.dumps({"key": key, "intent": routed[0], "params": routed[1]}) + "\n")
+        except OSError:
+            pass
+
+
+_ROUTERS: Dict[Tuple[str, Optional[str], str], IntentRouter] = {}
+_ROUTERS_LOCK = threading.Lock()
+
+
+def get_router(
+    api_key: str, fallback: Callable[[str], str], base_url: Optional[str] = None, model: str = DEFAULT_MODEL
+) -> IntentRouter:
+    """Process-wide router per endpoint, so the client and caches are shared by every session."""
+    key = (api_key, base_url, model)
+    with _ROUTERS_LOCK:
+        router = _ROUTERS.get(key)
+        if router is None:
+            router = IntentRouter(api_key, fallback, base_url=base_url, model=model, cache_path=default_cache_path())
+            _ROUTERS[key] = router
+        return router
@@ -0,0 +1,192 @@
+"""Content-addressed memoization for QuantHub analytics shared across pages."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import analytics, sharding
+from .flow_index import FlowIndex
+from .perf import span
+
+
+SNAPSHOT_ATTR = "snapshot_version"
+
+# id(frame) -> (weakref to the stamped frame, version). Pandas copies ``attrs``
+# into every derived frame, so only this registry says which object was stamped.
+_STAMPED: Dict[int, Tuple["weakref.ref[pd.DataFrame]", str]] = {}
+_STAMPED_LOCK = threading.Lock()
+
+
+def _unstamp(key: int, ref: "weakref.ref[pd.DataFrame]") -> None:
+    with _STAMPED_LOCK:
+        if key in _STAMPED and _STAMPED[key][0] is ref:
+            del _STAMPED[key]
+
+
+def stamp_snapshot(df: pd.DataFrame, version: str) -> pd.DataFrame:
+    """Tag a snapshot frame so it fingerprints by version without hashing content.
+
+    Frames derived from it inherit the version for cache invalidation, but are
+    still keyed by their content.
+    """
+    df.attrs[SNAPSHOT_ATTR] = version
+    key = id(df)
+    ref = weakref.ref(df, lambda ref, key=key: _unstamp(key, ref))
+    with _STAMPED_LOCK:
+        _STAMPED[key] = (ref, version)
+    return df
+
+
+def _stamped_version(df: pd.DataFrame) -> Optional[str]:
+    entry = _STAMPED.get(id(df))
+    if entry is None or entry[0]() is not df:
+        return None
+    return entry[1]
+
+
+def frame_fingerprint(df: pd.DataFrame, by_content: bool = False) -> Tuple[Hashable, ...]:
+    # The stamped snapshot frame itself is identified by its version; anything
+    # else, including slices and ``assign``/``groupby`` results that inherited
+    # the stamp through ``attrs``, is keyed by a hash of its content.
+    digest = hashlib.blake2b(digest_size=16)
+    version = df.attrs.get(SNAPSHOT_ATTR)
+    stamped = None if by_content else _stamped_version(df)
+    if stamped is not None and stamped == version:
+        digest.update(np.ascontiguousarray(df.index.to_numpy()).tobytes())
+    else:
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return ("frame", version, df.shape, tuple(df.columns), digest.hexdigest())
+
+
+def _arg_key(value: Any, by_content: bool = False) -> Tuple[Optional[str], Hashable]:
+    if isinstance(value, pd.DataFrame):
+        fingerprint = frame_fingerprint(value, by_content)
+        return fingerprint[1], fingerprint
+    if isinstance(value, (list, dict, set)):
+        return None, repr(value)
+    return None, value
+
+
+class AnalyticsCache:
+    """Bounded LRU of analytics results keyed by input fingerprints.
+
+    Entries remember the snapshot versions they were computed from, so a new
+    snapshot for a source drops everything derived from the one it replaces.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Set[str]]]" = OrderedDict()
+        self._current: Dict[Hashable, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def put(self, key: Hashable, value: Any, versions: Set[str]) -> None:
+        with self._lock:
+            self._entries[key] = (value, versions)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, version: str) -> int:
+        with self._lock:
+            stale = [key for key, (_, versions) in self._entries.items() if version in versions]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def observe_snapshot(self, source: Hashable, version: str) -> None:
+        with self._lock:
+            previous = self._current.get(source)
+            self._current[source] = version
+        if previous is not None and previous != version:
+            self.invalidate(previous)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+ANALYTICS_CACHE = AnalyticsCache()
+
+
+def memoize(
+    fn: Callable[..., Any], cache: AnalyticsCache = ANALYTICS_CACHE, by_content: bool = False
+) -> Callable[..., Any]:
+    """Wrap an analytics function; results are shared, so treat them as read-only.
+
+    ``by_content`` keys every frame argument by a hash of its values, even the
+    stamped snapshot frame itself.
+    """
+    label = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        versions: Set[str] = set()
+        parts = [fn.__module__, fn.__qualname__]
+        for value in list(args) + [kwargs[name] for name in sorted(kwargs)]:
+            version, key = _arg_key(value, by_content)
+            if version is not None:
+                versions.add(version)
+            parts.append(key)
+        parts.append(tuple(sorted(kwargs)))
+        key = tuple(parts)
+
+        rows = next((len(value) for value in args if isinstance(value, pd.DataFrame)), None)
+        with span(label, rows) as info:
+            found, result = cache.get(key)
+            if found:
+                info["cached"] = True
+                return result
+            result = fn(*args, **kwargs)
+        cache.put(key, result, versions)
+        return result
+
+    wrapper.uncached = fn  # type: ignore[attr-defined]
+    return wrapper
+
+
+flow_by_minute = memoize(analytics.flow_by_minute)
+kpi_summary = memoize(analytics.kpi_summary)
+top_strikes = memoize(analytics.top_strikes)
+sweep_heatmap = memoize(analytics.sweep_heatmap)
+unusual_scores = memoize(analytics.unusual_scores)
+compute_gex = memoize(analytics.compute_gex)
+gex_book = memoize(sharding.gex_book)
+top_prints = memoize(sharding.top_prints)
+flow_index = memoize(FlowIndex)
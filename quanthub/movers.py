@@ -0,0 +1,167 @@
+"""Incremental top-K premium prints ("movers") for QuantHub demo."""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from collections import OrderedDict
+from itertools import chain
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .tape import TapeCursor
+
+
+DEFAULT_K = 8
+HISTORY_MINUTES = 1440  # minute bins kept for windowed queries
+MOVER_COLUMNS = ("timestamp", "ticker", "type", "side", "strike", "expiry", "premium", "tags")
+
+Entry = Tuple[float, int, tuple]  # (premium, arrival sequence, row)
+
+
+class TopK:
+    """Bounded min-heap holding the ``k`` largest entries seen so far."""
+
+    __slots__ = ("k", "_heap")
+
+    def __init__(self, k: int) -> None:
+        self.k = k
+        self._heap: List[Entry] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, entry: Entry) -> None:
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def entries(self) -> List[Entry]:
+        return self._heap
+
+
+class MoversTracker:
+    """Largest prints by premium, market-wide and per ticker, kept as trades arrive.
+
+    Each batch past the ``TapeCursor`` is reduced to the top ``k`` rows of
+    every (minute, ticker) group with ``argpartition``; only those can ever
+    rank, and they are pushed into bounded heaps for the whole tape, each
+    ticker and each minute bin. Reading the top prints costs O(k log k), or
+    O(minutes * k) for a window, independent of tape length.
+    """
+
+    def __init__(self, k: int = DEFAULT_K, history_minutes: int = HISTORY_MINUTES) -> None:
+        self.k = k
+        self.history_minutes = history_minutes
+        self.cursor = TapeCursor()
+        self.version: Optional[str] = None
+        self.columns: List[str] = []
+        self._market = TopK(k)
+        self._tickers: Dict[str, TopK] = {}
+        # minute -> {None: market heap, ticker: heap}, oldest first
+        self._minutes: "OrderedDict[np.datetime64, Dict[Optional[str], TopK]]" = OrderedDict()
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def update(self, trades_df: pd.DataFrame, version: Optional[Hashable] = None) -> int:
+        """Absorb prints past the cursor; returns how many were new.
+
+        A repeated ``version`` skips the tape entirely, so reruns against the
+        same snapshot cost nothing.
+        """
+        with self._lock:
+            if version is not None and version == self.version:
+                return 0
+            self.version = version
+            batch = self.cursor.take(trades_df)
+            if batch.empty:
+                return 0
+            self._absorb(batch)
+            self._expire()
+        return len(batch)
+
+    def top(
+        self, k: Optional[int] = None, ticker: Optional[str] = None, minutes: Optional[int] = None
+    ) -> pd.DataFrame:
+        """The ``k`` largest prints, largest first.
+
+        ``minutes`` limits the result to the last that many minute bins up to
+        the newest print, e.g. ``minutes=15`` for the last 15 minutes. ``k``
+        cannot exceed the tracker's own ``k``, the most prints it keeps.
+        """
+        if k is None:
+            k = self.k
+        elif k > self.k:
+            raise ValueError(f"MoversTracker keeps the top {self.k} prints; asked for {k}")
+        with self._lock:
+            if minutes is None:
+                heap = self._market if ticker is None else self._tickers.get(ticker)
+                entries = list(heap.entries()) if heap is not None else []
+            else:
+                entries = list(chain.from_iterable(self._window(ticker, minutes)))
+            columns = list(self.columns)
+        rows = [entry[2] for entry in heapq.nlargest(k, entries)]
+        return pd.DataFrame(rows, columns=columns)
+
+    def _window(self, ticker: Optional[str], minutes: int) -> List[List[Entry]]:
+        if not self._minutes:
+            return []
+        start = next(reversed(self._minutes)) - np.timedelta64(minutes - 1, "m")
+        heaps = []
+        for minute in reversed(self._minutes):
+            if minute < start:
+                break
+            heap = self._minutes[minute].get(ticker)
+            if heap is not None:
+                heaps.append(heap.entries())
+        return heaps
+
+    def _absorb(self, batch: pd.DataFrame) -> None:
+        if not self.columns:
+            self.columns = [column for column in MOVER_COLUMNS if column in batch]
+        premium = batch["premium"].to_numpy(dtype=float)
+        minute = batch["timestamp"].to_numpy().astype("datetime64[m]")
+        ticker_codes, tickers = pd.factorize(batch["ticker"].astype(str))
+        minute_codes, minutes = pd.factorize(minute)
+
+        rows = self._candidates(premium, minute_codes * len(tickers) + ticker_codes)
+        values = batch[self.columns].iloc[rows]
+        for position, row in zip(rows, values.itertuples(index=False, name=None)):
+            entry = (float(premium[position]), self._sequence, row)
+            self._sequence += 1
+            ticker = tickers[ticker_codes[position]]
+            bins = self._minutes.get(minutes[minute_codes[position]])
+            if bins is None:
+                bins = self._minutes[minutes[minute_codes[position]]] = {None: TopK(self.k)}
+            self._market.push(entry)
+            self._heap(self._tickers, ticker).push(entry)
+            bins[None].push(entry)
+            self._heap(bins, ticker).push(entry)
+
+    def _candidates(self, premium: np.ndarray, groups: np.ndarray) -> np.ndarray:
+        """Positions of the top ``k`` rows of every group, in tape order."""
+        order = np.argsort(groups, kind="stable")
+        bounds = np.flatnonzero(np.diff(groups[order])) + 1
+        starts, stops = np.r_[0, bounds], np.r_[bounds, len(order)]
+        keep = np.ones(len(order), dtype=bool)
+        for start, stop in zip(starts[stops - starts > self.k], stops[stops - starts > self.k]):
+            members = order[start:stop]
+            keep[members] = False
+            keep[members[np.argpartition(-premium[members], self.k - 1)[: self.k]]] = True
+        return np.flatnonzero(keep)
+
+    def _heap(self, heaps: Dict, key: Optional[str]) -> TopK:
+        heap = heaps.get(key)
+        if heap is None:
+            heap = heaps[key] = TopK(self.k)
+        return heap
+
+    def _expire(self) -> None:
+        if not self._minutes:
+            return
+        cutoff = next(reversed(self._minutes)) - np.timedelta64(self.history_minutes, "m")
+        while self._minutes and next(iter(self._minutes)) <= cutoff:
+            self._minutes.popitem(last=False)
@@ -0,0 +1,204 @@
+"""Lightweight timing spans and rolling latency stats for QuantHub hot paths."""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+PERF_DIR_ENV = "QUANTHUB_PERF_DIR"
+WINDOW = 512  # recent samples kept per span name for percentiles
+PROMETHEUS_EVERY = 10.0  # seconds between textfile rewrites
+
+
+@dataclass
+class Span:
+    name: str
+    seconds: float
+    rows: Optional[int] = None
+    cached: bool = False
+    run: Optional[str] = None
+    at: float = field(default_factory=time.time)
+
+
+@dataclass
+class _Series:
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=WINDOW))
+    count: int = 0
+    cached: int = 0
+    seconds: float = 0.0
+    rows: int = 0
+
+
+class _Run(list):
+    """Spans of one script rerun, tagged with its id."""
+
+    run_id: Optional[str] = None
+
+
+_CURRENT_RUN: contextvars.ContextVar[Optional[_Run]] = contextvars.ContextVar("quanthub_perf_run", default=None)
+
+
+class PerfRecorder:
+    """Process-wide span sink: rolling per-name stats plus the spans of each rerun.
+
+    Recording is a clock read, a lock and a deque append. Cache hits are
+    counted but kept out of the latency samples, so percentiles describe the
+    work actually done.
+    """
+
+    def __init__(self, out_dir: Optional[str] = None) -> None:
+        self.out_dir = Path(out_dir) if out_dir else None
+        self._series: Dict[str, _Series] = defaultdict(_Series)
+        self._lock = threading.Lock()
+        self._last_prometheus = 0.0
+
+    def record(self, span: Span) -> None:
+        run = _CURRENT_RUN.get()
+        if run is not None:
+            span.run = run.run_id
+            run.append(span)
+        with self._lock:
+            series = self._series[span.name]
+            series.count += 1
+            series.rows += span.rows or 0
+            if span.cached:
+                series.cached += 1
+            else:
+                series.samples.append(span.seconds)
+                series.seconds += span.seconds
+
+    def summary(self) -> pd.DataFrame:
+        with self._lock:
+            rows = []
+            for name, series in sorted(self._series.items()):
+                samples = np.fromiter(series.samples, dtype=float)
+                p50, p95 = np.percentile(samples, [50, 95]) if len(samples) else (np.nan, np.nan)
+                rows.append(
+                    {
+                        "name": name,
+                        "calls": series.count,
+                        "cache_hits": series.cached,
+                        "p50_ms": p50 * 1e3,
+                        "p95_ms": p95 * 1e3,
+                        "total_s": series.seconds,
+                        "rows": series.rows,
+                    }
+                )
+        return pd.DataFrame(rows, columns=["name", "calls", "cache_hits", "p50_ms", "p95_ms", "total_s", "rows"])
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def flush(self, spans: List[Span]) -> None:
+        """Append ``spans`` as JSON lines and refresh the Prometheus textfile, if an output dir is set."""
+        if self.out_dir is None:
+            return
+        try:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            if spans:
+                with (self.out_dir / "spans.jsonl").open("a") as handle:
+                    handle.writelines(json.dumps(asdict(span)) + "\n" for span in spans)
+            now = time.monotonic()
+            if now - self._last_prometheus >= PROMETHEUS_EVERY:
+                self._last_prometheus = now
+                self.write_prometheus(self.out_dir / "quanthub.prom")
+        except OSError:
+            pass
+
+    def write_prometheus(self, path: Path) -> None:
+        lines = [
+            "# HELP quanthub_span_seconds Wall time of QuantHub hot-path spans (cache misses).",
+            "# TYPE quanthub_span_seconds summary",
+        ]
+        table = self.summary()
+        for row in table.itertuples(index=False):
+            label = row.name.replace("\\", "\\\\").replace('"', '\\"')
+            if not np.isnan(row.p50_ms):
+                lines.append(f'quanthub_span_seconds{{name="{label}",quantile="0.5"}} {row.p50_ms / 1e3:.6g}')
+                lines.append(f'quanthub_span_seconds{{name="{label}",quantile="0.95"}} {row.p95_ms / 1e3:.6g}')
+            lines.append(f'quanthub_span_seconds_sum{{name="{label}"}} {row.total_s:.6g}')
+            lines.append(f'quanthub_span_seconds_count{{name="{label}"}} {row.calls - row.cache_hits}')
+        lines.append("# TYPE quanthub_span_cache_hits_total counter")
+        lines.extend(f'quanthub_span_cache_hits_total{{name="{r.name}"}} {r.cache_hits}' for r in table.itertuples())
+        lines.append("# TYPE quanthub_span_rows_total counter")
+        lines.extend(f'quanthub_span_rows_total{{name="{r.name}"}} {r.rows}' for r in table.itertuples())
+        # Textfile collectors may read at any time: write then rename.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        with os.fdopen(fd, "w") as handle:
+            handle.write("\n".join(lines) + "\n")
+        os.replace(tmp, path)
+
+
+RECORDER = PerfRecorder(os.environ.get(PERF_DIR_ENV))
+
+
+def _rows(value: Any) -> Optional[int]:
+    return len(value) if isinstance(value, (pd.DataFrame, pd.Series)) else None
+
+
+@contextmanager
+def span(name: str, rows: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Time a block; set ``info["rows"]`` / ``info["cached"]`` inside it to annotate the span."""
+    info: Dict[str, Any] = {"rows": rows, "cached": False}
+    started = time.perf_counter()
+    try:
+        yield info
+    finally:
+        RECORDER.record(Span(name, time.perf_counter() - started, info["rows"], info["cached"]))
+
+
+def timed(name: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator form of ``span``; rows come from the first DataFrame/Series argument."""
+
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        label = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            rows = next((_rows(value) for value in args if _rows(value) is not None), None)
+            with span(label, rows):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def begin_run(run_id: str) -> List[Span]:
+    """Start collecting this thread's spans for one rerun; returns the new (empty) span list."""
+    run = _Run()
+    run.run_id = run_id
+    _CURRENT_RUN.set(run)
+    return run
+
+
+def finish_run(run: Optional[List[Span]]) -> None:
+    if run:
+        RECORDER.flush(list(run))
+
+
+def run_totals(run: Optional[List[Span]]) -> pd.DataFrame:
+    """Per-name totals for one rerun, slowest first."""
+    frame = pd.DataFrame(
+        [{"name": s.name, "ms": s.seconds * 1e3, "rows": s.rows or 0, "cached": s.cached} for s in run or []],
+        columns=["name", "ms", "rows", "cached"],
+    )
+    grouped = frame.groupby("name", as_index=False).agg(
+        calls=("ms", "size"), ms=("ms", "sum"), rows=("rows", "sum"), cache_hits=("cached", "sum")
+    )
+    return grouped.sort_values("ms", ascending=False, ignore_index=True)
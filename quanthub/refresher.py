@@ -0,0 +1,173 @@
+"""Process-wide background refresh publishing shared snapshots for QuantHub demo."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Callable, Dict, Hashable, Mapping, Optional
+
+
+DEFAULT_INTERVAL = 5.0
+DEFAULT_IDLE_SECONDS = 300.0
+
+
+@dataclass(frozen=True)
+class PublishedSnapshot:
+    """One refresh result; the bundle mapping is read-only and never replaced in place."""
+
+    bundle: Mapping[str, object]
+    sequence: int
+    published_at: datetime
+    load_seconds: float
+
+
+class RefreshWorker:
+    """Daemon thread that reloads data on a schedule and publishes the result.
+
+    Every session reads ``latest()`` instead of loading on its own, so the
+    load cost per interval is one call to ``load`` however many sessions are
+    connected. ``load`` returning ``None`` or raising keeps the previous
+    snapshot in place. With ``idle_timeout`` set, the worker stops itself
+    once nobody has called ``latest()`` for that long. ``on_stop`` runs on
+    the worker thread as it exits, to release what ``load`` reads from.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[], Optional[Dict[str, object]]],
+        interval: float = DEFAULT_INTERVAL,
+        name: str = "quanthub-refresh",
+        idle_timeout: Optional[float] = None,
+        on_stop: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.interval = interval
+        self.name = name
+        self.idle_timeout = idle_timeout
+        self.loads = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self.last_read = time.monotonic()
+        self._load = load
+        self._on_stop = on_stop
+        self._snapshot: Optional[PublishedSnapshot] = None
+        self._published = threading.Condition()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def idle(self) -> bool:
+        return self.idle_timeout is not None and time.monotonic() - self.last_read > self.idle_timeout
+
+    def start(self) -> "RefreshWorker":
+        if not self.running:
+            self.last_read = time.monotonic()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def refresh_now(self) -> None:
+        """Wake the worker early instead of waiting out the interval."""
+        self._wake.set()
+
+    def latest(self, timeout: Optional[float] = 30.0) -> Optional[PublishedSnapshot]:
+        """Most recent snapshot, waiting up to ``timeout`` for the first load attempt."""
+        self.last_read = time.monotonic()
+        with self._published:
+            if self._snapshot is None and timeout:
+                self._published.wait_for(lambda: self.loads > 0 or not self.running, timeout)
+            return self._snapshot
+
+    def stats(self) -> Dict[str, object]:
+        snapshot = self._snapshot
+        return {
+            "running": self.running,
+            "loads": self.loads,
+            "errors": self.errors,
+            "sequence": snapshot.sequence if snapshot else 0,
+            "published_at": snapshot.published_at if snapshot else None,
+            "load_seconds": snapshot.load_seconds if snapshot else None,
+            "last_error": self.last_error,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set() and not self.idle:
+            self._refresh()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+        if self._on_stop is not None:
+            self._on_stop()
+        with self._published:
+            self._published.notify_all()
+
+    def _refresh(self) -> None:
+        started = time.perf_counter()
+        try:
+            bundle = self._load()
+        except Exception as exc:  # keep serving the previous snapshot
+            self.errors += 1
+            self.last_error = repr(exc)
+            bundle = None
+        with self._published:
+            self.loads += 1
+            if bundle is None:
+                self._published.notify_all()
+                return
+            sequence = self._snapshot.sequence + 1 if self._snapshot else 1
+            self._snapshot = PublishedSnapshot(
+                bundle=MappingProxyType(dict(bundle)),
+                sequence=sequence,
+                published_at=datetime.now(),
+                load_seconds=time.perf_counter() - started,
+            )
+            self._published.notify_all()
+
+
+class WorkerRegistry:
+    """Keyed, bounded set of running ``RefreshWorker``s.
+
+    ``get`` starts a worker per key on first use. Workers that stopped (idle
+    or failed) are dropped on the next ``get``, and past ``max_workers`` the
+    least recently used one is stopped, so the data a worker holds is freed
+    once nobody reads it.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.max_workers = max_workers
+        self._workers: "OrderedDict[Hashable, RefreshWorker]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+    def get(self, key: Hashable, build: Callable[[], RefreshWorker]) -> RefreshWorker:
+        with self._lock:
+            for stale in [k for k, worker in self._workers.items() if not worker.running]:
+                del self._workers[stale]
+            worker = self._workers.get(key)
+            if worker is None:
+                worker = self._workers[key] = build().start()
+            worker.last_read = time.monotonic()
+            self._workers.move_to_end(key)
+            evicted = []
+            while len(self._workers) > self.max_workers:
+                evicted.append(self._workers.popitem(last=False)[1])
+        for old in evicted:
+            old.stop(timeout=0)
+        return worker
+
@@ -0,0 +1,267 @@
+"""Paced replay of recorded or generated trade tapes as a QuantHub live source."""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .data_mock import LiveDelta, MockBundle, TICKERS, generate_chain_df, generate_session_tape
+from .tape import compact_trades
+from .tape_dataset import read_tape
+
+
+REPLAY_TAPE_ENV = "QUANTHUB_REPLAY_TAPE"
+SPEEDS: Dict[str, Optional[float]] = {"1x": 1.0, "10x": 10.0, "60x": 60.0, "Max": None}
+# scenario -> (sessions, trades per session, profile of the last session)
+SCENARIOS: Dict[str, Tuple[int, int, str]] = {
+    "Multi-day": (3, 20_000, "normal"),
+    "Heavy open": (1, 60_000, "heavy_open"),
+    "Expiry day": (2, 20_000, "expiry"),
+}
+STORED_SCENARIO = "Stored tape"
+DEFAULT_WARMUP = pd.Timedelta(minutes=15)  # tape loaded up front as the initial snapshot
+# Heavy open is about its first 30 minutes, so all of it is replayed.
+SCENARIO_WARMUP: Dict[str, pd.Timedelta] = {"Heavy open": pd.Timedelta(0)}
+MAX_PENDING = 64  # batches buffered between the replay thread and the consumer
+MAX_BATCH_ROWS = 5_000  # rows per coalesced batch at "Max" speed
+
+
+@dataclass(frozen=True)
+class ReplayConfig:
+    scenario: str = "Multi-day"
+    speed: str = "10x"
+
+
+@dataclass
+class ReplayBatch:
+    sim_time: pd.Timestamp  # end of the slice of tape time this batch covers
+    trades_df: pd.DataFrame
+    price_df: pd.DataFrame
+    lag: float  # wall seconds behind schedule when emitted
+
+
+def scenarios() -> List[str]:
+    """Scenario names, with ``STORED_SCENARIO`` when ``QUANTHUB_REPLAY_TAPE`` is set."""
+    names = list(SCENARIOS)
+    if os.environ.get(REPLAY_TAPE_ENV):
+        names.append(STORED_SCENARIO)
+    return names
+
+
+def _no_prices() -> pd.DataFrame:
+    return pd.DataFrame({"timestamp": pd.Series(dtype="datetime64[ns]"), "ticker": [], "price": []})
+
+
+def load_tape(path: str | Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Trades (and price bars, if stored alongside as ``<name>.prices.<ext>``) from Parquet, Arrow or CSV.
+
+    A directory is read as a dataset written by ``tape_dataset.generate_dataset``.
+    """
+    path = Path(path)
+    if path.is_dir():
+        trades_df = compact_trades(read_tape(path))
+        return trades_df, _no_prices()
+
+    def read(target: Path) -> pd.DataFrame:
+        if target.suffix == ".parquet":
+            return pd.read_parquet(target)
+        if target.suffix in (".arrow", ".feather"):
+            return pd.read_feather(target)
+        return pd.read_csv(target, parse_dates=["timestamp"])
+
+    trades_df = compact_trades(read(path)).sort_values("timestamp", kind="stable", ignore_index=True)
+    prices_path = path.with_name(f"{path.stem}.prices{path.suffix}")
+    if prices_path.exists():
+        price_df = read(prices_path)
+        price_df["timestamp"] = pd.to_datetime(price_df["timestamp"])
+        price_df = price_df.sort_values("timestamp", kind="stable", ignore_index=True)
+    else:
+        price_df = _no_prices()
+    return trades_df, price_df
+
+
+class TapeReplay:
+    """Streams a tape in tape-time order, paced at ``speed`` x the original arrival rate.
+
+    The tape is cut into ``step``-long slices; a slice is due once its tape
+    time has elapsed at ``speed`` (``None`` runs as fast as possible). Quiet
+    stretches longer than ``max_gap`` (overnight, halts) are shortened to
+    ``max_gap`` so multi-day tapes do not sit idle. Unpaced, consecutive
+    slices are merged into batches of up to about ``max_batch_rows`` rows.
+
+    ``batches()`` is a plain generator and the consumer sets the pace. As a
+    live source (``initial()``/``poll()``, like ``MockLiveFeed``), a thread
+    fills a bounded queue; when the consumer falls behind the queue fills,
+    the thread blocks and ``stats()`` reports the stall and the lag.
+    """
+
+    def __init__(
+        self,
+        trades_df: pd.DataFrame,
+        price_df: pd.DataFrame,
+        chain_df: Optional[pd.DataFrame] = None,
+        speed: Optional[float] = 1.0,
+        step: pd.Timedelta = pd.Timedelta(seconds=1),
+        max_gap: pd.Timedelta = pd.Timedelta(minutes=1),
+        warmup: pd.Timedelta = DEFAULT_WARMUP,
+        max_pending: int = MAX_PENDING,
+        max_batch_rows: int = MAX_BATCH_ROWS,
+        seed: int = 0,
+    ) -> None:
+        self.trades_df = trades_df.reset_index(drop=True)
+        self.price_df = price_df.reset_index(drop=True)
+        self.chain_df = chain_df if chain_df is not None else pd.DataFrame()
+        self.speed = speed
+        self.step = step
+        self.max_gap = max_gap
+        self.warmup = warmup
+        self.max_batch_rows = max_batch_rows
+        self.seed = seed
+        self.start = self._first_time() + warmup
+        self.sim_time = self.start
+        self.emitted = 0
+        self.stalled_seconds = 0.0
+        self.lag = 0.0
+        self.done = False
+        self._pending: "queue.Queue[ReplayBatch]" = queue.Queue(maxsize=max_pending)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def batches(self, start: Optional[pd.Timestamp] = None) -> Iterator[ReplayBatch]:
+        """Yield slices of tape from ``start`` (default: after the warmup), each when it is due."""
+        start = self.start if start is None else start
+        step_ns = self.step.value
+        trade_bins = self._bins(self.trades_df, start, step_ns)
+        price_bins = self._bins(self.price_df, start, step_ns)
+        trade_from = np.searchsorted(trade_bins, 0)
+        price_from = np.searchsorted(price_bins, 0)
+        bins = np.union1d(trade_bins[trade_from:], price_bins[price_from:])
+        trade_edges = np.searchsorted(trade_bins, np.r_[bins, bins[-1:] + 1]) if len(bins) else []
+        price_edges = np.searchsorted(price_bins, np.r_[bins, bins[-1:] + 1]) if len(bins) else []
+
+        ends = np.arange(len(bins))
+        if not self.speed and len(bins):
+            # Unpaced, a slice per tape step only throttles the queue: coalesce
+            # slices into batches of about ``max_batch_rows`` instead.
+            rows = (trade_edges[1:] - trade_edges[0]) + (price_edges[1:] - price_edges[0])
+            cuts = np.searchsorted(rows, np.arange(self.max_batch_rows, rows[-1] + 1, self.max_batch_rows))
+            ends = np.union1d(cuts[cuts < len(bins)], [len(bins) - 1])
+        wall_start, due, previous, first = time.monotonic(), 0.0, 0, 0
+        gap_cap = self.max_gap.value / step_ns
+        for last in ends:
+            current = bins[last]
+            if self.speed:
+                due += min(current - previous, gap_cap) * self.step.total_seconds() / self.speed
+                wait = wall_start + due - time.monotonic()
+                if wait > 0 and self._stop.wait(wait):
+                    return
+            else:
+                wait = 0.0
+            previous = current
+            yield ReplayBatch(
+                sim_time=start + pd.Timedelta((int(current) + 1) * step_ns, "ns"),
+                trades_df=self.trades_df.iloc[trade_edges[first] : trade_edges[last + 1]],
+                price_df=self.price_df.iloc[price_edges[first] : price_edges[last + 1]],
+                lag=max(0.0, -wait),
+            )
+            first = last + 1
+            if self._stop.is_set():
+                return
+
+    def initial(self) -> MockBundle:
+        """Tape up to the end of the warmup; starts the replay thread."""
+        trades = self.trades_df[self.trades_df["timestamp"] < self.start]
+        prices = self.price_df[self.price_df["timestamp"] < self.start]
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._produce, name="quanthub-replay", daemon=True)
+            self._thread.start()
+        return MockBundle(
+            trades_df=trades, price_df=prices, chain_df=self.chain_df, seed=self.seed, updated_at=datetime.now()
+        )
+
+    def poll(self) -> LiveDelta:
+        """Every batch that is due and not yet handed out, as one delta."""
+        ready: List[ReplayBatch] = []
+        while True:
+            try:
+                ready.append(self._pending.get_nowait())
+            except queue.Empty:
+                break
+        if ready:
+            self.sim_time = ready[-1].sim_time
+            self.lag = ready[-1].lag
+        trades = [batch.trades_df for batch in ready if not batch.trades_df.empty]
+        prices = [batch.price_df for batch in ready if not batch.price_df.empty]
+        return LiveDelta(
+            trades_df=pd.concat(trades, ignore_index=True) if trades else self.trades_df.iloc[:0],
+            price_df=pd.concat(prices, ignore_index=True) if prices else self.price_df.iloc[:0],
+            as_of=datetime.now(),
+        )
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "sim_time": self.sim_time,
+            "emitted": self.emitted,
+            "pending": self._pending.qsize(),
+            "lag_s": self.lag,
+            "stalled_s": self.stalled_seconds,
+            "done": self.done,
+        }
+
+    def _produce(self) -> None:
+        for batch in self.batches():
+            try:
+                self._pending.put_nowait(batch)
+            except queue.Full:  # backpressure: wait for the consumer to catch up
+                blocked = time.monotonic()
+                while not self._stop.is_set():
+                    try:
+                        self._pending.put(batch, timeout=0.25)
+                        break
+                    except queue.Full:
+                        continue
+                self.stalled_seconds += time.monotonic() - blocked
+            self.emitted += 1
+        self.done = True
+
+    def _first_time(self) -> pd.Timestamp:
+        firsts = [df["timestamp"].iloc[0] for df in (self.trades_df, self.price_df) if not df.empty]
+        return pd.Timestamp(min(firsts)) if firsts else pd.Timestamp.now()
+
+    @staticmethod
+    def _bins(df: pd.DataFrame, start: pd.Timestamp, step_ns: int) -> np.ndarray:
+        offsets = df["timestamp"].to_numpy().astype("datetime64[ns]") - start.to_datetime64()
+        return offsets.astype(np.int64) // step_ns
+
+
+def replay_source(config: ReplayConfig, seed: int, tickers: Optional[List[str]] = None) -> TapeReplay:
+    """A ``TapeReplay`` for a sidebar scenario: a generated tape, or the file at ``QUANTHUB_REPLAY_TAPE``."""
+    tickers = tickers or TICKERS
+    if config.scenario == STORED_SCENARIO:
+        trades_df, price_df = load_tape(os.environ[REPLAY_TAPE_ENV])
+    else:
+        sessions, per_session, profile = SCENARIOS[config.scenario]
+        trades_df, price_df = generate_session_tape(seed, tickers, sessions, per_session, profile)
+    chain_tickers = [str(t) for t in trades_df["ticker"].cat.categories] if len(trades_df) else tickers
+    return TapeReplay(
+        trades_df,
+        price_df,
+        generate_chain_df(seed, chain_tickers),
+        speed=SPEEDS[config.speed],
+        warmup=SCENARIO_WARMUP.get(config.scenario, DEFAULT_WARMUP),
+        seed=seed,
+    )
@@ -0,0 +1,324 @@
+"""Ticker-sharded process-pool execution for QuantHub analytics."""
+
+from __future__ import annotations
+
+import gc
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import analytics
+
+
+WORKERS_ENV = "QUANTHUB_WORKERS"
+SHARD_MIN_ROWS = 250_000  # below this, process start-up and copies cost more than they save
+SHARDS_PER_WORKER = 4
+# GEX is a few vector ops per chain row, about a tenth of the cost of copying
+# the row into shared memory, so chains need this many times more rows.
+GEX_SHARD_FACTOR = 10
+
+
+@dataclass(frozen=True)
+class SharedColumn:
+    name: Any
+    block: str
+    dtype: str
+    categories: Optional[Tuple[Any, ...]] = None  # set when the buffer holds category codes
+
+
+@dataclass(frozen=True)
+class SharedFrameSpec:
+    """Picklable description of a frame whose column buffers live in shared memory."""
+
+    rows: int
+    columns: Tuple[SharedColumn, ...]
+    index: Optional[SharedColumn] = None
+
+
+class SharedFrame:
+    """Copy of a frame's columns in shared memory, optionally reordered on the way in.
+
+    Workers attach by block name and wrap the buffers without copying.
+    Categoricals travel as their code arrays and strings are factorized
+    first, so every column is a flat fixed-width buffer.
+    """
+
+    def __init__(self, df: pd.DataFrame, order: Optional[np.ndarray] = None) -> None:
+        self._blocks: List[SharedMemory] = []
+        try:
+            columns = tuple(self._share(name, df[name], order) for name in df.columns)
+            index = None
+            if not isinstance(df.index, pd.RangeIndex) and df.index.dtype.kind in "iufmM":
+                index = self._share(None, pd.Series(df.index), order)
+        except Exception:
+            self.close()
+            raise
+        self.spec = SharedFrameSpec(rows=len(df), columns=columns, index=index)
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def _share(self, name: Any, series: pd.Series, order: Optional[np.ndarray]) -> SharedColumn:
+        categories = None
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values, categories = series.cat.codes.to_numpy(), tuple(series.cat.categories)
+        elif series.dtype.kind in "biufmM":
+            values = series.to_numpy()
+        else:
+            codes, uniques = pd.factorize(series)
+            values, categories = codes, tuple(uniques)
+
+        block = SharedMemory(create=True, size=max(values.nbytes, 1))
+        self._blocks.append(block)
+        target = np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)
+        if order is None:
+            target[:] = values
+        else:
+            np.take(values, order, out=target)
+        del target
+        return SharedColumn(name=name, block=block.name, dtype=values.dtype.str, categories=categories)
+
+
+def attach_frame(spec: SharedFrameSpec) -> Tuple[pd.DataFrame, List[SharedMemory]]:
+    """Zero-copy frame over shared blocks; close the blocks once the frame is dropped."""
+    blocks: List[SharedMemory] = []
+
+    def column(shared: SharedColumn) -> Any:
+        block = _open_block(shared.block)
+        blocks.append(block)
+        values = np.ndarray((spec.rows,), dtype=np.dtype(shared.dtype), buffer=block.buf)
+        if shared.categories is not None:
+            return pd.Categorical.from_codes(values, categories=list(shared.categories), validate=False)
+        return values
+
+    data = {shared.name: column(shared) for shared in spec.columns}
+    index = pd.Index(column(spec.index)) if spec.index is not None else None
+    return pd.DataFrame(data, index=index, copy=False), blocks
+
+
+def _open_block(name: str) -> SharedMemory:
+    # The creating process owns the block's lifetime. Spawned pool workers
+    # share its resource tracker, where re-registering a name is a no-op.
+    try:
+        return SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        return SharedMemory(name=name)
+
+
+def _run_shard(
+    spec: SharedFrameSpec, fn: Callable[..., Any], items: Sequence[Tuple[str, int, int]], kwargs: Dict[str, Any]
+) -> bytes:
+    frame, blocks = attach_frame(spec)
+    try:
+        results = [(key, fn(frame.iloc[start:stop], **kwargs)) for key, start, stop in items]
+        # Serialize before detaching so no result can still point into a block.
+        payload = pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        del frame
+        results = None
+        gc.collect()
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass
+    return payload
+
+
+def balance_shards(bounds: np.ndarray, n_shards: int) -> List[List[int]]:
+    """Greedy largest-first assignment of groups (by row count) to ``n_shards`` shards."""
+    sizes = np.diff(bounds)
+    shards: List[List[int]] = [[] for _ in range(max(n_shards, 1))]
+    load = np.zeros(len(shards))
+    for group in np.argsort(-sizes, kind="stable"):
+        target = int(load.argmin())
+        shards[target].append(int(group))
+        load[target] += sizes[group]
+    return [sorted(shard) for shard in shards if shard]
+
+
+def default_workers() -> int:
+    configured = os.environ.get(WORKERS_ENV)
+    if configured:
+        return max(int(configured), 1)
+    return os.cpu_count() or 1
+
+
+class ShardedExecutor:
+    """Runs a per-group analytics function over ticker shards in a process pool.
+
+    The frame is copied once into shared memory, sorted by the group key, so
+    each group is a contiguous row range and a shard is a list of ranges.
+    Small inputs, or a single worker, run the same slicing in-process.
+    """
+
+    def __init__(self, workers: Optional[int] = None, min_rows: int = SHARD_MIN_ROWS) -> None:
+        self.workers = workers if workers is not None else default_workers()
+        self.min_rows = min_rows
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def map(self, fn: Callable[..., Any], df: pd.DataFrame, by: str = "ticker", **kwargs: Any) -> Dict[str, Any]:
+        """``{group: fn(rows of group, **kwargs)}`` in sorted group order.
+
+        ``fn`` must be a module-level function so it can be sent to workers.
+        """
+        codes, keys = pd.factorize(df[by], sort=True)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(keys) + 1))
+        labels = [str(key) for key in keys]
+
+        if not self.parallel(len(df)) or len(keys) < 2:
+            ordered = df.iloc[order]
+            return {labels[g]: fn(ordered.iloc[bounds[g] : bounds[g + 1]], **kwargs) for g in range(len(keys))}
+
+        shards = balance_shards(bounds, self.workers * SHARDS_PER_WORKER)
+        results: Dict[str, Any] = {}
+        with SharedFrame(df, order) as shared:
+            pool = self._executor()
+            futures = [
+                pool.submit(
+                    _run_shard,
+                    shared.spec,
+                    fn,
+                    [(labels[g], int(bounds[g]), int(bounds[g + 1])) for g in shard],
+                    kwargs,
+                )
+                for shard in shards
+            ]
+            for future in futures:
+                results.update(pickle.loads(future.result()))
+        return {label: results[label] for label in labels}
+
+    def map_ranges(self, fn: Callable[..., Any], df: pd.DataFrame, by: str = "ticker", **kwargs: Any) -> List[Any]:
+        """``fn`` over contiguous runs of whole groups, one call per shard, in group order.
+
+        For functions that group internally, where a call per group would cost
+        more than the grouping saves. Below the pool threshold this is
+        ``[fn(df, **kwargs)]``.
+        """
+        codes, keys = pd.factorize(df[by], sort=True)
+        if not self.parallel(len(df)) or len(keys) < 2:
+            return [fn(df, **kwargs)]
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(keys) + 1))
+        n_shards = min(self.workers * SHARDS_PER_WORKER, len(keys))
+        # Cut at the first group boundary past each equal-rows mark.
+        marks = np.linspace(0, len(df), n_shards + 1)[1:-1]
+        edges = np.unique(np.r_[0, bounds[np.searchsorted(bounds, marks)], len(df)])
+        with SharedFrame(df, order) as shared:
+            pool = self._executor()
+            futures = [
+                pool.submit(_run_shard, shared.spec, fn, [(i, int(start), int(stop))], kwargs)
+                for i, (start, stop) in enumerate(zip(edges[:-1], edges[1:]))
+            ]
+            return [pickle.loads(future.result())[0][1] for future in futures]
+
+    def parallel(self, rows: int) -> bool:
+        """Whether ``rows`` of input are worth sending to the pool."""
+        return self.workers > 1 and rows >= self.min_rows
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        # Spawned (not forked) workers: the app process runs Streamlit and
+        # refresh threads, which must not be duplicated mid-lock.
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context("spawn"))
+            return self._pool
+
+
+_EXECUTOR: Optional[ShardedExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_executor() -> ShardedExecutor:
+    """Process-wide executor sized by ``QUANTHUB_WORKERS`` (default: all cores)."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ShardedExecutor()
+        return _EXECUTOR
+
+
+def gex_by_ticker(chain_df: pd.DataFrame, executor: Optional[ShardedExecutor] = None) -> Dict[str, analytics.GexSummary]:
+    return (executor or get_executor()).map(analytics.compute_gex, chain_df)
+
+
+def flow_by_ticker(trades_df: pd.DataFrame, executor: Optional[ShardedExecutor] = None) -> Dict[str, pd.DataFrame]:
+    return (executor or get_executor()).map(analytics.flow_by_minute, trades_df)
+
+
+def top_strikes_by_ticker(
+    trades_df: pd.DataFrame, n: int = 10, executor: Optional[ShardedExecutor] = None
+) -> Dict[str, pd.DataFrame]:
+    return (executor or get_executor()).map(analytics.top_strikes, trades_df, n=n)
+
+
+def top_prints(trades_df: pd.DataFrame, n: int = 50, executor: Optional[ShardedExecutor] = None) -> pd.DataFrame:
+    """``analytics.top_prints``, ranked per run of tickers once the tape is large enough for the pool."""
+    parts = (executor or get_executor()).map_ranges(analytics.top_prints, trades_df, n=n)
+    if len(parts) == 1:
+        return parts[0]
+    return pd.concat(parts).sort_values("premium", ascending=False, kind="stable")
+
+
+def gex_book(chain_df: pd.DataFrame, executor: Optional[ShardedExecutor] = None) -> analytics.GexBook:
+    """``analytics.build_gex_book``, built per run of tickers once the chain is large enough for the pool."""
+    executor = executor or get_executor()
+    if not executor.parallel(len(chain_df) // GEX_SHARD_FACTOR):
+        return analytics.build_gex_book(chain_df)
+    return merge_gex_books(executor.map_ranges(analytics.build_gex_book, chain_df))
+
+
+def flow_by_minute(trades_df: pd.DataFrame, executor: Optional[ShardedExecutor] = None) -> pd.DataFrame:
+    """Market-wide ``analytics.flow_by_minute`` assembled from per-ticker shards."""
+    return merge_flows(flow_by_ticker(trades_df, executor).values())
+
+
+def kpi_summary(trades_df: pd.DataFrame, executor: Optional[ShardedExecutor] = None) -> Dict[str, float]:
+    """``analytics.kpi_summary`` from per-ticker accumulators merged on the way back."""
+    merged = analytics.KpiAccumulator()
+    for part in (executor or get_executor()).map(analytics.kpi_accumulator, trades_df).values():
+        merged.merge(part)
+    return merged.summary()
+
+
+def merge_flows(parts: Any) -> pd.DataFrame:
+    parts = [part for part in parts if not part.empty]
+    if not parts:
+        return analytics.flow_by_minute(pd.DataFrame(columns=["timestamp", "type", "premium"]))
+    merged = pd.concat(parts, ignore_index=True).groupby("minute", sort=True)[["CALL", "PUT"]].sum().reset_index()
+    merged["net_flow"] = merged["CALL"] - merged["PUT"]
+    return merged
+
+
+def merge_gex_books(parts: Any) -> analytics.GexBook:
+    parts = list(parts)
+    return analytics.GexBook(
+        by_expiry_strike=pd.concat([part.by_expiry_strike for part in parts], ignore_index=True),
+        by_strike=pd.concat([part.by_strike for part in parts], ignore_index=True),
+        summary=pd.concat([part.summary for part in parts], ignore_index=True),
+    )
@@ -0,0 +1,101 @@
+"""Mergeable streaming quantile sketch (KLL) for QuantHub tape statistics."""
+
+from __future__ import annotations
+
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+DEFAULT_K = 512  # ~0.5% rank error; the sketch holds O(k) values however long the tape
+
+
+class QuantileSketch:
+    """KLL sketch: approximate quantiles and ranks over a stream of floats.
+
+    Values enter level 0; a level that outgrows its capacity is sorted and
+    every other value (random offset) is promoted to the next level, where
+    each value stands for twice as many inputs. Batches are absorbed as
+    arrays, and two sketches merge by concatenating levels, so per-batch or
+    per-shard sketches combine into one for the whole tape.
+    """
+
+    def __init__(self, k: int = DEFAULT_K, seed: Optional[int] = 0) -> None:
+        self.k = k
+        self.count = 0
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+        self._sorted: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def size(self) -> int:
+        """Values retained across all levels."""
+        return sum(len(level) for level in self._levels)
+
+    def update(self, values: np.ndarray) -> "QuantileSketch":
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self._levels[0] = np.concatenate([self._levels[0], values])
+            self.count += len(values)
+            self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for h, level in enumerate(other._levels):
+            self._levels[h] = np.concatenate([self._levels[h], level])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return float("nan")
+        values, midpoints = self._cdf()
+        return float(np.interp(q * self.count, midpoints, values))
+
+    def rank(self, value: float) -> float:
+        """Estimated number of inputs below ``value``."""
+        if not self.count:
+            return 0.0
+        values, midpoints = self._cdf()
+        if value >= values[-1]:
+            return float(self.count)
+        return float(np.interp(value, values, midpoints, left=0.0))
+
+    def _capacity(self, h: int) -> int:
+        depth = len(self._levels) - 1 - h
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        self._sorted = None
+        h = 0
+        while h < len(self._levels):
+            level = self._levels[h]
+            if len(level) > self._capacity(h):
+                level = np.sort(level)
+                odd = len(level) % 2
+                if h + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                # An odd value out stays behind at weight 2**h, so no input weight is lost.
+                promoted = level[odd:][int(self._rng.integers(2)) :: 2]
+                self._levels[h] = level[:odd]
+                self._levels[h + 1] = np.concatenate([self._levels[h + 1], promoted])
+            h += 1
+
+    def _cdf(self) -> Tuple[np.ndarray, np.ndarray]:
+        # Each retained value stands for ``weight`` inputs centred on it; ranks
+        # interpolate between those centres rather than stepping by a weight.
+        if self._sorted is None:
+            values = np.concatenate(self._levels)
+            weights = np.concatenate([np.full(len(level), 2.0**h) for h, level in enumerate(self._levels)])
+            order = np.argsort(values, kind="stable")
+            weights = weights[order]
+            self._sorted = (values[order], np.cumsum(weights) - weights / 2)
+        return self._sorted
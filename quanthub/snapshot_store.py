@@ -0,0 +1,147 @@
+"""Memory-mapped Arrow IPC snapshot store for QuantHub demo bundles."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from .data_mock import CHAIN_GENERATOR_VERSION, MockBundle, generate_mock_bundle
+from .export import arrow_available
+
+
+SNAPSHOT_DIR_ENV = "QUANTHUB_SNAPSHOT_DIR"
+STORE_FORMAT = 1
+KEEP_SNAPSHOTS = 16
+
+Frames = Dict[str, pd.DataFrame]
+
+
+def default_root() -> Path:
+    return Path(os.environ.get(SNAPSHOT_DIR_ENV, Path.home() / ".quanthub" / "snapshots"))
+
+
+def snapshot_key(kind: str, *parts: object) -> str:
+    digest = hashlib.blake2b(repr((STORE_FORMAT,) + parts).encode(), digest_size=8).hexdigest()
+    return f"{kind}-{digest}"
+
+
+class SnapshotStore:
+    """One directory per snapshot version holding an uncompressed Arrow IPC file per frame.
+
+    Snapshots are written once (into a temp directory, then renamed into
+    place) and never modified, so any number of processes can memory-map
+    the same files. Reads are zero-copy: fixed-width columns and
+    categorical codes come back as read-only views over the page cache.
+    """
+
+    def __init__(self, root: Optional[Union[str, Path]] = None, keep: int = KEEP_SNAPSHOTS) -> None:
+        self.root = Path(root) if root is not None else default_root()
+        self.keep = keep
+
+    def path(self, key: str) -> Path:
+        return self.root / key
+
+    def exists(self, key: str) -> bool:
+        return (self.path(key) / "meta.json").exists()
+
+    def write(self, key: str, frames: Frames, meta: Optional[Dict[str, object]] = None) -> Path:
+        import pyarrow as pa
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=self.root, prefix=f".{key}-"))
+        try:
+            for name, df in frames.items():
+                table = pa.Table.from_pandas(df, preserve_index=True)
+                with pa.OSFile(str(staging / f"{name}.arrow"), "wb") as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+            # meta.json last: its presence marks a complete snapshot.
+            payload = {"format": STORE_FORMAT, "frames": list(frames), "meta": meta or {}}
+            (staging / "meta.json").write_text(json.dumps(payload, default=str))
+            try:
+                os.rename(staging, self.path(key))
+            except OSError:
+                if not self.exists(key):  # lost a race to another writer otherwise
+                    raise
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+        self.prune()
+        return self.path(key)
+
+    def read(self, key: str) -> Optional[Tuple[Frames, Dict[str, object]]]:
+        """Memory-map a snapshot, or ``None`` if it is missing or unreadable."""
+        import pyarrow as pa
+
+        try:
+            payload = json.loads((self.path(key) / "meta.json").read_text())
+            if payload.get("format") != STORE_FORMAT:
+                return None
+            frames = {}
+            for name in payload["frames"]:
+                # The mapping stays open for as long as any column references it.
+                source = pa.memory_map(str(self.path(key) / f"{name}.arrow"), "r")
+                table = pa.ipc.open_file(source).read_all()
+                frames[name] = table.to_pandas(split_blocks=True)
+        except (OSError, ValueError, KeyError, pa.ArrowException):
+            return None
+        return frames, payload.get("meta", {})
+
+    def load_or_build(
+        self, key: str, build: Callable[[], Tuple[Frames, Dict[str, object]]]
+    ) -> Tuple[Frames, Dict[str, object]]:
+        found = self.read(key)
+        if found is not None:
+            return found
+        frames, meta = build()
+        try:
+            self.write(key, frames, meta)
+        except OSError:
+            return frames, meta
+        # Serve the mapped copy so every process shares the same pages.
+        return self.read(key) or (frames, meta)
+
+    def keys(self) -> Iterable[str]:
+        if not self.root.exists():
+            return []
+        entries = [entry for entry in self.root.iterdir() if entry.is_dir() and not entry.name.startswith(".")]
+        return [entry.name for entry in sorted(entries, key=lambda entry: entry.stat().st_mtime, reverse=True)]
+
+    def prune(self) -> int:
+        """Drop the oldest snapshots beyond ``keep``; open mappings stay valid."""
+        stale = list(self.keys())[self.keep :]
+        for key in stale:
+            shutil.rmtree(self.path(key), ignore_errors=True)
+        return len(stale)
+
+
+def default_store() -> Optional[SnapshotStore]:
+    """A store under ``QUANTHUB_SNAPSHOT_DIR`` (or ``~/.quanthub/snapshots``); ``None`` without pyarrow."""
+    return SnapshotStore() if arrow_available() else None
+
+
+def load_mock_bundle(store: SnapshotStore, seed: int, tickers: List[str]) -> MockBundle:
+    """Mock bundle for today, generated once per machine and memory-mapped afterwards."""
+    key = snapshot_key("mock", seed, tuple(tickers), date.today().isoformat(), CHAIN_GENERATOR_VERSION)
+
+    def build() -> Tuple[Frames, Dict[str, object]]:
+        bundle = generate_mock_bundle(seed=seed, tickers=tickers)
+        frames = {"trades_df": bundle.trades_df, "price_df": bundle.price_df, "chain_df": bundle.chain_df}
+        return frames, {"seed": seed, "updated_at": bundle.updated_at.isoformat()}
+
+    frames, meta = store.load_or_build(key, build)
+    return MockBundle(
+        trades_df=frames["trades_df"],
+        price_df=frames["price_df"],
+        chain_df=frames["chain_df"],
+        seed=seed,
+        updated_at=datetime.fromisoformat(str(meta["updated_at"])),
+    )
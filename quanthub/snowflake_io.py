@@ -2,7 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+import hashlib
+import queue
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .tape import compact_trades
+
+
+DEFAULT_TABLES = {"trades": "TRADES", "price": "PRICES", "chain": "CHAIN"}
+
+# Placeholders per DB-API paramstyle, so the same queries run against a local
+# stand-in (sqlite3 is qmark) as well as Snowflake (pyformat by default).
+_PLACEHOLDERS = {"pyformat": "%(watermark)s", "format": "%s", "qmark": "?", "named": ":watermark"}
 
 
 def snowflake_available() -> bool:
@@ -14,38 +31,225 @@ def snowflake_available() -> bool:
         return False
 
 
-def fetch_snowflake_bundle(creds: Dict[str, str]) -> Optional[Dict[str, object]]:
-    if not snowflake_available():
-        return None
+class ConnectionPool:
+    """Long-lived DB-API connections handed out one caller at a time.
+
+    Connections are opened lazily up to ``max_size``. A connection whose use
+    raises is closed and dropped instead of being returned to the pool.
+    """
+
+    def __init__(self, connect: Callable[[], Any], max_size: int = 4, timeout: float = 30.0) -> None:
+        self._connect = connect
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._timeout = timeout
+        self.opened = 0
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        if not self._slots.acquire(timeout=self._timeout):
+            raise TimeoutError("No pooled connection available")
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+                self.opened += 1
+            try:
+                yield conn
+            except Exception:
+                _close_quietly(conn)
+                raise
+            self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        while True:
+            try:
+                _close_quietly(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+def _close_quietly(conn: Any) -> None:
     try:
-        import snowflake.connector
-        import pandas as pd
-
-        ctx = snowflake.connector.connect(
-            user=creds.get("user"),
-            password=creds.get("password"),
-            account=creds.get("account"),
-            warehouse=creds.get("warehouse"),
-            database=creds.get("database"),
-            schema=creds.get("schema"),
-        )
-        cursor = ctx.cursor()
-        cursor.execute("SELECT CURRENT_TIMESTAMP() as updated_at")
-        updated_at = cursor.fetch_pandas_all()["UPDATED_AT"].iloc[0]
-
-        # Placeholder queries for demo (optional)
-        trades_df = pd.DataFrame()
-        price_df = pd.DataFrame()
-        chain_df = pd.DataFrame()
-
-        cursor.close()
-        ctx.close()
+        conn.close()
+    except Exception:
+        pass
+
+
+def _fetch_frame(cursor: Any, batch_rows: int) -> pd.DataFrame:
+    # Snowflake cursors stream Arrow result batches; plain DB-API cursors are
+    # drained with fetchmany. Either way columns come back lower-cased.
+    if hasattr(cursor, "fetch_arrow_batches"):
+        batches = [batch.to_pandas() for batch in cursor.fetch_arrow_batches()]
+        frame = pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+    else:
+        columns = [col[0] for col in cursor.description]
+        chunks: List[pd.DataFrame] = []
+        while True:
+            rows = cursor.fetchmany(batch_rows)
+            if not rows:
+                break
+            chunks.append(pd.DataFrame.from_records(rows, columns=columns))
+        frame = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=columns)
+    return frame.rename(columns=str.lower)
+
+
+class SnowflakeSource:
+    """Pooled trade/price/chain reader with timestamp high-water marks.
+
+    Each ``fetch_bundle`` pulls only trades and price bars newer than the last
+    seen timestamp, merges them into the resident frames and re-reads the
+    (snapshot-style) chain.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        tables: Optional[Dict[str, str]] = None,
+        paramstyle: str = "pyformat",
+        batch_rows: int = 50_000,
+    ) -> None:
+        self.pool = pool
+        self.tables = {**DEFAULT_TABLES, **(tables or {})}
+        self.batch_rows = batch_rows
+        self._placeholder = _PLACEHOLDERS[paramstyle]
+        self._named = paramstyle in ("pyformat", "named")
+        self.watermarks: Dict[str, Optional[pd.Timestamp]] = {"trades": None, "price": None}
+        # Row hashes already pulled at each watermark, so rows that land later
+        # with a timestamp equal to it are still picked up exactly once.
+        self.seen_at_watermark: Dict[str, Counter] = {"trades": Counter(), "price": Counter()}
+        self.trades_df = pd.DataFrame()
+        self.price_df = pd.DataFrame()
+        self._lock = threading.Lock()
+
+    def fetch_bundle(self) -> Dict[str, object]:
+        # Watermarks and resident frames only move once every query and merge
+        # has succeeded, so a failed refresh re-reads the same rows next time.
+        with self._lock:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute("SELECT CURRENT_TIMESTAMP AS updated_at")
+                    updated_at = cursor.fetchone()[0]
+                    new_trades, (trades_mark, trades_seen) = self._pull_since(cursor, "trades")
+                    new_prices, (price_mark, price_seen) = self._pull_since(cursor, "price")
+                    cursor.execute(f"SELECT * FROM {self.tables['chain']}")
+                    chain_df = _fetch_frame(cursor, self.batch_rows)
+                finally:
+                    cursor.close()
+
+            trades_df = self._merge_trades(new_trades)
+            price_df = self.price_df
+            if not new_prices.empty:
+                new_prices["timestamp"] = pd.to_datetime(new_prices["timestamp"])
+                price_df = pd.concat([price_df, new_prices], ignore_index=True)
+            if not chain_df.empty and "expiry" in chain_df:
+                chain_df["expiry"] = pd.to_datetime(chain_df["expiry"])
+            chain_digest = hashlib.blake2b(
+                pd.util.hash_pandas_object(chain_df, index=False).to_numpy().tobytes(), digest_size=8
+            ).hexdigest()
+
+            self.trades_df, self.price_df = trades_df, price_df
+            self.watermarks = {"trades": trades_mark, "price": price_mark}
+            self.seen_at_watermark = {"trades": trades_seen, "price": price_seen}
 
         return {
             "trades_df": trades_df,
             "price_df": price_df,
             "chain_df": chain_df,
             "updated_at": updated_at,
+            "watermark": trades_mark,
+            # Changes to any of the three tables give a new version.
+            "source_version": f"{trades_mark}|{price_mark}|{chain_digest}",
+            "new_rows": len(new_trades),
         }
+
+    def _pull_since(self, cursor: Any, name: str) -> Tuple[pd.DataFrame, Tuple[Optional[pd.Timestamp], Counter]]:
+        """Unseen rows at or past the table's watermark, and the watermark state they advance it to."""
+        table = self.tables[name]
+        watermark, seen = self.watermarks[name], self.seen_at_watermark[name]
+        if watermark is None:
+            cursor.execute(f"SELECT * FROM {table} ORDER BY timestamp")
+        else:
+            value = watermark.isoformat(sep=" ")
+            params = {"watermark": value} if self._named else (value,)
+            cursor.execute(f"SELECT * FROM {table} WHERE timestamp >= {self._placeholder} ORDER BY timestamp", params)
+        frame = _fetch_frame(cursor, self.batch_rows)
+        if frame.empty:
+            return frame, (watermark, seen)
+
+        stamps = pd.to_datetime(frame["timestamp"]).to_numpy()
+        hashes = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+        if watermark is not None:
+            # Re-read rows at the watermark; drop as many copies of each as were already pulled.
+            remaining = Counter(seen)
+            keep = np.ones(len(frame), dtype=bool)
+            for i in np.flatnonzero(stamps == np.datetime64(watermark)):
+                key = int(hashes[i])
+                if remaining[key] > 0:
+                    remaining[key] -= 1
+                    keep[i] = False
+            frame, stamps, hashes = frame[keep].reset_index(drop=True), stamps[keep], hashes[keep]
+            if frame.empty:
+                return frame, (watermark, seen)
+
+        last = stamps.max()
+        at_last = Counter(hashes[stamps == last].tolist())
+        if watermark is not None and last == np.datetime64(watermark):
+            at_last = seen + at_last
+        return frame, (pd.Timestamp(last), at_last)
+
+    def _merge_trades(self, new_trades: pd.DataFrame) -> pd.DataFrame:
+        if new_trades.empty:
+            return self.trades_df
+        trades_df = self.trades_df
+        tickers = set(new_trades["ticker"].astype(str).unique())
+        if not trades_df.empty:
+            known = set(trades_df["ticker"].cat.categories)
+            if not tickers <= known:
+                trades_df = compact_trades(trades_df, tickers=known | tickers)
+            tickers |= known
+        new_trades = compact_trades(new_trades, tickers=tickers)
+        return pd.concat([trades_df, new_trades], ignore_index=True) if not trades_df.empty else new_trades
+
+
+_SOURCES: Dict[tuple, SnowflakeSource] = {}
+_SOURCES_LOCK = threading.Lock()
+
+
+def snowflake_source(creds: Dict[str, str], connect: Optional[Callable[[], Any]] = None, paramstyle: str = "pyformat") -> SnowflakeSource:
+    """Process-wide source per credential set; ``connect`` overrides the driver."""
+    key = tuple(sorted(creds.items()))
+    with _SOURCES_LOCK:
+        source = _SOURCES.get(key)
+        if source is None:
+            if connect is None:
+                import snowflake.connector
+
+                def connect() -> Any:
+                    return snowflake.connector.connect(
+                        user=creds.get("user"),
+                        password=creds.get("password"),
+                        account=creds.get("account"),
+                        warehouse=creds.get("warehouse"),
+                        database=creds.get("database"),
+                        schema=creds.get("schema"),
+                        client_session_keep_alive=True,
+                    )
+
+            tables = {name: creds[f"{name}_table"] for name in DEFAULT_TABLES if creds.get(f"{name}_table")}
+            source = SnowflakeSource(ConnectionPool(connect), tables=tables, paramstyle=paramstyle)
+            _SOURCES[key] = source
+        return source
+
+
+def fetch_snowflake_bundle(creds: Dict[str, str]) -> Optional[Dict[str, object]]:
+    if not snowflake_available():
+        return None
+    try:
+        return snowflake_source(creds).fetch_bundle()
     except Exception:
         return None
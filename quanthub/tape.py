@@ -0,0 +1,134 @@
+"""Compact columnar trade tape schema for QuantHub demo."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+TAPE_COLUMNS: List[str] = [
+    "timestamp",
+    "ticker",
+    "type",
+    "side",
+    "premium",
+    "strike",
+    "expiry",
+    "price",
+    "size",
+    "iv",
+    "delta",
+    "gamma",
+    "tags",
+    "sentiment",
+]
+
+# Fixed vocabularies keep category codes identical across producers and batches,
+# so concatenated tapes stay categorical instead of decaying to object.
+TAPE_CATEGORIES: Dict[str, List[str]] = {
+    "type": ["CALL", "PUT"],
+    "side": ["BUY", "SELL"],
+    "tags": ["sweep", "block", "split"],
+    "sentiment": ["bullish", "bearish"],
+}
+
+# Premium, strike and price stay float64: float32 cannot hold cents on large
+# prints, and strikes are group keys shown verbatim in blotters.
+TAPE_NUMERIC: Dict[str, str] = {
+    "premium": "float64",
+    "strike": "float64",
+    "price": "float64",
+    "size": "int32",
+    "iv": "float32",
+    "delta": "float32",
+    "gamma": "float32",
+}
+
+
+def ticker_dtype(tickers: Iterable[str]) -> pd.CategoricalDtype:
+    return pd.CategoricalDtype(sorted(set(tickers)))
+
+
+def compact_trades(trades_df: pd.DataFrame, tickers: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Normalize a trade tape into the compact schema.
+
+    Strings become categoricals, ``timestamp``/``expiry`` become datetime64 and
+    numeric columns are narrowed per ``TAPE_NUMERIC``. Columns outside the
+    schema are kept untouched. Already-compact frames pass through cheaply.
+    """
+    df = trades_df.copy()
+    if "timestamp" in df:
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+    if "expiry" in df:
+        df["expiry"] = pd.to_datetime(df["expiry"]).dt.normalize()
+    if "ticker" in df:
+        dtype = ticker_dtype(tickers if tickers is not None else df["ticker"].dropna().unique())
+        df["ticker"] = df["ticker"].astype(dtype)
+    for column, categories in TAPE_CATEGORIES.items():
+        if column in df:
+            df[column] = df[column].astype(pd.CategoricalDtype(categories))
+    for column, dtype in TAPE_NUMERIC.items():
+        if column in df:
+            df[column] = df[column].astype(dtype)
+    return df
+
+
+def memory_report(trades_df: pd.DataFrame, baseline_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """Per-column dtype and deep byte footprint, optionally against a baseline tape."""
+    usage = trades_df.memory_usage(index=False, deep=True)
+    report = pd.DataFrame(
+        {
+            "column": usage.index,
+            "dtype": [str(trades_df[c].dtype) for c in usage.index],
+            "bytes": usage.to_numpy(),
+        }
+    )
+    if baseline_df is not None:
+        baseline = baseline_df.memory_usage(index=False, deep=True)
+        report["baseline_bytes"] = baseline.reindex(usage.index).fillna(0).to_numpy().astype(np.int64)
+        report["ratio"] = report["baseline_bytes"] / report["bytes"].clip(lower=1)
+    total = {"column": "TOTAL", "dtype": "", "bytes": int(report["bytes"].sum())}
+    if baseline_df is not None:
+        total["baseline_bytes"] = int(report["baseline_bytes"].sum())
+        total["ratio"] = total["baseline_bytes"] / max(total["bytes"], 1)
+    return pd.concat([report, pd.DataFrame([total])], ignore_index=True)
+
+
+class TapeCursor:
+    """Read position in a trade tape that hands out each print at most once.
+
+    The cursor is the last timestamp consumed plus how many prints at that
+    timestamp were consumed, so re-reading the same or an overlapping tape
+    (reruns, reloads, replays) yields only rows not seen before.
+    """
+
+    def __init__(self, watermark: Optional[pd.Timestamp] = None, seen_at_watermark: int = 0) -> None:
+        self.watermark = watermark
+        self.seen_at_watermark = seen_at_watermark
+
+    def take(self, trades_df: pd.DataFrame) -> pd.DataFrame:
+        """Unseen rows of ``trades_df`` in timestamp order; advances the cursor."""
+        if trades_df["timestamp"].is_monotonic_increasing:
+            # Time-ordered tapes (mock, live buffers) skip the sort: unseen rows are a suffix.
+            batch = trades_df
+            if self.watermark is not None:
+                stamps = batch["timestamp"].to_numpy()
+                mark = np.datetime64(self.watermark)
+                first, past = np.searchsorted(stamps, mark, side="left"), np.searchsorted(stamps, mark, side="right")
+                batch = batch.iloc[min(first + self.seen_at_watermark, past) :]
+        else:
+            batch = trades_df.sort_values("timestamp", kind="stable")
+            if self.watermark is not None and not batch.empty:
+                stamps = batch["timestamp"].to_numpy()
+                mark = np.datetime64(self.watermark)
+                tied = np.flatnonzero(stamps == mark)[self.seen_at_watermark :]
+                batch = batch.iloc[np.sort(np.r_[tied, np.flatnonzero(stamps > mark)])]
+        if batch.empty:
+            return batch
+        last = pd.Timestamp(batch["timestamp"].iloc[-1])
+        tied = int((batch["timestamp"] == last).sum())
+        self.seen_at_watermark = self.seen_at_watermark + tied if last == self.watermark else tied
+        self.watermark = last
+        return batch
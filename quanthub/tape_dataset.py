@@ -0,0 +1,162 @@
+"""Chunked, parallel, out-of-core mock tape generation into partitioned Parquet/Arrow datasets."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .data_mock import BASE_PRICE, TICKERS, generate_trades_chunk
+
+
+DATASET_FORMAT = 1
+CHUNK_ROWS = 1_000_000  # ~60 MB per chunk in memory; each worker holds one at a time
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+MANIFEST = "_manifest.json"
+
+
+@dataclass(frozen=True)
+class TapeLayout:
+    """Everything the generated rows depend on; the same layout always yields the same dataset."""
+
+    seed: int
+    n_trades: int
+    chunk_rows: int = CHUNK_ROWS
+    sessions: int = 1
+    end: str = ""  # last session date (YYYY-MM-DD)
+    tickers: Tuple[str, ...] = tuple(TICKERS)
+
+    @property
+    def n_chunks(self) -> int:
+        return -(-self.n_trades // self.chunk_rows)
+
+    def days(self) -> pd.DatetimeIndex:
+        return pd.bdate_range(end=pd.Timestamp(self.end), periods=self.sessions)
+
+
+def _write_frame(df: pd.DataFrame, path: Path, fmt: str) -> None:
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    staging = path.with_name(f".{path.name}.tmp")
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, staging)
+    else:
+        with pa.OSFile(str(staging), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    os.replace(staging, path)
+
+
+def write_chunk(layout: TapeLayout, index: int, root: str, fmt: str) -> List[Dict[str, object]]:
+    """Generate one chunk and write it as one file per session date (``date=YYYY-MM-DD/part-NNNNN``)."""
+    df = generate_trades_chunk(
+        layout.seed, index, layout.n_trades, layout.chunk_rows, layout.days(), list(layout.tickers)
+    )
+    dates = df["timestamp"].dt.normalize().to_numpy()
+    bounds = np.flatnonzero(np.diff(dates.astype(np.int64))) + 1
+    written = []
+    for start, stop in zip(np.r_[0, bounds], np.r_[bounds, len(df)]):
+        day = pd.Timestamp(dates[start]).date().isoformat()
+        path = Path(root) / f"date={day}" / f"part-{index:05d}{FORMATS[fmt]}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_frame(df.iloc[start:stop], path, fmt)
+        written.append({"path": str(path.relative_to(root)), "chunk": index, "rows": int(stop - start)})
+    return written
+
+
+def generate_dataset(
+    out_dir: Union[str, Path],
+    n_trades: int,
+    seed: int = 7,
+    chunk_rows: int = CHUNK_ROWS,
+    sessions: int = 1,
+    end: Optional[str] = None,
+    tickers: Optional[Sequence[str]] = None,
+    fmt: str = "parquet",
+    workers: Optional[int] = None,
+) -> Path:
+    """Write an ``n_trades`` tape under ``out_dir`` and return its path.
+
+    Chunks are generated and written by a pool of ``workers`` processes
+    (default: all cores), so the parent never holds the tape. Output
+    depends only on the layout (seed, rows, chunk size, sessions, end date,
+    tickers), not on the worker count. Files are staged in a sibling
+    directory and renamed into place once the manifest is written.
+    """
+    from .sharding import default_workers
+
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown tape format: {fmt}")
+    unknown = sorted(set(tickers or TICKERS) - set(BASE_PRICE))
+    if unknown:
+        raise ValueError(f"Unknown tickers: {', '.join(unknown)} (known: {', '.join(BASE_PRICE)})")
+    out = Path(out_dir)
+    if out.exists() and any(out.iterdir()):
+        raise FileExistsError(f"{out} is not empty")
+    layout = TapeLayout(
+        seed=seed,
+        n_trades=n_trades,
+        chunk_rows=chunk_rows,
+        sessions=sessions,
+        end=end or pd.Timestamp.now().date().isoformat(),
+        tickers=tuple(tickers or TICKERS),
+    )
+    out.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=out.parent, prefix=f".{out.name}-"))
+    try:
+        workers = workers or default_workers()
+        if workers <= 1 or layout.n_chunks <= 1:
+            parts = [write_chunk(layout, i, str(staging), fmt) for i in range(layout.n_chunks)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+                futures = [pool.submit(write_chunk, layout, i, str(staging), fmt) for i in range(layout.n_chunks)]
+                parts = [future.result() for future in futures]
+        files = sorted((entry for part in parts for entry in part), key=lambda entry: entry["path"])
+        manifest = {"format": DATASET_FORMAT, "file_format": fmt, "layout": asdict(layout), "files": files}
+        (staging / MANIFEST).write_text(json.dumps(manifest, indent=2))
+        if out.exists():
+            out.rmdir()
+        os.rename(staging, out)
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging, ignore_errors=True)
+    return out
+
+
+def read_manifest(root: Union[str, Path]) -> Dict[str, object]:
+    return json.loads((Path(root) / MANIFEST).read_text())
+
+
+def iter_tape(root: Union[str, Path], columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """Partitions of a generated tape in timestamp order, one file at a time."""
+    import pyarrow as pa
+
+    manifest = read_manifest(root)
+    for entry in manifest["files"]:
+        path = Path(root) / entry["path"]
+        if manifest["file_format"] == "parquet":
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(path, columns=columns)
+        else:
+            table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+            table = table.select(columns) if columns else table
+        yield table.to_pandas()
+
+
+def read_tape(root: Union[str, Path], columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """A whole generated tape in memory; prefer ``iter_tape`` beyond a few million rows."""
+    frames = list(iter_tape(root, columns))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
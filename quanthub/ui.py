@@ -4,9 +4,14 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Dict
+from uuid import uuid4
 
 import streamlit as st
 
+from .export import available_formats, export_bytes, export_mime, export_name
+from .perf import RECORDER, begin_run, finish_run, run_totals, timed
+from .replay import SPEEDS, ReplayConfig, scenarios
+
 
 def format_currency(value: float) -> str:
     if abs(value) >= 1e9:
@@ -49,7 +54,12 @@ def sidebar_controls() -> Dict[str, object]:
     except Exception:
         pass
 
-    data_source = st.sidebar.selectbox("Data Source", ["Mock", "Snowflake"], index=0)
+    data_source = st.sidebar.selectbox("Data Source", ["Mock", "Replay", "Snowflake"], index=0)
+    replay = None
+    if data_source == "Replay":
+        scenario = st.sidebar.selectbox("Replay scenario", scenarios(), key="replay_scenario")
+        speed = st.sidebar.select_slider("Replay speed", list(SPEEDS), value="10x", key="replay_speed")
+        replay = ReplayConfig(scenario=scenario, speed=speed)
     live_mode = st.sidebar.toggle("Live Mode", value=False)
     refresh_interval = st.sidebar.slider("Refresh interval (sec)", 5, 60, 15)
 
@@ -65,7 +75,7 @@ def sidebar_controls() -> Dict[str, object]:
     st.sidebar.markdown("---")
     st.sidebar.markdown("**Demo Mode** · Mock data only")
 
-    if live_mode:
+    if live_mode or replay is not None:
         try:
             st.autorefresh(interval=refresh_interval * 1000, key="live_refresh")
         except Exception:
@@ -73,10 +83,12 @@ def sidebar_controls() -> Dict[str, object]:
 
     last_updated = datetime.now().strftime("%b %d, %H:%M:%S")
     st.sidebar.caption(f"Last updated: {last_updated}")
+    _perf_panel()
 
     return {
         "data_source": data_source,
         "live_mode": live_mode,
+        "replay": replay,
         "refresh_interval": refresh_interval,
         "tier": tier,
         "seed": seed,
@@ -84,6 +96,25 @@ def sidebar_controls() -> Dict[str, object]:
     }
 
 
+def _perf_panel() -> None:
+    # Spans of the rerun that just ended are complete now: flush them to the
+    # configured sinks, then start collecting this rerun's spans.
+    previous = st.session_state.get("perf_run")
+    finish_run(previous)
+    session = st.session_state.setdefault("perf_session", uuid4().hex[:8])
+    st.session_state.perf_seq = st.session_state.get("perf_seq", 0) + 1
+    st.session_state.perf_run = begin_run(f"{session}:{st.session_state.perf_seq}")
+
+    if not st.sidebar.toggle("Performance panel", value=False, key="perf_panel"):
+        return
+    totals = run_totals(previous)
+    st.sidebar.caption(f"Last rerun: {totals['ms'].sum():.0f} ms in timed spans")
+    st.sidebar.dataframe(totals, hide_index=True, use_container_width=True)
+    st.sidebar.caption("Rolling p50/p95 (this process, cache misses only)")
+    summary = RECORDER.summary()[["name", "calls", "cache_hits", "p50_ms", "p95_ms", "rows"]]
+    st.sidebar.dataframe(summary.round(2), hide_index=True, use_container_width=True)
+
+
 def render_kpi_cards(kpis: Dict[str, float]) -> None:
     cols = st.columns(5)
     cols[0].metric("Today's Flow", format_currency(kpis["total_flow"]))
@@ -93,6 +124,7 @@ def render_kpi_cards(kpis: Dict[str, float]) -> None:
     cols[4].metric("Unusual Volume", f"{kpis['unusual_count']}")
 
 
+@timed()
 def render_table(df, height: int = 350) -> None:
     try:
         from st_aggrid import AgGrid
@@ -100,3 +132,29 @@ def render_table(df, height: int = 350) -> None:
         AgGrid(df, height=height, theme="streamlit")
     except Exception:
         st.dataframe(df, use_container_width=True, height=height)
+
+
+def render_export(df, file_stem: str, key: str) -> None:
+    formats = available_formats()
+    col_fmt, col_button = st.columns([1, 2])
+    fmt = col_fmt.selectbox("Format", formats, index=0, key=f"{key}_format", label_visibility="collapsed")
+    label = f"Download {fmt}"
+    try:
+        # Serialized only when clicked (and cached per filter state).
+        col_button.download_button(
+            label,
+            data=lambda: export_bytes(df, fmt),
+            file_name=export_name(file_stem, fmt),
+            mime=export_mime(fmt),
+            key=f"{key}_download",
+        )
+    except Exception:
+        # Streamlit versions without deferred downloads: build on request.
+        if col_button.button(f"Prepare {fmt} export", key=f"{key}_prepare"):
+            col_button.download_button(
+                label,
+                data=export_bytes(df, fmt),
+                file_name=export_name(file_stem, fmt),
+                mime=export_mime(fmt),
+                key=f"{key}_download_ready",
+            )
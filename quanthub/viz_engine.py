@@ -2,25 +2,53 @@
 
 from __future__ import annotations
 
+from typing import Optional, Union
+
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+from .analytics import SweepGrid
+from .downsample import downsample
+from .perf import timed
+
+
+PIXEL_BUDGET = 2000
+WEBGL_THRESHOLD = 10_000
+
 
-def flow_timeseries(flow_df: pd.DataFrame) -> go.Figure:
+def _line(x, y, name: str, max_points: Optional[int], method: str, **kwargs) -> go.Scatter:
+    # Downsample to the pixel budget, and switch to WebGL when the raw series is
+    # too large for SVG to stay responsive (hover/zoom then still use GL).
+    raw_points = len(y)
+    x, y = downsample(x, y, max_points, method=method)
+    trace = go.Scattergl if raw_points > WEBGL_THRESHOLD else go.Scatter
+    return trace(x=x, y=y, name=name, **kwargs)
+
+
+@timed()
+def flow_timeseries(flow_df: pd.DataFrame, max_points: Optional[int] = PIXEL_BUDGET, method: str = "lttb") -> go.Figure:
+    zeros = pd.Series(0.0, index=flow_df.index)
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=flow_df["minute"], y=flow_df.get("CALL", 0), name="Calls", mode="lines"))
-    fig.add_trace(go.Scatter(x=flow_df["minute"], y=flow_df.get("PUT", 0), name="Puts", mode="lines"))
-    fig.add_trace(go.Scatter(x=flow_df["minute"], y=flow_df["net_flow"], name="Net Flow", mode="lines"))
+    fig.add_trace(_line(flow_df["minute"], flow_df.get("CALL", zeros), "Calls", max_points, method, mode="lines"))
+    fig.add_trace(_line(flow_df["minute"], flow_df.get("PUT", zeros), "Puts", max_points, method, mode="lines"))
+    fig.add_trace(_line(flow_df["minute"], flow_df["net_flow"], "Net Flow", max_points, method, mode="lines"))
     fig.update_layout(title="Call vs Put Premium Over Time", height=350, hovermode="x unified")
     return fig
 
 
-def price_flow_overlay(flow_df: pd.DataFrame, price_df: pd.DataFrame, ticker: str) -> go.Figure:
+@timed()
+def price_flow_overlay(
+    flow_df: pd.DataFrame,
+    price_df: pd.DataFrame,
+    ticker: str,
+    max_points: Optional[int] = PIXEL_BUDGET,
+    method: str = "lttb",
+) -> go.Figure:
     price = price_df[price_df["ticker"] == ticker]
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=flow_df["minute"], y=flow_df["net_flow"], name="Net Flow", mode="lines"))
-    fig.add_trace(go.Scatter(x=price["timestamp"], y=price["price"], name=f"{ticker} Price", yaxis="y2"))
+    fig.add_trace(_line(flow_df["minute"], flow_df["net_flow"], "Net Flow", max_points, method, mode="lines"))
+    fig.add_trace(_line(price["timestamp"], price["price"], f"{ticker} Price", max_points, method, yaxis="y2"))
     fig.update_layout(
         title="Flow vs Price",
         yaxis=dict(title="Net Flow"),
@@ -31,24 +59,52 @@ def price_flow_overlay(flow_df: pd.DataFrame, price_df: pd.DataFrame, ticker: st
     return fig
 
 
+@timed()
 def top_strikes_bar(top_df: pd.DataFrame) -> go.Figure:
     fig = px.bar(top_df, x="strike", y="premium", title="Top Strikes by Premium")
     fig.update_layout(height=320)
     return fig
 
 
-def sweep_intensity_heatmap(heatmap_df: pd.DataFrame) -> go.Figure:
-    fig = px.imshow(heatmap_df, aspect="auto", color_continuous_scale="inferno")
+@timed()
+def sweep_intensity_heatmap(heatmap: Union[pd.DataFrame, SweepGrid]) -> go.Figure:
+    if isinstance(heatmap, SweepGrid):
+        z, x, y = heatmap.values, heatmap.bins, heatmap.tickers
+    else:
+        z, x, y = heatmap.to_numpy(), heatmap.columns, heatmap.index
+    fig = go.Figure(go.Heatmap(z=z, x=x, y=y, colorscale="inferno"))
     fig.update_layout(title="Sweep Intensity Heatmap", height=320)
     return fig
 
 
+@timed()
 def gex_by_strike(gex_df: pd.DataFrame) -> go.Figure:
     fig = px.bar(gex_df, x="strike", y="gex", title="Gamma Exposure by Strike")
     fig.update_layout(height=350)
     return fig
 
 
+@timed()
+def gex_by_expiry(breakdown_df: pd.DataFrame) -> go.Figure:
+    df = breakdown_df.assign(expiry=pd.to_datetime(breakdown_df["expiry"]).dt.strftime("%Y-%m-%d"))
+    fig = px.bar(df, x="strike", y="gex", color="expiry", title="Gamma Exposure by Strike and Expiry")
+    fig.update_layout(height=350, barmode="relative")
+    return fig
+
+
+@timed()
+def gamma_profile_curve(profile_df: pd.DataFrame, spot: float, flip: float) -> go.Figure:
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=profile_df["spot_level"], y=profile_df["gex"], name="Total GEX", mode="lines"))
+    fig.add_hline(y=0, line_dash="dot", line_color="#6b7280")
+    fig.add_vline(x=spot, line_dash="dash", line_color="#7C3AED", annotation_text="Spot")
+    if pd.notna(flip):
+        fig.add_vline(x=flip, line_dash="dash", line_color="#f59e0b", annotation_text="Flip")
+    fig.update_layout(title="Gamma Profile Across Spot Levels", height=350, hovermode="x unified")
+    return fig
+
+
+@timed()
 def unusual_scores_bar(scores_df: pd.DataFrame) -> go.Figure:
     fig = px.bar(scores_df, x="ticker", y="unusual_score", title="Unusual Activity Score")
     fig.update_layout(height=320)
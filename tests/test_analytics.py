@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quanthub import analytics
+from quanthub.data_mock import TICKERS, generate_trades_df
+from quanthub.tape import compact_trades
+
+
+def _flow_by_groupby(trades_df):
+    # The original full-recompute implementation.
+    df = trades_df.copy()
+    df["minute"] = df["timestamp"].dt.floor("1min")
+    flow = (
+        df.groupby(["minute", "type"], observed=True)["premium"]
+        .sum()
+        .reset_index()
+        .pivot(index="minute", columns="type", values="premium")
+        .fillna(0)
+        .reset_index()
+    )
+    flow.columns.name = None
+    flow["net_flow"] = flow.get("CALL", 0) - flow.get("PUT", 0)
+    return flow[["minute", "CALL", "PUT", "net_flow"]]
+
+
+@pytest.fixture(scope="module")
+def trades():
+    df = generate_trades_df(5, TICKERS, 30_000).reset_index(drop=True)
+    return df.astype({"type": str, "side": str, "ticker": str, "tags": str, "sentiment": str})
+
+
+def _assert_flow_equal(actual, expected):
+    pd.testing.assert_frame_equal(
+        actual.reset_index(drop=True), expected.reset_index(drop=True), check_dtype=False, check_exact=False
+    )
+
+
+def test_accumulated_flow_matches_a_full_recompute(trades):
+    accumulator = analytics.FlowAccumulator(capacity=4)
+    shuffled = trades.sample(frac=1.0, random_state=0)
+    for part in np.array_split(np.arange(len(shuffled)), 9):
+        accumulator.update(shuffled.iloc[part])
+    _assert_flow_equal(accumulator.frame(), _flow_by_groupby(trades))
+    _assert_flow_equal(analytics.flow_by_minute(trades), _flow_by_groupby(trades))
+
+
+def test_nat_timestamps_are_skipped(trades):
+    df = trades.head(500).copy()
+    df.loc[df.index[::7], "timestamp"] = pd.NaT
+    _assert_flow_equal(analytics.flow_by_minute(df), _flow_by_groupby(df))
+
+
+def test_compact_tape_gives_the_same_analytics(trades):
+    compact = compact_trades(trades)
+    assert isinstance(compact["ticker"].dtype, pd.CategoricalDtype)
+    assert compact.memory_usage(deep=True).sum() < trades.memory_usage(deep=True).sum()
+    _assert_flow_equal(analytics.flow_by_minute(compact), _flow_by_groupby(trades))
+    pd.testing.assert_frame_equal(analytics.top_strikes(compact), analytics.top_strikes(trades))
+    assert analytics.kpi_summary(compact) == pytest.approx(analytics.kpi_summary(trades), rel=1e-6)
+
+
+def test_kpi_accumulator_merges_to_the_whole_tape(trades):
+    compact = compact_trades(trades)
+    whole = analytics.kpi_accumulator(compact).summary()
+    merged = analytics.KpiAccumulator()
+    for part in np.array_split(np.arange(len(compact)), 5):
+        merged.merge(analytics.kpi_accumulator(compact.iloc[part]))
+    summary = merged.summary()
+    for key in ("total_flow", "call_put_ratio", "net_delta", "net_gamma"):
+        assert summary[key] == pytest.approx(whole[key], rel=1e-9)
+    # The unusual count comes from a quantile sketch: within its rank error.
+    assert abs(summary["unusual_count"] - whole["unusual_count"]) <= 0.02 * len(compact)
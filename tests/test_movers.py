@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from quanthub.data_mock import TICKERS, generate_trades_df
+from quanthub.movers import MoversTracker
+
+
+@pytest.fixture(scope="module")
+def trades():
+    return generate_trades_df(11, TICKERS, 20_000)
+
+
+def _batches(df, n):
+    return [df.iloc[: stop] for stop in np.linspace(0, len(df), n + 1, dtype=int)[1:]]
+
+
+def test_incremental_top_matches_a_full_sort(trades):
+    tracker = MoversTracker(k=10)
+    for tape in _batches(trades, 7):
+        tracker.update(tape)
+    expected = trades.sort_values("premium", ascending=False).head(10)
+    assert tracker.top()["premium"].tolist() == expected["premium"].tolist()
+
+    ticker = str(trades["ticker"].iloc[0])
+    per_ticker = trades[trades["ticker"] == ticker].sort_values("premium", ascending=False).head(5)
+    assert tracker.top(5, ticker=ticker)["premium"].tolist() == per_ticker["premium"].tolist()
+
+
+def test_window_matches_a_full_sort_of_the_last_minutes(trades):
+    tracker = MoversTracker(k=8)
+    tracker.update(trades)
+    minutes = trades["timestamp"].dt.floor("1min")
+    recent = trades[minutes >= minutes.max() - np.timedelta64(14, "m")]
+    expected = recent.sort_values("premium", ascending=False).head(8)
+    assert tracker.top(minutes=15)["premium"].tolist() == expected["premium"].tolist()
+
+
+def test_rereading_a_tape_does_not_double_count(trades):
+    tracker = MoversTracker(k=5)
+    assert tracker.update(trades, version="v1") == len(trades)
+    assert tracker.update(trades, version="v1") == 0
+    assert tracker.update(trades, version="v2") == 0
+
+
+def test_asking_for_more_than_k_raises(trades):
+    tracker = MoversTracker(k=4)
+    tracker.update(trades)
+    with pytest.raises(ValueError):
+        tracker.top(5)
@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+
+from quanthub import analytics, sharding
+from quanthub.data_mock import TICKERS, generate_chain_df, generate_trades_df
+
+
+@pytest.fixture(scope="module")
+def pooled():
+    executor = sharding.ShardedExecutor(workers=2, min_rows=0)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture(scope="module")
+def serial():
+    return sharding.ShardedExecutor(workers=1)
+
+
+@pytest.fixture(scope="module")
+def trades():
+    return generate_trades_df(9, TICKERS, 20_000)
+
+
+@pytest.fixture(scope="module")
+def chain():
+    return generate_chain_df(9, TICKERS)
+
+
+def _sorted(df, *by):
+    return df.sort_values(list(by), kind="stable").reset_index(drop=True)
+
+
+def test_gex_book_matches_serial(chain, pooled, serial):
+    expected = sharding.gex_book(chain, serial)
+    actual = sharding.gex_book(chain, pooled)
+    assert pooled.parallel(len(chain) // sharding.GEX_SHARD_FACTOR)
+    pd.testing.assert_frame_equal(_sorted(actual.summary, "ticker"), _sorted(expected.summary, "ticker"))
+    pd.testing.assert_frame_equal(
+        _sorted(actual.by_strike, "ticker", "strike"), _sorted(expected.by_strike, "ticker", "strike")
+    )
+    pd.testing.assert_frame_equal(
+        _sorted(actual.by_expiry_strike, "ticker", "expiry", "strike"),
+        _sorted(expected.by_expiry_strike, "ticker", "expiry", "strike"),
+    )
+
+
+def test_top_prints_match_serial(trades, pooled, serial):
+    expected = sharding.top_prints(trades, n=50, executor=serial)
+    actual = sharding.top_prints(trades, n=50, executor=pooled)
+    pd.testing.assert_frame_equal(actual, expected)
+    pd.testing.assert_frame_equal(expected, analytics.top_prints(trades, n=50))
+
+
+def test_flows_match_serial(trades, pooled, serial):
+    expected = sharding.flow_by_ticker(trades, serial)
+    actual = sharding.flow_by_ticker(trades, pooled)
+    assert list(actual) == list(expected)
+    for ticker in expected:
+        pd.testing.assert_frame_equal(actual[ticker], expected[ticker])
+    pd.testing.assert_frame_equal(
+        sharding.flow_by_minute(trades, pooled), analytics.flow_by_minute(trades), check_exact=False
+    )
+
+
+def test_kpis_match_serial(trades, pooled, serial):
+    expected = sharding.kpi_summary(trades, serial)
+    assert sharding.kpi_summary(trades, pooled) == pytest.approx(expected, rel=1e-9)
+    whole = analytics.kpi_summary(trades)
+    for key in ("total_flow", "call_put_ratio", "net_delta", "net_gamma"):
+        assert expected[key] == pytest.approx(whole[key], rel=1e-9)
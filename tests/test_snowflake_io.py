@@ -0,0 +1,82 @@
+import sqlite3
+
+import pytest
+
+from quanthub.snowflake_io import ConnectionPool, SnowflakeSource
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "sf.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE TRADES (timestamp TEXT, ticker TEXT, premium REAL)")
+    conn.execute("CREATE TABLE PRICES (timestamp TEXT, ticker TEXT, price REAL)")
+    conn.execute("CREATE TABLE CHAIN (ticker TEXT, strike REAL)")
+    conn.commit()
+    yield path, conn
+    conn.close()
+
+
+def _source(path):
+    return SnowflakeSource(ConnectionPool(lambda: sqlite3.connect(path, check_same_thread=False)), paramstyle="qmark")
+
+
+def _insert(conn, rows):
+    conn.executemany("INSERT INTO TRADES VALUES (?, ?, ?)", rows)
+    conn.commit()
+
+
+def test_rows_tied_with_the_watermark_are_pulled_once(db):
+    path, conn = db
+    source = _source(path)
+    _insert(conn, [("2026-01-02 10:00:00", "SPY", 1.0), ("2026-01-02 10:01:00", "QQQ", 2.0)])
+    assert len(source.fetch_bundle()["trades_df"]) == 2
+
+    # Late inserts at the watermark, including an exact duplicate of a pulled row.
+    _insert(conn, [("2026-01-02 10:01:00", "SPY", 3.0), ("2026-01-02 10:01:00", "QQQ", 2.0)])
+    bundle = source.fetch_bundle()
+    assert bundle["new_rows"] == 2
+    assert len(bundle["trades_df"]) == 4
+
+    assert source.fetch_bundle()["new_rows"] == 0
+    _insert(conn, [("2026-01-02 10:01:00", "AAPL", 4.0), ("2026-01-02 10:02:00", "SPY", 5.0)])
+    assert source.fetch_bundle()["new_rows"] == 2
+    assert sorted(source.trades_df["premium"]) == [1.0, 2.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_inserts_spread_over_refreshes_deliver_every_row(db):
+    path, conn = db
+    source = _source(path)
+    for round_ in range(700):
+        # Several refreshes land on each timestamp, so most rows tie with the watermark.
+        _insert(conn, [(f"2026-01-02 10:{round_ // 35:02d}:00", "SPY", float(round_ % 7))] * 2)
+        source.fetch_bundle()
+    assert len(source.trades_df) == 1400
+
+
+def test_failed_refresh_keeps_the_watermark(db):
+    path, conn = db
+    conn.execute("DROP TABLE CHAIN")
+    _insert(conn, [("2026-01-02 10:00:00", "SPY", 1.0)])
+    source = _source(path)
+    with pytest.raises(sqlite3.OperationalError):
+        source.fetch_bundle()
+    assert source.watermarks["trades"] is None and source.trades_df.empty
+
+    conn.execute("CREATE TABLE CHAIN (ticker TEXT, strike REAL)")
+    conn.commit()
+    assert len(source.fetch_bundle()["trades_df"]) == 1
+
+
+def test_version_changes_with_prices_and_chain(db):
+    path, conn = db
+    source = _source(path)
+    _insert(conn, [("2026-01-02 10:00:00", "SPY", 1.0)])
+    first = source.fetch_bundle()["source_version"]
+    conn.execute("INSERT INTO CHAIN VALUES ('SPY', 500)")
+    conn.commit()
+    second = source.fetch_bundle()["source_version"]
+    conn.execute("INSERT INTO PRICES VALUES ('2026-01-02 10:00:00', 'SPY', 500)")
+    conn.commit()
+    third = source.fetch_bundle()["source_version"]
+    assert len({first, second, third}) == 3
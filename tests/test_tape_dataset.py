@@ -0,0 +1,22 @@
+import pandas as pd
+import pytest
+
+from quanthub.tape_dataset import generate_dataset, read_manifest, read_tape
+
+LAYOUT = dict(seed=3, chunk_rows=10_000, sessions=2, end="2026-10-16", fmt="arrow")
+
+
+def test_worker_count_does_not_change_the_tape(tmp_path):
+    serial = generate_dataset(tmp_path / "serial", 30_000, workers=1, **LAYOUT)
+    pooled = generate_dataset(tmp_path / "pooled", 30_000, workers=2, **LAYOUT)
+    assert read_manifest(serial) == read_manifest(pooled)
+    tape = read_tape(serial)
+    assert len(tape) == 30_000
+    assert tape["timestamp"].is_monotonic_increasing
+    pd.testing.assert_frame_equal(tape, read_tape(pooled))
+
+
+def test_unknown_tickers_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="ZZZZ"):
+        generate_dataset(tmp_path / "tape", 1_000, tickers=["SPY", "ZZZZ"], **LAYOUT)
+    assert not any(tmp_path.iterdir())